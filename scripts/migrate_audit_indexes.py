@@ -0,0 +1,62 @@
+"""
+Migration script to replace single-column audit log indexes with composite
+(filter, timestamp, log_id) indexes matching the audit API's sort order.
+"""
+
+import sqlite3
+from pathlib import Path
+
+DB_PATH = Path("data/processed/spendsense.db")
+
+NEW_INDEXES = {
+    "idx_audit_timestamp_log": "(timestamp, log_id)",
+    "idx_audit_event_type_ts": "(event_type, timestamp, log_id)",
+    "idx_audit_user_ts": "(user_id, timestamp, log_id)",
+    "idx_audit_operator_ts": "(operator_id, timestamp, log_id)",
+    "idx_audit_user_event_ts": "(user_id, event_type, timestamp)",
+}
+
+# Superseded: each is a prefix of one of the composite indexes above
+OLD_INDEXES = [
+    "idx_audit_timestamp",
+    "idx_audit_event_type",
+    "idx_audit_user",
+    "idx_audit_operator",
+]
+
+
+def migrate():
+    """Create composite audit log indexes and drop the ones they supersede."""
+    if not DB_PATH.exists():
+        print(f"Error: Database not found at {DB_PATH}")
+        return
+
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+
+    try:
+        # Check if table exists
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='comprehensive_audit_log'")
+        if not cursor.fetchone():
+            print("comprehensive_audit_log table doesn't exist yet - no migration needed")
+            return
+
+        for name, columns in NEW_INDEXES.items():
+            print(f"Creating index {name}...")
+            cursor.execute(f"CREATE INDEX IF NOT EXISTS {name} ON comprehensive_audit_log {columns}")
+
+        for name in OLD_INDEXES:
+            cursor.execute(f"DROP INDEX IF EXISTS {name}")
+
+        cursor.execute("ANALYZE comprehensive_audit_log")
+        conn.commit()
+        print("Migration successful!")
+
+    except Exception as e:
+        print(f"Migration failed: {e}")
+        conn.rollback()
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,56 @@
+"""
+Migration script to replace the (user_id, time_window) persona assignment
+index with (user_id, time_window, assigned_at DESC), matching the newest-first
+order every persona assignment lookup uses.
+"""
+
+import sqlite3
+from pathlib import Path
+
+DB_PATH = Path("data/processed/spendsense.db")
+
+NEW_INDEXES = {
+    "idx_assignments_user_window_assigned": "(user_id, time_window, assigned_at DESC)",
+}
+
+# Superseded: a prefix of the composite index above
+OLD_INDEXES = [
+    "idx_assignments_user_window",
+]
+
+
+def migrate():
+    """Create the ordered persona assignment index and drop the one it supersedes."""
+    if not DB_PATH.exists():
+        print(f"Error: Database not found at {DB_PATH}")
+        return
+
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+
+    try:
+        # Check if table exists
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='persona_assignments'")
+        if not cursor.fetchone():
+            print("persona_assignments table doesn't exist yet - no migration needed")
+            return
+
+        for name, columns in NEW_INDEXES.items():
+            print(f"Creating index {name}...")
+            cursor.execute(f"CREATE INDEX IF NOT EXISTS {name} ON persona_assignments {columns}")
+
+        for name in OLD_INDEXES:
+            cursor.execute(f"DROP INDEX IF EXISTS {name}")
+
+        cursor.execute("ANALYZE persona_assignments")
+        conn.commit()
+        print("Migration successful!")
+
+    except Exception as e:
+        print(f"Migration failed: {e}")
+        conn.rollback()
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,47 @@
+"""
+Migration script to add the (consent_status, user_id) index used by the
+operator consent user listing's keyset pagination.
+"""
+
+import sqlite3
+from pathlib import Path
+
+DB_PATH = Path("data/processed/spendsense.db")
+
+NEW_INDEXES = {
+    "idx_users_consent_user": "(consent_status, user_id)",
+}
+
+
+def migrate():
+    """Create the users table consent listing index."""
+    if not DB_PATH.exists():
+        print(f"Error: Database not found at {DB_PATH}")
+        return
+
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+
+    try:
+        # Check if table exists
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='users'")
+        if not cursor.fetchone():
+            print("users table doesn't exist yet - no migration needed")
+            return
+
+        for name, columns in NEW_INDEXES.items():
+            print(f"Creating index {name}...")
+            cursor.execute(f"CREATE INDEX IF NOT EXISTS {name} ON users {columns}")
+
+        cursor.execute("ANALYZE users")
+        conn.commit()
+        print("Migration successful!")
+
+    except Exception as e:
+        print(f"Migration failed: {e}")
+        conn.rollback()
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    migrate()
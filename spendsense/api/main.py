@@ -7,15 +7,30 @@ a web UI for visual testing and exploration.
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
+import logging
+import sqlite3
+from collections import Counter, defaultdict
+from contextlib import asynccontextmanager
+from dataclasses import asdict
+from datetime import date
 from pathlib import Path
 from typing import Optional
 
+from anyio import to_thread
+from cachetools import TTLCache
 from fastapi import FastAPI, HTTPException, Query, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse, JSONResponse
-from pydantic import BaseModel, Field
+from starlette.concurrency import run_in_threadpool
+from pydantic import BaseModel, Field, field_validator
+from sqlalchemy import func, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import sessionmaker
 
 from spendsense.generators import (
     ProfileGenerator,
@@ -25,6 +40,22 @@ from spendsense.generators import (
     LiabilityGenerator,
     generate_synthetic_liabilities,
 )
+from spendsense.features import (
+    BehavioralSummaryGenerator,
+    SubscriptionDetector,
+    SavingsDetector,
+    CreditDetector,
+    IncomeDetector
+)
+from spendsense.config.database import get_engine
+from spendsense.guardrails.consent import ConsentService, ConsentStatus, ConsentNotGrantedError, ConsentResult
+from spendsense.ingestion.database_writer import User, Account
+from spendsense.personas.assigner import PersonaAssigner
+from spendsense.personas.definitions import PERSONA_DESCRIPTIONS, PersonaType
+from spendsense.recommendations.content_library import ContentLibrary
+from spendsense.recommendations.partner_offer_library import PartnerOfferLibrary
+from spendsense.recommendations.assembler import RecommendationAssembler
+from spendsense.recommendations.storage import RecommendationStorage
 from spendsense.api.user_auth import router as user_auth_router
 from spendsense.api.operator_auth import router as operator_auth_router
 from spendsense.api.operator_signals import router as operator_signals_router
@@ -32,10 +63,15 @@ from spendsense.api.operator_personas import router as operator_personas_router
 from spendsense.api.operator_review import router as operator_review_router
 from spendsense.api.operator_audit import router as operator_audit_router
 from spendsense.api.operator_consent import router as operator_consent_router
-from spendsense.api.operator_metrics import router as operator_metrics_router  # Epic 7 Evaluation Metrics
+from spendsense.api.operator_metrics import router as operator_metrics_router, metrics_loader  # Epic 7 Evaluation Metrics
+from spendsense.api.responses import ORJSONResponse
 from spendsense.auth.rbac import require_role
 from spendsense.auth.tokens import TokenData
 
+logger = logging.getLogger(__name__)
+
+# Worker threads available to run_in_threadpool (blocking DB/file work from async handlers)
+THREADPOOL_SIZE = 64
 
 # API Models
 class GenerateProfilesRequest(BaseModel):
@@ -66,11 +102,24 @@ class StatsResponse(BaseModel):
     validation: dict
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup/shutdown hooks."""
+    to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    app.state.db_ready = DB_PATH.exists()
+    # Evaluation metrics stay cached until their files change (TTL without watchdog)
+    metrics_loader.start_watching()
+    yield
+    metrics_loader.stop_watching()
+
+
 # Create FastAPI app
 app = FastAPI(
     title="SpendSense API",
     description="Backend API for SpendSense synthetic data generation and testing",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
     swagger_ui_parameters={
         "persistAuthorization": True  # Keep authorization between page refreshes
     }
@@ -94,6 +143,9 @@ app.add_middleware(
     allow_headers=["*"],  # Allow all headers
 )
 
+# Compress large payloads (recommendation sets); small signal responses pass through
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Configure OpenAPI security scheme for Bearer token authentication
 # This adds the "Authorize" button to Swagger UI
 from fastapi.openapi.utils import get_openapi
@@ -158,6 +210,42 @@ DEFAULT_PROFILES_FILE = USERS_DIR / "profiles.json"
 DEFAULT_TRANSACTIONS_FILE = TRANSACTIONS_DIR / "transactions.json"
 DEFAULT_LIABILITIES_FILE = LIABILITIES_DIR / "liabilities.json"
 
+# Recommendation content and partner offer catalogs
+CONFIG_DIR = Path(__file__).parent.parent / "config"
+RECOMMENDATIONS_YAML = CONFIG_DIR / "recommendations.yaml"
+PARTNER_OFFERS_YAML = CONFIG_DIR / "partner_offers.yaml"
+
+# Path to database
+DB_PATH = Path(__file__).parent.parent.parent / "data" / "processed" / "spendsense.db"
+
+# Shared engine and session factory: the same pooled engine (and SQLITE_PRAGMAS
+# tuning) the operator routers use for this database file
+ENGINE = get_engine(DB_PATH)
+SessionLocal = sessionmaker(bind=ENGINE)
+
+
+def _db_available() -> bool:
+    """
+    Check whether the SQLite database file exists.
+
+    A positive result is cached on app.state so steady-state requests skip
+    the stat() call; while the database is missing it is rechecked each time.
+    Handlers clear the cached result on database errors (_mark_db_unavailable).
+    """
+    if not getattr(app.state, "db_ready", False):
+        app.state.db_ready = DB_PATH.exists()
+    return app.state.db_ready
+
+
+# Failures that suggest the database was removed or replaced (e.g. during
+# re-ingestion) rather than a bug in the handler
+DB_ERRORS = (sqlite3.OperationalError, SQLAlchemyError)
+
+
+def _mark_db_unavailable() -> None:
+    """Forget the cached availability check so the next request rechecks the file."""
+    app.state.db_ready = False
+
 
 # Ensure directories exist
 STATIC_DIR.mkdir(exist_ok=True)
@@ -249,16 +337,9 @@ async def list_profiles(
     Reads from database if available, falls back to JSON file.
     """
     # Try database first (preferred)
-    if DB_PATH.exists():
-        from sqlalchemy import create_engine
-        from sqlalchemy.orm import sessionmaker
-        from spendsense.ingestion.database_writer import User, Account
-
+    if _db_available():
         try:
-            engine = create_engine(f'sqlite:///{DB_PATH}')
-            Session = sessionmaker(bind=engine)
-
-            with Session() as session:
+            with SessionLocal() as session:
                 # Query users
                 query = session.query(User)
 
@@ -300,10 +381,11 @@ async def list_profiles(
                     total=total,
                     profiles=profiles
                 )
+        except DB_ERRORS as e:
+            _mark_db_unavailable()
+            logger.warning(f"Database read failed, falling back to JSON: {e}")
         except Exception as e:
             # If database read fails, fall through to JSON file
-            import logging
-            logger = logging.getLogger(__name__)
             logger.warning(f"Database read failed, falling back to JSON: {e}")
 
     # Fallback to JSON file
@@ -339,16 +421,9 @@ async def get_profile(user_id: str):
     Reads from database if available, falls back to JSON file.
     """
     # Try database first (preferred)
-    if DB_PATH.exists():
-        from sqlalchemy import create_engine
-        from sqlalchemy.orm import sessionmaker
-        from spendsense.ingestion.database_writer import User, Account
-
+    if _db_available():
         try:
-            engine = create_engine(f'sqlite:///{DB_PATH}')
-            Session = sessionmaker(bind=engine)
-
-            with Session() as session:
+            with SessionLocal() as session:
                 # Query user
                 user = session.query(User).filter(User.user_id == user_id).first()
 
@@ -377,10 +452,11 @@ async def get_profile(user_id: str):
                 }
         except HTTPException:
             raise
+        except DB_ERRORS as e:
+            _mark_db_unavailable()
+            logger.warning(f"Database read failed, falling back to JSON: {e}")
         except Exception as e:
             # If database read fails, fall through to JSON file
-            import logging
-            logger = logging.getLogger(__name__)
             logger.warning(f"Database read failed for user {user_id}, falling back to JSON: {e}")
 
     # Fallback to JSON file
@@ -407,16 +483,9 @@ async def get_stats():
     Reads from database if available, falls back to JSON file.
     """
     # Try database first (preferred)
-    if DB_PATH.exists():
-        from sqlalchemy import create_engine, func
-        from sqlalchemy.orm import sessionmaker
-        from spendsense.ingestion.database_writer import User
-
+    if _db_available():
         try:
-            engine = create_engine(f'sqlite:///{DB_PATH}')
-            Session = sessionmaker(bind=engine)
-
-            with Session() as session:
+            with SessionLocal() as session:
                 # Get total count
                 total = session.query(User).count()
 
@@ -468,10 +537,11 @@ async def get_stats():
                 )
         except HTTPException:
             raise
+        except DB_ERRORS as e:
+            _mark_db_unavailable()
+            logger.warning(f"Database read failed, falling back to JSON: {e}")
         except Exception as e:
             # If database read fails, fall through to JSON file
-            import logging
-            logger = logging.getLogger(__name__)
             logger.warning(f"Database read failed, falling back to JSON: {e}")
 
     # Fallback to JSON file
@@ -482,8 +552,6 @@ async def get_stats():
         profiles = json.load(f)
 
     # Calculate statistics
-    from collections import Counter
-
     persona_counts = Counter(p["persona"] for p in profiles)
     persona_distribution = dict(persona_counts)
 
@@ -525,8 +593,6 @@ async def get_personas():
 
     Returns descriptions and characteristics for each persona type.
     """
-    from spendsense.personas.definitions import PERSONA_DESCRIPTIONS, PersonaType
-
     personas = {}
     for persona_type in PersonaType:
         personas[persona_type.value] = {
@@ -675,8 +741,6 @@ async def get_transaction_stats():
         profiles = json.load(f)
 
     # Calculate stats
-    from collections import defaultdict, Counter
-
     total_txns = sum(len(txns) for txns in transactions.values())
 
     # Date range
@@ -846,23 +910,49 @@ async def get_user_liabilities(user_id: str):
 
 # ===== Behavioral Signal Endpoints (Epic 2) =====
 
-from datetime import date
-from spendsense.features import (
-    BehavioralSummaryGenerator,
-    SubscriptionDetector,
-    SavingsDetector,
-    CreditDetector,
-    IncomeDetector
-)
+# Short-lived cache of computed signal/profile payloads, keyed by
+# (kind, user_id, ...). Only touched from the event loop, so no lock needed.
+SIGNALS_CACHE_TTL_SECONDS = 60
+_signals_cache: TTLCache = TTLCache(maxsize=4096, ttl=SIGNALS_CACHE_TTL_SECONDS)
+
+
+def _invalidate_signals_cache(user_id: str) -> int:
+    """Drop every cached signal/profile entry for a user. Returns the number removed."""
+    stale_keys = [key for key in list(_signals_cache.keys()) if key[1] == user_id]
+    for key in stale_keys:
+        _signals_cache.pop(key, None)
+    return len(stale_keys)
+
+
+class ReferenceDateParams(BaseModel):
+    """Query parameters shared by signal endpoints; the date is parsed by Pydantic."""
+    reference_date: Optional[date] = Field(
+        default=None,
+        validate_default=True,
+        description="Reference date (YYYY-MM-DD), defaults to today"
+    )
+
+    @field_validator("reference_date")
+    @classmethod
+    def default_to_today(cls, v: Optional[date]) -> date:
+        """Resolve an omitted reference date to today."""
+        return v or date.today()
+
+
+class SignalParams(ReferenceDateParams):
+    """Query parameters for single-detector signal endpoints."""
+    window_days: int = Field(default=30, description="Time window in days (30 or 180)")
 
-# Path to database
-DB_PATH = Path(__file__).parent.parent.parent / "data" / "processed" / "spendsense.db"
+
+class IncomeSignalParams(SignalParams):
+    """Income detection defaults to the longer window."""
+    window_days: int = Field(default=180, description="Time window in days (30 or 180)")
 
 
 @app.get("/api/signals/{user_id}")
 async def get_behavioral_summary(
     user_id: str,
-    reference_date: Optional[str] = Query(default=None, description="Reference date (YYYY-MM-DD), defaults to today")
+    params: ReferenceDateParams = Depends()
 ):
     """
     Get comprehensive behavioral summary for a user.
@@ -870,28 +960,34 @@ async def get_behavioral_summary(
     Returns all detected signals: subscriptions, savings, credit, and income
     patterns for both 30-day and 180-day windows.
     """
-    if not DB_PATH.exists():
+    if not _db_available():
         raise HTTPException(status_code=503, detail="Database not available")
 
     try:
-        # Parse reference date or use today
-        if reference_date:
-            ref_date = date.fromisoformat(reference_date)
-        else:
-            ref_date = date.today()
+        ref_date = params.reference_date
+
+        cache_key = ("summary", user_id, ref_date)
+        cached = _signals_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         # Generate behavioral summary
         generator = BehavioralSummaryGenerator(str(DB_PATH))
-        summary = generator.generate_summary(
+        summary = await run_in_threadpool(
+            generator.generate_summary,
             user_id=user_id,
             reference_date=ref_date
         )
 
         # Convert to dict for JSON response
-        return summary.to_dict()
+        result = _signals_cache[cache_key] = summary.to_dict()
+        return result
 
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    except DB_ERRORS:
+        _mark_db_unavailable()
+        raise HTTPException(status_code=503, detail="Database not available")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generating summary: {str(e)}")
 
@@ -899,31 +995,39 @@ async def get_behavioral_summary(
 @app.get("/api/signals/{user_id}/subscriptions")
 async def get_subscription_signals(
     user_id: str,
-    window_days: int = Query(default=30, description="Time window in days (30 or 180)"),
-    reference_date: Optional[str] = Query(default=None, description="Reference date (YYYY-MM-DD)")
+    params: SignalParams = Depends()
 ):
     """
     Get subscription pattern detection results for a user.
     """
-    if not DB_PATH.exists():
+    if not _db_available():
         raise HTTPException(status_code=503, detail="Database not available")
 
     try:
-        ref_date = date.fromisoformat(reference_date) if reference_date else date.today()
+        ref_date = params.reference_date
+        window_days = params.window_days
+
+        cache_key = ("subscriptions", user_id, window_days, ref_date)
+        cached = _signals_cache.get(cache_key)
+        if cached is not None:
+            return ORJSONResponse(content=cached)
 
         detector = SubscriptionDetector(str(DB_PATH))
-        metrics = detector.detect_subscriptions(
+        metrics = await run_in_threadpool(
+            detector.detect_subscriptions,
             user_id=user_id,
             reference_date=ref_date,
             window_days=window_days
         )
 
-        # Convert to dict
-        from dataclasses import asdict
-        return asdict(metrics)
+        result = _signals_cache[cache_key] = asdict(metrics)
+        return ORJSONResponse(content=result)
 
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    except DB_ERRORS:
+        _mark_db_unavailable()
+        raise HTTPException(status_code=503, detail="Database not available")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -931,33 +1035,39 @@ async def get_subscription_signals(
 @app.get("/api/signals/{user_id}/savings")
 async def get_savings_signals(
     user_id: str,
-    window_days: int = Query(default=30, description="Time window in days (30 or 180)"),
-    reference_date: Optional[str] = Query(default=None, description="Reference date (YYYY-MM-DD)")
+    params: SignalParams = Depends()
 ):
     """
     Get savings behavior detection results for a user.
     """
-    if not DB_PATH.exists():
+    if not _db_available():
         raise HTTPException(status_code=503, detail="Database not available")
 
     try:
-        ref_date = date.fromisoformat(reference_date) if reference_date else date.today()
+        ref_date = params.reference_date
+        window_days = params.window_days
+
+        cache_key = ("savings", user_id, window_days, ref_date)
+        cached = _signals_cache.get(cache_key)
+        if cached is not None:
+            return ORJSONResponse(content=cached)
 
         detector = SavingsDetector(str(DB_PATH))
-        metrics = detector.detect_savings_patterns(
+        metrics = await run_in_threadpool(
+            detector.detect_savings_patterns,
             user_id=user_id,
             reference_date=ref_date,
             window_days=window_days
         )
 
-        from dataclasses import asdict
-        result = asdict(metrics)
-        # Convert date to string
-        result['reference_date'] = result['reference_date'].isoformat()
-        return result
+        result = _signals_cache[cache_key] = asdict(metrics)
+        return ORJSONResponse(content=result)
 
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    except DB_ERRORS:
+        _mark_db_unavailable()
+        raise HTTPException(status_code=503, detail="Database not available")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -965,33 +1075,39 @@ async def get_savings_signals(
 @app.get("/api/signals/{user_id}/credit")
 async def get_credit_signals(
     user_id: str,
-    window_days: int = Query(default=30, description="Time window in days (30 or 180)"),
-    reference_date: Optional[str] = Query(default=None, description="Reference date (YYYY-MM-DD)")
+    params: SignalParams = Depends()
 ):
     """
     Get credit utilization and debt signals for a user.
     """
-    if not DB_PATH.exists():
+    if not _db_available():
         raise HTTPException(status_code=503, detail="Database not available")
 
     try:
-        ref_date = date.fromisoformat(reference_date) if reference_date else date.today()
+        ref_date = params.reference_date
+        window_days = params.window_days
+
+        cache_key = ("credit", user_id, window_days, ref_date)
+        cached = _signals_cache.get(cache_key)
+        if cached is not None:
+            return ORJSONResponse(content=cached)
 
         detector = CreditDetector(str(DB_PATH))
-        metrics = detector.detect_credit_patterns(
+        metrics = await run_in_threadpool(
+            detector.detect_credit_patterns,
             user_id=user_id,
             reference_date=ref_date,
             window_days=window_days
         )
 
-        from dataclasses import asdict
-        result = asdict(metrics)
-        # Convert date to string
-        result['reference_date'] = result['reference_date'].isoformat()
-        return result
+        result = _signals_cache[cache_key] = asdict(metrics)
+        return ORJSONResponse(content=result)
 
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    except DB_ERRORS:
+        _mark_db_unavailable()
+        raise HTTPException(status_code=503, detail="Database not available")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -999,38 +1115,52 @@ async def get_credit_signals(
 @app.get("/api/signals/{user_id}/income")
 async def get_income_signals(
     user_id: str,
-    window_days: int = Query(default=180, description="Time window in days (30 or 180)"),
-    reference_date: Optional[str] = Query(default=None, description="Reference date (YYYY-MM-DD)")
+    params: IncomeSignalParams = Depends()
 ):
     """
     Get income stability detection results for a user.
     """
-    if not DB_PATH.exists():
+    if not _db_available():
         raise HTTPException(status_code=503, detail="Database not available")
 
     try:
-        ref_date = date.fromisoformat(reference_date) if reference_date else date.today()
+        ref_date = params.reference_date
+        window_days = params.window_days
+
+        cache_key = ("income", user_id, window_days, ref_date)
+        cached = _signals_cache.get(cache_key)
+        if cached is not None:
+            return ORJSONResponse(content=cached)
 
         detector = IncomeDetector(str(DB_PATH))
-        metrics = detector.detect_income_patterns(
+        metrics = await run_in_threadpool(
+            detector.detect_income_patterns,
             user_id=user_id,
             reference_date=ref_date,
             window_days=window_days
         )
 
-        from dataclasses import asdict
-        result = asdict(metrics)
-        # Convert dates to strings
-        result['reference_date'] = result['reference_date'].isoformat()
-        result['payroll_dates'] = [d.isoformat() for d in result['payroll_dates']]
-        return result
+        result = _signals_cache[cache_key] = asdict(metrics)
+        return ORJSONResponse(content=result)
 
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    except DB_ERRORS:
+        _mark_db_unavailable()
+        raise HTTPException(status_code=503, detail="Database not available")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _user_exists(user_id: str) -> bool:
+    """Check whether a user row exists (blocking; run via threadpool)."""
+    with SessionLocal() as session:
+        exists_row = session.execute(
+            select(User.user_id).where(User.user_id == user_id).limit(1)
+        ).scalar()
+        return exists_row is not None
+
+
 @app.get("/api/profile/{user_id}")
 async def get_persona_profile(
     user_id: str,
@@ -1049,49 +1179,44 @@ async def get_persona_profile(
     Returns:
         Persona assignment(s) with audit trail, or 404 if user not found
     """
-    if not DB_PATH.exists():
+    if not _db_available():
         raise HTTPException(status_code=503, detail="Database not available")
 
     try:
-        from spendsense.personas.assigner import PersonaAssigner
-
-        assigner = PersonaAssigner(str(DB_PATH))
-
-        # Check if user exists
-        from spendsense.ingestion.database_writer import User
-        from sqlalchemy import create_engine
-        from sqlalchemy.orm import sessionmaker
-
-        engine = create_engine(f'sqlite:///{DB_PATH}')
-        Session = sessionmaker(bind=engine)
-
-        with Session() as session:
-            user = session.query(User).filter(User.user_id == user_id).first()
-            if user is None:
-                raise HTTPException(status_code=404, detail=f"User {user_id} not found")
+        cache_key = ("profile", user_id, time_window)
+        cached = _signals_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
-        # Get assignments
         if time_window and time_window not in ("30d", "180d"):
             raise HTTPException(status_code=400, detail="time_window must be '30d' or '180d'")
 
+        assigner = PersonaAssigner(str(DB_PATH))
+
+        # Get assignments
         if time_window:
-            assignment = assigner.get_assignment(user_id, time_window)
-            return {
-                "user_id": user_id,
-                "assignments": {
-                    time_window: assignment
-                }
-            }
+            assignment = await run_in_threadpool(assigner.get_assignment, user_id, time_window)
+            assignments = {time_window: assignment}
         else:
             # Get both windows
-            assignments = assigner.get_assignments_both_windows(user_id)
-            return {
-                "user_id": user_id,
-                "assignments": assignments
-            }
+            assignments = await run_in_threadpool(assigner.get_assignments_both_windows, user_id)
+
+        # A stored assignment implies the user exists; only query users when none was found
+        if not any(assignments.values()) and not await run_in_threadpool(_user_exists, user_id):
+            raise HTTPException(status_code=404, detail=f"User {user_id} not found")
+
+        result = {
+            "user_id": user_id,
+            "assignments": assignments
+        }
+        _signals_cache[cache_key] = result
+        return result
 
     except HTTPException:
         raise
+    except DB_ERRORS:
+        _mark_db_unavailable()
+        raise HTTPException(status_code=503, detail="Database not available")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error retrieving persona profile: {str(e)}")
 
@@ -1109,11 +1234,117 @@ async def list_recommendations():
     }
 
 
+@app.post("/api/cache/invalidate/{user_id}")
+async def invalidate_user_cache(
+    user_id: str,
+    current_operator: TokenData = Depends(require_role("admin"))
+):
+    """
+    Invalidate cached signal and persona profile payloads for a user.
+
+    Call after ingesting new data for a user so the next request recomputes.
+    **Requires admin role.**
+    """
+    return {
+        "user_id": user_id,
+        "invalidated": _invalidate_signals_cache(user_id)
+    }
+
+
+# Annualization factor per recommendation time window
+_WINDOW_MULTIPLIER = {"30d": 365 / 30, "180d": 365 / 180}
+_DEFAULT_ANNUAL_INCOME = 50000
+_CURRENT_APY = 0.005  # Assume 0.5% current savings rate
+_HY_APY = 0.044  # 4.4% high-yield savings rate
+_SUBS_SAVINGS_PCT = 0.30  # Assume 30% of subscription spend can be saved
+
+
+def _build_user_data(credit_data, income_data, savings_data, subscriptions_data, time_window: str) -> dict:
+    """
+    Build the user data dict used for eligibility checks and rationale templates.
+
+    Sections whose source metrics are missing are left out.
+    """
+    # Annualize income based on window size
+    annual_income = _DEFAULT_ANNUAL_INCOME
+    if income_data is not None and income_data.total_income > 0:
+        annual_income = income_data.total_income * _WINDOW_MULTIPLIER[time_window]
+
+    user_data = {
+        "annual_income": annual_income,
+        "credit_score": 700,  # Default - would come from external source
+        "existing_accounts": [],
+        "credit_utilization": credit_data.aggregate_utilization if credit_data is not None else 0,
+        "age": 30,  # Default - would come from profile
+        "is_employed": True,  # Default - would come from profile
+    }
+
+    if credit_data is not None:
+        user_data.update({
+            "credit_max_utilization_pct": credit_data.aggregate_utilization * 100,  # Convert to percentage
+            "account_name": "Credit Card ****0000",  # Placeholder
+        })
+
+    if savings_data is not None:
+        balance = savings_data.total_savings_balance
+        monthly_expenses = savings_data.avg_monthly_expenses
+        user_data.update({
+            "savings_balance": balance,
+            "savings_total_balance": balance,  # Alias for templates
+            "months_expenses": savings_data.emergency_fund_months,
+            "monthly_expenses": monthly_expenses,
+            "monthly_spend": monthly_expenses,  # Alias for templates
+            "emergency_fund_goal": monthly_expenses * 3,  # 3-month goal
+            "three_month_fund_target": monthly_expenses * 3,
+            "target_savings": monthly_expenses * 6,  # 6-month goal
+            "category_count": 10,  # Default estimate for spending categories
+            # Interest projections for high-yield savings offers
+            "current_interest": balance * _CURRENT_APY,
+            "projected_interest": balance * _HY_APY,
+        })
+
+    if subscriptions_data is not None:
+        monthly_recurring = subscriptions_data.monthly_recurring_spend
+        user_data.update({
+            "subscription_count": subscriptions_data.subscription_count,
+            "subscription_share": subscriptions_data.subscription_share * 100,  # Convert to percentage
+            "monthly_subscription_cost": monthly_recurring,
+            "monthly_subscription_total": monthly_recurring,
+            "annual_subscription_total": monthly_recurring * 12,
+            "potential_savings": monthly_recurring * _SUBS_SAVINGS_PCT,
+            "bill_count": subscriptions_data.subscription_count,  # Alias for templates
+        })
+
+    if income_data is not None:
+        user_data["has_irregular_income"] = income_data.payment_frequency == "irregular"
+
+    return user_data
+
+
+def _recommendation_content_hash(
+    user_id: str,
+    time_window: str,
+    persona_id: str,
+    signals: list[str],
+    ref_date: date
+) -> str:
+    """Hash the inputs a recommendation set is assembled from (day granularity)."""
+    key = f"{user_id}|{time_window}|{persona_id}|{','.join(sorted(signals))}|{ref_date.isoformat()}"
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def _require_consent(user_id: str) -> None:
+    """Raise ConsentNotGrantedError/ValueError if the user may not be processed (blocking)."""
+    with SessionLocal() as session:
+        ConsentService(session).require_consent(user_id)
+
+
 @app.get("/api/recommendations/{user_id}")
 async def get_recommendations(
     user_id: str,
     time_window: str = Query(default="30d", description="Time window (30d or 180d)"),
-    generate: bool = Query(default=False, description="Generate new recommendations if true")
+    generate: bool = Query(default=False, description="Generate new recommendations if true"),
+    force: bool = Query(default=False, description="Re-assemble even if an identical set was generated today")
 ):
     """
     Get personalized recommendations for a user (Epic 4 Story 4.5).
@@ -1121,10 +1352,14 @@ async def get_recommendations(
     Returns assembled recommendations with education content, partner offers,
     rationales, and mandatory disclaimer.
 
+    When generating, a set already assembled today from the same persona and
+    signals is reused unless force is set.
+
     Args:
         user_id: User identifier
         time_window: Time window for recommendations (30d or 180d)
         generate: If true, generates new recommendations; if false, returns cached
+        force: If true, always re-assembles instead of reusing an identical set
 
     Returns:
         Assembled recommendation set with full details
@@ -1132,34 +1367,29 @@ async def get_recommendations(
     Raises:
         HTTPException 403: User has not granted consent for data processing
     """
+    # Initialize storage
+    storage = RecommendationStorage(str(DATA_DIR / "recommendations"))
+
     # ===== CONSENT CHECK (Epic 5 - Story 5.1 AC4) =====
-    # Check user consent before any data processing or recommendation generation
-    from sqlalchemy import create_engine
-    from sqlalchemy.orm import sessionmaker
-    from spendsense.guardrails.consent import ConsentService, ConsentNotGrantedError
+    # Check user consent before any data processing or recommendation generation.
+    # The read-only cache lookup runs alongside it; its result is discarded
+    # unless consent is confirmed.
+    lookups = [run_in_threadpool(_require_consent, user_id)]
+    if not generate:
+        lookups.append(run_in_threadpool(storage.get_latest_by_user, user_id, time_window))
+    consent_outcome, *cached = await asyncio.gather(*lookups, return_exceptions=True)
+    cached = cached[0] if cached else None
 
-    try:
-        engine = create_engine(f"sqlite:///{str(DB_PATH)}")
-        Session = sessionmaker(bind=engine)
-        with Session() as session:
-            consent_service = ConsentService(session)
-            consent_service.require_consent(user_id)
-    except ConsentNotGrantedError as e:
+    if isinstance(consent_outcome, ConsentNotGrantedError):
         raise HTTPException(
             status_code=403,
-            detail=f"Consent required: {str(e)}"
+            detail=f"Consent required: {str(consent_outcome)}"
         )
-    except ValueError:
-        # User not found - let it proceed, will be caught below
-        pass
+    if isinstance(consent_outcome, BaseException) and not isinstance(consent_outcome, ValueError):
+        # ValueError means user not found - let it proceed, will be caught below
+        raise consent_outcome
     # ===== END CONSENT CHECK =====
 
-    from pathlib import Path
-    from spendsense.recommendations.content_library import ContentLibrary
-    from spendsense.recommendations.partner_offer_library import PartnerOfferLibrary
-    from spendsense.recommendations.assembler import RecommendationAssembler
-    from spendsense.recommendations.storage import RecommendationStorage
-
     # Validate time window
     if time_window not in ["30d", "180d"]:
         raise HTTPException(
@@ -1167,30 +1397,29 @@ async def get_recommendations(
             detail="time_window must be '30d' or '180d'"
         )
 
-    # Initialize storage
-    storage = RecommendationStorage(str(DATA_DIR / "recommendations"))
-
     # If not generating new, try to return cached
-    if not generate:
-        cached = storage.get_latest_by_user(user_id, time_window)
-        if cached:
-            return cached
+    if isinstance(cached, BaseException):
+        raise cached
+    if cached:
+        return cached
 
     # Need to generate new recommendations
-    if not DB_PATH.exists():
+    if not _db_available():
         raise HTTPException(
             status_code=503,
             detail="Database not available. Ingest data first."
         )
 
     try:
-        # Get user's persona (from Epic 3)
-        from spendsense.personas.assigner import PersonaAssigner
-        from datetime import date
-
+        # Persona assignment (Epic 3) and behavioral signals are independent;
+        # run them concurrently once consent is confirmed
         assigner = PersonaAssigner(str(DB_PATH))
+        summary_generator = BehavioralSummaryGenerator(str(DB_PATH))
         ref_date = date.today()
-        persona_result = assigner.assign_persona(user_id, ref_date, time_window)
+        persona_result, behavioral_summary = await asyncio.gather(
+            run_in_threadpool(assigner.assign_persona, user_id, ref_date, time_window),
+            run_in_threadpool(summary_generator.generate_summary, user_id, ref_date),
+        )
 
         if not persona_result:
             raise HTTPException(
@@ -1198,11 +1427,8 @@ async def get_recommendations(
                 detail=f"User {user_id} not found or no persona assigned"
             )
 
-        # Get behavioral signals
-        from spendsense.features.behavioral_summary import BehavioralSummaryGenerator
-
-        summary_generator = BehavioralSummaryGenerator(str(DB_PATH))
-        behavioral_summary = summary_generator.generate_summary(user_id, ref_date)
+        # A new assignment was just stored; cached profile/signal payloads are stale
+        _invalidate_signals_cache(user_id)
 
         # Extract signals from behavioral summary based on time window
         # Use the appropriate time window data (30d or 180d)
@@ -1222,81 +1448,46 @@ async def get_recommendations(
         if subscriptions_data and subscriptions_data.subscription_count >= 3:
             signals.append("subscription_count")
 
-        # Build user data for eligibility checking
-        # Calculate annualized income from window data
-        annual_income = 50000  # Default
-        if income_data and income_data.total_income > 0:
-            # Annualize based on window size
-            multiplier = 365 / income_data.window_days
-            annual_income = income_data.total_income * multiplier
-
-        user_data = {
-            "annual_income": annual_income,
-            "credit_score": 700,  # Default - would come from external source
-            "existing_accounts": [],
-            "credit_utilization": credit_data.aggregate_utilization if credit_data else 0,
-            "age": 30,  # Default - would come from profile
-            "is_employed": True,  # Default - would come from profile
-        }
+        # Reuse a set assembled from identical inputs today
+        content_hash = _recommendation_content_hash(
+            user_id, time_window, persona_result.assigned_persona_id, signals, ref_date
+        )
+        if not force:
+            cached = await run_in_threadpool(storage.get_by_hash, user_id, content_hash, time_window)
+            if cached:
+                return cached
 
-        # Add personalization data for rationales
-        if credit_data:
-            user_data["credit_max_utilization_pct"] = credit_data.aggregate_utilization * 100  # Convert to percentage
-            user_data["account_name"] = "Credit Card ****0000"  # Placeholder
-
-        if savings_data:
-            user_data["savings_balance"] = savings_data.total_savings_balance
-            user_data["savings_total_balance"] = savings_data.total_savings_balance  # Alias for templates
-            user_data["months_expenses"] = savings_data.emergency_fund_months
-            user_data["monthly_expenses"] = savings_data.avg_monthly_expenses
-            user_data["monthly_spend"] = savings_data.avg_monthly_expenses  # Alias for templates
-            user_data["emergency_fund_goal"] = savings_data.avg_monthly_expenses * 3  # 3-month goal
-            user_data["three_month_fund_target"] = savings_data.avg_monthly_expenses * 3
-            user_data["target_savings"] = savings_data.avg_monthly_expenses * 6  # 6-month goal
-            user_data["category_count"] = 10  # Default estimate for spending categories
-
-            # Calculate interest projections for high-yield savings offers
-            user_data["current_interest"] = savings_data.total_savings_balance * 0.005  # Assume 0.5% current rate
-            user_data["projected_interest"] = savings_data.total_savings_balance * 0.044  # 4.4% high-yield rate
-
-        if subscriptions_data:
-            user_data["subscription_count"] = subscriptions_data.subscription_count
-            user_data["subscription_share"] = subscriptions_data.subscription_share * 100  # Convert to percentage
-            user_data["monthly_subscription_cost"] = subscriptions_data.monthly_recurring_spend
-            user_data["monthly_subscription_total"] = subscriptions_data.monthly_recurring_spend
-            user_data["annual_subscription_total"] = subscriptions_data.monthly_recurring_spend * 12
-            user_data["potential_savings"] = subscriptions_data.monthly_recurring_spend * 0.3  # Assume 30% savings potential
-            user_data["bill_count"] = subscriptions_data.subscription_count  # Alias for templates
-
-        if income_data:
-            user_data["has_irregular_income"] = income_data.payment_frequency == "irregular"
+        # Build user data for eligibility checking and rationale personalization
+        user_data = _build_user_data(credit_data, income_data, savings_data, subscriptions_data, time_window)
 
         # Initialize libraries and assembler
-        config_dir = Path(__file__).parent.parent / "config"
-        content_library = ContentLibrary(str(config_dir / "recommendations.yaml"))
-        partner_library = PartnerOfferLibrary(str(config_dir / "partner_offers.yaml"))
+        content_library = await run_in_threadpool(ContentLibrary, str(RECOMMENDATIONS_YAML))
+        partner_library = await run_in_threadpool(PartnerOfferLibrary, str(PARTNER_OFFERS_YAML))
         assembler = RecommendationAssembler(content_library, partner_library)
 
         # Assemble recommendations
-        rec_set = assembler.assemble_recommendations(
+        rec_set = await run_in_threadpool(
+            assembler.assemble_recommendations,
             user_id=user_id,
             persona_id=persona_result.assigned_persona_id,
             signals=signals,
             user_data=user_data,
             time_window=time_window,
         )
+        rec_set.metadata["content_hash"] = content_hash
 
         # Save to storage
-        storage.save_recommendation_set(rec_set)
+        await run_in_threadpool(storage.save_recommendation_set, rec_set)
 
         # Return as dict
         return rec_set.to_dict()
 
     except HTTPException:
         raise
+    except DB_ERRORS:
+        _mark_db_unavailable()
+        raise HTTPException(status_code=503, detail="Database not available")
     except Exception as e:
-        import logging
-        logger = logging.getLogger(__name__)
         logger.error(f"Error generating recommendations: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -1319,6 +1510,22 @@ class ConsentResponse(BaseModel):
     message: str
 
 
+def _record_consent(user_id: str, consent_status: ConsentStatus, consent_version: str) -> ConsentResult:
+    """Persist a consent change (blocking; run via threadpool)."""
+    with SessionLocal() as session:
+        return ConsentService(session).record_consent(
+            user_id=user_id,
+            consent_status=consent_status,
+            consent_version=consent_version
+        )
+
+
+def _check_consent(user_id: str) -> ConsentResult:
+    """Load current consent status (blocking; run via threadpool)."""
+    with SessionLocal() as session:
+        return ConsentService(session).check_consent(user_id)
+
+
 @app.post("/api/consent", response_model=ConsentResponse, status_code=201)
 async def record_consent(
     consent_request: ConsentRequest,
@@ -1345,10 +1552,6 @@ async def record_consent(
         HTTPException 404: User not found
         HTTPException 500: Database error
     """
-    from sqlalchemy import create_engine
-    from sqlalchemy.orm import sessionmaker
-    from spendsense.guardrails.consent import ConsentService, ConsentStatus, ConsentNotGrantedError
-
     # Validate consent status
     if consent_request.consent_status not in ['opted_in', 'opted_out']:
         raise HTTPException(
@@ -1357,32 +1560,26 @@ async def record_consent(
         )
 
     try:
-        engine = create_engine(f"sqlite:///{str(DB_PATH)}")
-        Session = sessionmaker(bind=engine)
-        with Session() as session:
-            consent_service = ConsentService(session)
-
-            # Record consent
-            consent_status_enum = ConsentStatus(consent_request.consent_status)
-            result = consent_service.record_consent(
-                user_id=consent_request.user_id,
-                consent_status=consent_status_enum,
-                consent_version=consent_request.consent_version
-            )
+        # Record consent
+        consent_status_enum = ConsentStatus(consent_request.consent_status)
+        result = await run_in_threadpool(
+            _record_consent,
+            consent_request.user_id,
+            consent_status_enum,
+            consent_request.consent_version
+        )
 
-            return ConsentResponse(
-                user_id=result.user_id,
-                consent_status=result.consent_status.value,
-                consent_timestamp=result.consent_timestamp.isoformat() if result.consent_timestamp else "",
-                consent_version=result.consent_version,
-                message=f"Consent recorded: {result.consent_status.value}"
-            )
+        return ConsentResponse.model_construct(
+            user_id=result.user_id,
+            consent_status=result.consent_status.value,
+            consent_timestamp=result.consent_timestamp.isoformat() if result.consent_timestamp else "",
+            consent_version=result.consent_version,
+            message=f"Consent recorded: {result.consent_status.value}"
+        )
 
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
-        import logging
-        logger = logging.getLogger(__name__)
         logger.error(f"Error recording consent: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -1412,32 +1609,21 @@ async def get_consent(
         HTTPException 404: User not found
         HTTPException 500: Database error
     """
-    from sqlalchemy import create_engine
-    from sqlalchemy.orm import sessionmaker
-    from spendsense.guardrails.consent import ConsentService
-
     try:
-        engine = create_engine(f"sqlite:///{str(DB_PATH)}")
-        Session = sessionmaker(bind=engine)
-        with Session() as session:
-            consent_service = ConsentService(session)
-
-            # Check consent
-            result = consent_service.check_consent(user_id)
-
-            return ConsentResponse(
-                user_id=result.user_id,
-                consent_status=result.consent_status.value,
-                consent_timestamp=result.consent_timestamp.isoformat() if result.consent_timestamp else "",
-                consent_version=result.consent_version,
-                message=f"Current consent status: {result.consent_status.value}"
-            )
+        # Check consent
+        result = await run_in_threadpool(_check_consent, user_id)
+
+        return ConsentResponse.model_construct(
+            user_id=result.user_id,
+            consent_status=result.consent_status.value,
+            consent_timestamp=result.consent_timestamp.isoformat() if result.consent_timestamp else "",
+            consent_version=result.consent_version,
+            message=f"Current consent status: {result.consent_status.value}"
+        )
 
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
-        import logging
-        logger = logging.getLogger(__name__)
         logger.error(f"Error retrieving consent: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
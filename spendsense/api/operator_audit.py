@@ -5,26 +5,70 @@ Provides secure access to comprehensive audit trail with filtering,
 export capabilities, and compliance metrics for regulatory requirements.
 """
 
+import asyncio
+import base64
 import csv
 import io
-import json
 import logging
+import os
+import time
+import uuid
+import zlib
 from datetime import datetime, timedelta
-from typing import List, Optional
-from fastapi import APIRouter, Depends, Query, HTTPException
-from fastapi.responses import StreamingResponse
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+import orjson
+from cachetools import TTLCache
+from fastapi import APIRouter, BackgroundTasks, Depends, Query, HTTPException, Response
+from fastapi.responses import FileResponse, StreamingResponse
+from starlette.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field
-from sqlalchemy import func, desc
+from sqlalchemy import Select, desc, func, literal_column, select, tuple_
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
 
 from spendsense.auth.rbac import require_role, TokenData
 from spendsense.config.database import get_db_session
 from spendsense.ingestion.database_writer import AuditLog
+from spendsense.services.compliance_metrics import ComplianceMetricsCalculator
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/operator", tags=["operator-audit"])
 
+# Event type validation set and its error-message listing, built once
+VALID_EVENT_TYPES = frozenset(AuditLog.VALID_EVENT_TYPES)
+VALID_EVENT_TYPES_LIST = ", ".join(sorted(VALID_EVENT_TYPES))
+
+# Rows fetched per round trip when streaming exports
+EXPORT_CHUNK_SIZE = 500
+
+# Compliance metrics are four full-range aggregates; dashboard refreshes
+# within this window reuse the last result
+COMPLIANCE_METRICS_TTL_SECONDS = 60
+_compliance_metrics_cache: TTLCache = TTLCache(maxsize=256, ttl=COMPLIANCE_METRICS_TTL_SECONDS)
+
+# zlib level for ?compress=true exports; audit rows are repetitive, so
+# mid-range levels already get most of the ratio
+EXPORT_GZIP_LEVEL = 6
+
+# Background exports are written here and tracked in memory for a day; files
+# older than that are deleted when the next export job runs
+EXPORT_DIR = Path(__file__).parent.parent.parent / "data" / "exports"
+EXPORT_JOB_TTL_SECONDS = 24 * 60 * 60
+_export_jobs: TTLCache = TTLCache(maxsize=1024, ttl=EXPORT_JOB_TTL_SECONDS)
+
+EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv",
+    "json": "application/json",
+    "ndjson": "application/x-ndjson",
+}
+
+CSV_EXPORT_FIELDS = (
+    "log_id", "event_type", "user_id", "operator_id", "recommendation_id",
+    "timestamp", "event_data", "ip_address", "user_agent"
+)
+
 
 # ===== Response Models =====
 
@@ -47,6 +91,31 @@ class AuditLogListResponse(BaseModel):
     total_count: int
     page: int
     page_size: int
+    next_cursor: Optional[str] = None  # Pass as ?cursor= to fetch the following page
+    total_count_is_estimate: bool = False  # True when total_count is the unfiltered table estimate
+
+
+class AuditExportRequest(BaseModel):
+    """Background export request; filters match GET /audit/export."""
+    format: str = Field("csv", pattern="^(csv|json|ndjson)$", description="Export format (csv, json or ndjson)")
+    event_type: Optional[str] = Field(None, description="Filter by event type")
+    user_id: Optional[str] = Field(None, description="Filter by user ID")
+    operator_id: Optional[str] = Field(None, description="Filter by operator ID")
+    start_date: Optional[str] = Field(None, description="Start date (ISO format)")
+    end_date: Optional[str] = Field(None, description="End date (ISO format)")
+
+
+class AuditExportJobResponse(BaseModel):
+    """Status of a background export job."""
+    job_id: str
+    status: str  # pending | running | completed | failed
+    format: str
+    requested_by: str
+    created_at: str
+    completed_at: Optional[str] = None
+    size_bytes: Optional[int] = None
+    download_url: Optional[str] = None
+    error: Optional[str] = None
 
 
 class ComplianceMetricsConsentStats(BaseModel):
@@ -93,10 +162,133 @@ class ComplianceMetricsResponse(BaseModel):
     date_range: dict  # {"start_date": str, "end_date": str}
 
 
+# ===== Date Ranges =====
+
+def _parse_range(
+    start_date: Optional[str],
+    end_date: Optional[str]
+) -> Tuple[Optional[datetime], Optional[datetime]]:
+    """
+    Parse ISO start/end query values into a half-open [start, end) range.
+
+    A date-only end (e.g. 2024-01-31) covers that whole day, so it becomes
+    the following midnight. Callers filter timestamp >= start and
+    timestamp < end directly on the column so the timestamp indexes apply.
+
+    Raises:
+        HTTPException 400: Either value is not a valid ISO date/datetime
+    """
+    start_dt = _parse_iso(start_date, "start_date") if start_date else None
+    end_dt = _parse_iso(end_date, "end_date") if end_date else None
+
+    if end_dt and _is_date_only(end_date):
+        end_dt += timedelta(days=1)
+
+    return start_dt, end_dt
+
+
+def _parse_iso(value: str, field: str) -> datetime:
+    """
+    Parse an ISO 8601 date or datetime with the C-implemented fromisoformat.
+
+    A trailing 'Z' is rewritten only when present (fromisoformat accepts it
+    natively from Python 3.11, but 3.10 is still supported).
+    """
+    try:
+        if value.endswith("Z"):
+            return datetime.fromisoformat(value[:-1] + "+00:00")
+        return datetime.fromisoformat(value)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid {field}: {value}")
+
+
+def _is_date_only(value: str) -> bool:
+    """Whether an ISO string names a calendar date with no time component."""
+    return "T" not in value and " " not in value
+
+
+# ===== Query Building =====
+
+# Only the columns the endpoints serialize; rows come back as lightweight
+# Row tuples rather than hydrated AuditLog instances
+AUDIT_COLUMNS = (
+    AuditLog.log_id,
+    AuditLog.event_type,
+    AuditLog.user_id,
+    AuditLog.operator_id,
+    AuditLog.recommendation_id,
+    AuditLog.timestamp,
+    AuditLog.event_data,
+    AuditLog.ip_address,
+    AuditLog.user_agent,
+)
+
+
+def _build_audit_query(
+    event_type: Optional[str],
+    user_id: Optional[str],
+    operator_id: Optional[str],
+    start_dt: Optional[datetime],
+    end_dt: Optional[datetime]
+) -> Select:
+    """
+    Build the filtered, newest-first audit log SELECT shared by list and export.
+
+    Raises:
+        HTTPException 400: Unknown event_type
+    """
+    stmt = select(*AUDIT_COLUMNS)
+
+    if event_type:
+        if event_type not in VALID_EVENT_TYPES:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid event_type '{event_type}'. Valid types: {VALID_EVENT_TYPES_LIST}"
+            )
+        stmt = stmt.where(AuditLog.event_type == event_type)
+
+    if user_id:
+        stmt = stmt.where(AuditLog.user_id == user_id)
+
+    if operator_id:
+        stmt = stmt.where(AuditLog.operator_id == operator_id)
+
+    if start_dt:
+        stmt = stmt.where(AuditLog.timestamp >= start_dt)
+    if end_dt:
+        stmt = stmt.where(AuditLog.timestamp < end_dt)
+
+    return stmt.order_by(desc(AuditLog.timestamp), desc(AuditLog.log_id))
+
+
+def _server_timing(**durations: float) -> str:
+    """Format phase durations (seconds) as a Server-Timing header value in milliseconds."""
+    return ", ".join(f"{name};dur={seconds * 1000:.1f}" for name, seconds in durations.items())
+
+
+# ===== Pagination Cursors =====
+
+def _encode_cursor(timestamp: datetime, log_id: str, total_count: int) -> str:
+    """Encode the last row's sort key (and the page total) as an opaque cursor."""
+    raw = f"{timestamp.isoformat()}|{log_id}|{total_count}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, str, int]:
+    """Decode a cursor from _encode_cursor, raising HTTP 400 if malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        timestamp, log_id, total_count = raw.split("|")
+        return datetime.fromisoformat(timestamp), log_id, int(total_count)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid cursor: {cursor}")
+
+
 # ===== API Endpoints =====
 
 @router.get("/audit/log", response_model=AuditLogListResponse)
 async def get_audit_log(
+    response: Response,
     event_type: Optional[str] = Query(None, description="Filter by event type"),
     user_id: Optional[str] = Query(None, description="Filter by user ID"),
     operator_id: Optional[str] = Query(None, description="Filter by operator ID"),
@@ -104,21 +296,37 @@ async def get_audit_log(
     end_date: Optional[str] = Query(None, description="End date (ISO format)"),
     page: int = Query(1, ge=1, description="Page number (1-indexed)"),
     page_size: int = Query(50, ge=1, le=1000, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from a previous page's next_cursor"),
+    exact_count: bool = Query(False, description="Count rows exactly even when no filters are applied"),
     current_operator: TokenData = Depends(require_role("admin"))
 ):
     """
     Get audit log entries with pagination and filtering (AC #6, #10).
 
+    Pages are addressed either by page number (OFFSET) or, for deep
+    browsing, by the next_cursor returned with each page, which seeks
+    directly past the last (timestamp, log_id) seen.
+
+    The Server-Timing header reports the DB fetch (db) and response
+    building (ser) durations.
+
+    With no filters, total_count is estimated from the table's rowid
+    high-water mark instead of a full COUNT(*) scan; pass exact_count=true
+    for the exact figure.
+
     Requires admin or compliance role for access.
 
     Args:
+        response: Outgoing response, used to set the Server-Timing header
         event_type: Filter by specific event type
         user_id: Filter by user ID
         operator_id: Filter by operator ID
-        start_date: Start of date range (ISO format)
-        end_date: End of date range (ISO format)
+        start_date: Start of date range (ISO format, inclusive)
+        end_date: End of date range (ISO format, exclusive; a bare date includes that day)
         page: Page number (1-indexed)
         page_size: Number of items per page
+        cursor: Opaque keyset cursor; when given, page is not used for the offset
+        exact_count: Force an exact total for unfiltered queries
         current_operator: Authenticated operator (injected by FastAPI)
 
     Returns:
@@ -129,46 +337,22 @@ async def get_audit_log(
         HTTPException 403: Forbidden (insufficient permissions)
         HTTPException 400: Invalid date format or parameters
     """
-    session: Session = get_db_session()
-
     try:
-        # Build query with filters
-        query = session.query(AuditLog)
-
-        if event_type:
-            if event_type not in AuditLog.VALID_EVENT_TYPES:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Invalid event_type '{event_type}'. Valid types: {', '.join(sorted(AuditLog.VALID_EVENT_TYPES))}"
-                )
-            query = query.filter(AuditLog.event_type == event_type)
-
-        if user_id:
-            query = query.filter(AuditLog.user_id == user_id)
-
-        if operator_id:
-            query = query.filter(AuditLog.operator_id == operator_id)
-
-        if start_date:
-            try:
-                start_dt = datetime.fromisoformat(start_date.replace('Z', '+00:00'))
-                query = query.filter(AuditLog.timestamp >= start_dt)
-            except ValueError:
-                raise HTTPException(status_code=400, detail=f"Invalid start_date format: {start_date}")
-
-        if end_date:
-            try:
-                end_dt = datetime.fromisoformat(end_date.replace('Z', '+00:00'))
-                query = query.filter(AuditLog.timestamp <= end_dt)
-            except ValueError:
-                raise HTTPException(status_code=400, detail=f"Invalid end_date format: {end_date}")
-
-        # Get total count
-        total_count = query.count()
-
-        # Apply pagination and ordering
-        offset = (page - 1) * page_size
-        entries = query.order_by(desc(AuditLog.timestamp)).offset(offset).limit(page_size).all()
+        start_dt, end_dt = _parse_range(start_date, end_date)
+        stmt = _build_audit_query(event_type, user_id, operator_id, start_dt, end_dt)
+        keyset = _decode_cursor(cursor) if cursor else None
+        estimate = not exact_count and not any((event_type, user_id, operator_id, start_date, end_date))
+
+        # The blocking DB round trips run in the threadpool, off the event loop
+        db_started = time.perf_counter()
+        entries, total_count = await run_in_threadpool(
+            _fetch_audit_page, stmt, keyset, page, page_size, estimate
+        )
+        ser_started = time.perf_counter()
+
+        next_cursor = None
+        if len(entries) == page_size:
+            next_cursor = _encode_cursor(entries[-1].timestamp, entries[-1].log_id, total_count)
 
         # Convert to response model
         audit_entries = [
@@ -179,12 +363,16 @@ async def get_audit_log(
                 operator_id=entry.operator_id,
                 recommendation_id=entry.recommendation_id,
                 timestamp=entry.timestamp.isoformat(),
-                event_data=json.loads(entry.event_data),
+                event_data=orjson.loads(entry.event_data),
                 ip_address=entry.ip_address,
                 user_agent=entry.user_agent
             )
             for entry in entries
         ]
+        response.headers["Server-Timing"] = _server_timing(
+            db=ser_started - db_started,
+            ser=time.perf_counter() - ser_started
+        )
 
         logger.info(
             f"Audit log query by {current_operator.username}: "
@@ -195,7 +383,9 @@ async def get_audit_log(
             entries=audit_entries,
             total_count=total_count,
             page=page,
-            page_size=page_size
+            page_size=page_size,
+            next_cursor=next_cursor,
+            total_count_is_estimate=estimate
         )
 
     except HTTPException:
@@ -203,33 +393,93 @@ async def get_audit_log(
     except Exception as e:
         logger.error(f"Failed to fetch audit log: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to fetch audit log: {str(e)}")
-    finally:
-        session.close()
+
+
+def _fetch_audit_page(
+    stmt: Select,
+    keyset: Optional[Tuple[datetime, str, int]],
+    page: int,
+    page_size: int,
+    estimate: bool = False
+) -> Tuple[List[Row], int]:
+    """
+    Fetch one page of audit rows and the filtered total (blocking; run via threadpool).
+
+    Args:
+        stmt: Filtered, ordered audit SELECT from _build_audit_query
+        keyset: Decoded cursor (timestamp, log_id, total), or None for OFFSET paging
+        page: Page number, used only for OFFSET paging
+        page_size: Number of rows per page
+        estimate: Estimate the total from MAX(rowid) (unfiltered queries only)
+    """
+    with get_db_session() as session:
+        if keyset:
+            # Keyset page: seek past the last row seen, reusing the total
+            # carried in the cursor instead of recounting
+            cursor_ts, cursor_log_id, total_count = keyset
+            entries = session.execute(
+                stmt.where(tuple_(AuditLog.timestamp, AuditLog.log_id) < tuple_(cursor_ts, cursor_log_id))
+                .limit(page_size)
+            ).all()
+            return entries, total_count
+
+        offset = (page - 1) * page_size
+
+        if estimate:
+            # Unfiltered: MAX(rowid) is a single b-tree seek and matches the
+            # row count unless entries have been purged, so skip the scan
+            entries = session.execute(stmt.offset(offset).limit(page_size)).all()
+            total_count = session.execute(
+                select(func.max(literal_column("rowid"))).select_from(AuditLog)
+            ).scalar_one() or 0
+            return entries, total_count
+
+        # Apply pagination; the window COUNT returns the filtered total
+        # alongside the page so the filter is evaluated only once
+        entries = session.execute(
+            stmt.add_columns(func.count().over().label("_total"))
+            .offset(offset)
+            .limit(page_size)
+        ).all()
+
+        if entries:
+            total_count = entries[0]._total
+        elif offset:
+            # Past the last page: no rows carry the total, so count directly
+            total_count = session.execute(
+                select(func.count()).select_from(stmt.order_by(None).subquery())
+            ).scalar_one()
+        else:
+            total_count = 0
+
+        return entries, total_count
 
 
 @router.get("/audit/export")
 async def export_audit_log(
-    format: str = Query("csv", regex="^(csv|json)$", description="Export format (csv or json)"),
+    format: str = Query("csv", regex="^(csv|json|ndjson)$", description="Export format (csv, json or ndjson)"),
     event_type: Optional[str] = Query(None, description="Filter by event type"),
     user_id: Optional[str] = Query(None, description="Filter by user ID"),
     operator_id: Optional[str] = Query(None, description="Filter by operator ID"),
     start_date: Optional[str] = Query(None, description="Start date (ISO format)"),
     end_date: Optional[str] = Query(None, description="End date (ISO format)"),
+    compress: bool = Query(False, description="Download as a gzip file (.gz)"),
     current_operator: TokenData = Depends(require_role("admin"))
 ):
     """
-    Export audit logs as CSV or JSON (AC #7, #10).
+    Export audit logs as CSV, JSON or NDJSON (AC #7, #10).
 
     Streams large exports to avoid memory issues for regulatory reporting.
     Requires admin or compliance role for access.
 
     Args:
-        format: Export format ('csv' or 'json')
+        format: Export format ('csv', 'json' array, or 'ndjson' one object per line)
         event_type: Filter by specific event type
         user_id: Filter by user ID
         operator_id: Filter by operator ID
-        start_date: Start of date range (ISO format)
-        end_date: End of date range (ISO format)
+        start_date: Start of date range (ISO format, inclusive)
+        end_date: End of date range (ISO format, exclusive; a bare date includes that day)
+        compress: If true, stream a gzip-compressed .gz file
         current_operator: Authenticated operator (injected by FastAPI)
 
     Returns:
@@ -240,110 +490,300 @@ async def export_audit_log(
         HTTPException 403: Forbidden (insufficient permissions)
         HTTPException 400: Invalid parameters
     """
-    session: Session = get_db_session()
-
     try:
-        # Build query with filters (same as get_audit_log)
-        query = session.query(AuditLog)
-
-        if event_type:
-            if event_type not in AuditLog.VALID_EVENT_TYPES:
-                raise HTTPException(status_code=400, detail=f"Invalid event_type: {event_type}")
-            query = query.filter(AuditLog.event_type == event_type)
+        start_dt, end_dt = _parse_range(start_date, end_date)
+        stmt = _build_audit_query(event_type, user_id, operator_id, start_dt, end_dt)
 
-        if user_id:
-            query = query.filter(AuditLog.user_id == user_id)
-
-        if operator_id:
-            query = query.filter(AuditLog.operator_id == operator_id)
-
-        if start_date:
-            try:
-                start_dt = datetime.fromisoformat(start_date.replace('Z', '+00:00'))
-                query = query.filter(AuditLog.timestamp >= start_dt)
-            except ValueError:
-                raise HTTPException(status_code=400, detail=f"Invalid start_date: {start_date}")
-
-        if end_date:
-            try:
-                end_dt = datetime.fromisoformat(end_date.replace('Z', '+00:00'))
-                query = query.filter(AuditLog.timestamp <= end_dt)
-            except ValueError:
-                raise HTTPException(status_code=400, detail=f"Invalid end_date: {end_date}")
-
-        # Fetch all entries (ordered by timestamp)
-        entries = query.order_by(desc(AuditLog.timestamp)).all()
-
-        logger.info(f"Exporting {len(entries)} audit log entries as {format} by {current_operator.username}")
+        logger.info(f"Exporting audit log entries as {format} by {current_operator.username}")
 
         # Generate filename
         timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
         filename = f"audit_log_{timestamp}.{format}"
 
-        if format == "csv":
-            # Generate CSV
-            output = io.StringIO()
-            writer = csv.DictWriter(output, fieldnames=[
-                "log_id", "event_type", "user_id", "operator_id", "recommendation_id",
-                "timestamp", "event_data", "ip_address", "user_agent"
-            ])
-            writer.writeheader()
-
-            for entry in entries:
-                writer.writerow({
-                    "log_id": entry.log_id,
-                    "event_type": entry.event_type,
-                    "user_id": entry.user_id or "",
-                    "operator_id": entry.operator_id or "",
-                    "recommendation_id": entry.recommendation_id or "",
-                    "timestamp": entry.timestamp.isoformat(),
-                    "event_data": entry.event_data,  # JSON string
-                    "ip_address": entry.ip_address or "",
-                    "user_agent": entry.user_agent or "",
-                })
-
-            return StreamingResponse(
-                iter([output.getvalue()]),
-                media_type="text/csv",
-                headers={"Content-Disposition": f"attachment; filename={filename}"}
-            )
+        content = _export_content(stmt, format)
+        media_type = EXPORT_MEDIA_TYPES[format]
+        headers = {}
 
-        else:  # format == "json"
-            # Generate JSON
-            entries_json = [
-                {
-                    "log_id": entry.log_id,
-                    "event_type": entry.event_type,
-                    "user_id": entry.user_id,
-                    "operator_id": entry.operator_id,
-                    "recommendation_id": entry.recommendation_id,
-                    "timestamp": entry.timestamp.isoformat(),
-                    "event_data": json.loads(entry.event_data),
-                    "ip_address": entry.ip_address,
-                    "user_agent": entry.user_agent,
-                }
-                for entry in entries
-            ]
-
-            json_output = json.dumps(entries_json, indent=2)
-
-            return StreamingResponse(
-                iter([json_output]),
-                media_type="application/json",
-                headers={"Content-Disposition": f"attachment; filename={filename}"}
-            )
+        if compress:
+            # A .gz file rather than Content-Encoding, so it stays compressed
+            # on disk; 'identity' stops GZipMiddleware compressing it again
+            content = _gzip_stream(content)
+            media_type = "application/gzip"
+            filename += ".gz"
+            headers["Content-Encoding"] = "identity"
 
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"Failed to export audit log: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Export failed: {str(e)}")
+
+    # The generators open their own session and run the query on first
+    # iteration, which Starlette performs in its threadpool
+    headers["Content-Disposition"] = f"attachment; filename={filename}"
+    return StreamingResponse(content, media_type=media_type, headers=headers)
+
+
+@router.post("/audit/export", response_model=AuditExportJobResponse, status_code=202)
+async def create_audit_export_job(
+    export_request: AuditExportRequest,
+    background_tasks: BackgroundTasks,
+    current_operator: TokenData = Depends(require_role("admin"))
+):
+    """
+    Start a background audit log export (AC #7, #10).
+
+    For exports too large to hold an HTTP request open: the file is written
+    server-side after this returns, and the job is polled via
+    GET /audit/export/{job_id} until its download_url is available.
+    Requires admin or compliance role for access.
+
+    Args:
+        export_request: Export format and the same filters as GET /audit/export
+        background_tasks: FastAPI background task queue (injected)
+        current_operator: Authenticated operator (injected by FastAPI)
+
+    Returns:
+        AuditExportJobResponse with status 'pending'
+
+    Raises:
+        HTTPException 401: Unauthorized (missing/invalid token)
+        HTTPException 403: Forbidden (insufficient permissions)
+        HTTPException 400: Invalid parameters
+    """
+    # Validate filters now so bad input fails the request, not the job
+    start_dt, end_dt = _parse_range(export_request.start_date, export_request.end_date)
+    stmt = _build_audit_query(
+        export_request.event_type, export_request.user_id, export_request.operator_id, start_dt, end_dt
+    )
+
+    job_id = uuid.uuid4().hex
+    created_at = datetime.utcnow()
+    job = _export_jobs[job_id] = {
+        "job_id": job_id,
+        "status": "pending",
+        "format": export_request.format,
+        "requested_by": current_operator.username,
+        "created_at": created_at.isoformat(),
+        "filename": f"audit_log_{created_at.strftime('%Y%m%d_%H%M%S')}_{job_id[:8]}.{export_request.format}",
+    }
+    background_tasks.add_task(_run_export_job, job, stmt)
+
+    logger.info(f"Audit export job {job_id} ({export_request.format}) queued by {current_operator.username}")
+
+    return _export_job_response(job)
+
+
+@router.get("/audit/export/{job_id}", response_model=AuditExportJobResponse)
+async def get_audit_export_job(
+    job_id: str,
+    current_operator: TokenData = Depends(require_role("admin"))
+):
+    """
+    Get the status of a background audit export (AC #7, #10).
+
+    Raises:
+        HTTPException 404: Unknown or expired job
+    """
+    job = _export_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Export job {job_id} not found")
+    return _export_job_response(job)
+
+
+@router.get("/audit/export/{job_id}/download")
+async def download_audit_export(
+    job_id: str,
+    current_operator: TokenData = Depends(require_role("admin"))
+):
+    """
+    Download the file produced by a completed background export (AC #7, #10).
+
+    Raises:
+        HTTPException 404: Unknown or expired job
+        HTTPException 409: Job has not completed
+    """
+    job = _export_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Export job {job_id} not found")
+    if job["status"] != "completed":
+        raise HTTPException(status_code=409, detail=f"Export job {job_id} is {job['status']}")
+
+    return FileResponse(
+        EXPORT_DIR / job["filename"],
+        media_type=EXPORT_MEDIA_TYPES[job["format"]],
+        filename=job["filename"]
+    )
+
+
+def _export_job_response(job: Dict[str, Any]) -> AuditExportJobResponse:
+    """Build the public view of a job, adding the download URL once complete."""
+    download_url = None
+    if job["status"] == "completed":
+        download_url = f"{router.prefix}/audit/export/{job['job_id']}/download"
+    return AuditExportJobResponse(
+        **{k: v for k, v in job.items() if k != "filename"},
+        download_url=download_url
+    )
+
+
+def _sweep_expired_exports() -> int:
+    """
+    Delete export files older than EXPORT_JOB_TTL_SECONDS.
+
+    Their jobs have already expired from _export_jobs, so the files can no
+    longer be downloaded and would otherwise keep audit data on disk.
+
+    Returns:
+        Number of files removed
+    """
+    cutoff = time.time() - EXPORT_JOB_TTL_SECONDS
+    removed = 0
+    try:
+        entries = list(os.scandir(EXPORT_DIR))
+    except FileNotFoundError:
+        return 0
+    for entry in entries:
+        try:
+            if entry.is_file() and entry.stat().st_mtime < cutoff:
+                os.unlink(entry.path)
+                removed += 1
+        except FileNotFoundError:
+            continue
+    return removed
+
+
+def _run_export_job(job: Dict[str, Any], stmt: Select) -> None:
+    """Write an export to EXPORT_DIR, recording progress on the job (runs after the response)."""
+    job["status"] = "running"
+    try:
+        removed = _sweep_expired_exports()
+        if removed:
+            logger.info(f"Removed {removed} expired audit export file(s)")
+        EXPORT_DIR.mkdir(parents=True, exist_ok=True)
+        with open(EXPORT_DIR / job["filename"], "wb") as f:
+            for chunk in _export_content(stmt, job["format"]):
+                f.write(chunk.encode() if isinstance(chunk, str) else chunk)
+        job["size_bytes"] = (EXPORT_DIR / job["filename"]).stat().st_size
+        job["completed_at"] = datetime.utcnow().isoformat()
+        job["status"] = "completed"
+    except Exception as e:
+        logger.error(f"Audit export job {job['job_id']} failed: {e}", exc_info=True)
+        job["error"] = str(e)
+        job["status"] = "failed"
+
+
+def _export_content(stmt: Select, format: str) -> Iterator[Union[str, bytes]]:
+    """Select the streaming generator for an export format."""
+    if format == "csv":
+        return _stream_csv(stmt)
+    return _stream_json(stmt, framed=(format == "json"))
+
+
+def _gzip_stream(chunks: Iterator[Union[str, bytes]]) -> Iterator[bytes]:
+    """
+    Compress an export stream into gzip format incrementally.
+
+    Compressed bytes are yielded whenever zlib emits a block, so memory stays
+    bounded without forcing a flush (and a worse ratio) on every row.
+    """
+    compressor = zlib.compressobj(EXPORT_GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk.encode() if isinstance(chunk, str) else chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def _stream_csv(stmt: Select) -> Iterator[str]:
+    """
+    Yield the CSV export one line at a time, closing the session when done.
+
+    Starlette iterates sync generators in its threadpool, so the blocking
+    query and row fetches never run on the event loop.
+    """
+    session: Session = get_db_session()
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def drain() -> str:
+        line = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+        return line
+
+    try:
+        writer.writerow(CSV_EXPORT_FIELDS)
+        yield drain()
+
+        # Stream entries (newest first) in chunks rather than loading them all.
+        # Rows are positional in CSV_EXPORT_FIELDS order; csv.writer writes
+        # None as an empty field.
+        for entry in session.execute(stmt).yield_per(EXPORT_CHUNK_SIZE):
+            writer.writerow((
+                entry.log_id,
+                entry.event_type,
+                entry.user_id,
+                entry.operator_id,
+                entry.recommendation_id,
+                entry.timestamp.isoformat(),
+                entry.event_data,  # JSON string
+                entry.ip_address,
+                entry.user_agent,
+            ))
+            yield drain()
+    finally:
+        session.close()
+
+
+def _stream_json(stmt: Select, framed: bool) -> Iterator[bytes]:
+    """
+    Yield the JSON export one entry at a time, closing the session when done.
+
+    With framed=True the entries form a JSON array; otherwise each entry is
+    emitted as its own line (NDJSON).
+    """
+    session: Session = get_db_session()
+    try:
+        if framed:
+            yield b"[\n"
+        separator = b""
+        # SQLite's json_valid() flags event_data that is safe to embed
+        stmt = stmt.add_columns(func.json_valid(AuditLog.event_data).label("event_data_valid"))
+        for entry in session.execute(stmt).yield_per(EXPORT_CHUNK_SIZE):
+            # event_data is stored as JSON text (written by AuditService via
+            # json.dumps), so valid rows are embedded verbatim as an orjson
+            # Fragment rather than parsed and re-encoded. orjson does not
+            # check fragments, so malformed text is exported as a string.
+            if entry.event_data_valid:
+                event_data = orjson.Fragment(entry.event_data)
+            else:
+                event_data = entry.event_data
+            line = orjson.dumps({
+                "log_id": entry.log_id,
+                "event_type": entry.event_type,
+                "user_id": entry.user_id,
+                "operator_id": entry.operator_id,
+                "recommendation_id": entry.recommendation_id,
+                "timestamp": entry.timestamp,
+                "event_data": event_data,
+                "ip_address": entry.ip_address,
+                "user_agent": entry.user_agent,
+            })
+            if framed:
+                yield separator + line
+                separator = b",\n"
+            else:
+                yield line + b"\n"
+        if framed:
+            yield b"\n]"
     finally:
         session.close()
 
 
 @router.get("/audit/metrics", response_model=ComplianceMetricsResponse)
 async def get_compliance_metrics(
+    response: Response,
     start_date: Optional[str] = Query(None, description="Start date (ISO format, defaults to 30 days ago)"),
     end_date: Optional[str] = Query(None, description="End date (ISO format, defaults to now)"),
     current_operator: TokenData = Depends(require_role("admin"))
@@ -353,9 +793,11 @@ async def get_compliance_metrics(
 
     Calculates consent opt-in rate, eligibility failure reasons,
     tone validation issues, and operator action distribution.
-    Requires admin or compliance role for access.
+    Requires admin or compliance role for access. A freshly computed
+    result reports its DB time in the Server-Timing header.
 
     Args:
+        response: Outgoing response, used to set the Server-Timing header
         start_date: Start of date range (ISO format, default: 30 days ago)
         end_date: End of date range (ISO format, default: now)
         current_operator: Authenticated operator (injected by FastAPI)
@@ -368,58 +810,61 @@ async def get_compliance_metrics(
         HTTPException 403: Forbidden (insufficient permissions)
         HTTPException 400: Invalid date format
     """
-    session: Session = get_db_session()
-
     try:
+        # Keyed on the raw parameters so default-range dashboard polls share
+        # an entry; the reported date_range is the one that was computed
+        cache_key = (start_date, end_date)
+        cached = _compliance_metrics_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         # Default date range: last 30 days
-        if not end_date:
+        start_dt, end_dt = _parse_range(start_date, end_date)
+        if not end_dt:
             end_dt = datetime.utcnow()
-        else:
-            try:
-                end_dt = datetime.fromisoformat(end_date.replace('Z', '+00:00'))
-            except ValueError:
-                raise HTTPException(status_code=400, detail=f"Invalid end_date: {end_date}")
-
-        if not start_date:
+        if not start_dt:
             start_dt = end_dt - timedelta(days=30)
-        else:
-            try:
-                start_dt = datetime.fromisoformat(start_date.replace('Z', '+00:00'))
-            except ValueError:
-                raise HTTPException(status_code=400, detail=f"Invalid start_date: {start_date}")
-
-        # Build base query for date range
-        base_query = session.query(AuditLog).filter(
-            AuditLog.timestamp >= start_dt,
-            AuditLog.timestamp <= end_dt
-        )
 
-        # Calculate consent metrics
-        from spendsense.services.compliance_metrics import ComplianceMetricsCalculator
-        calculator = ComplianceMetricsCalculator(session)
-
-        consent_metrics = calculator.calculate_consent_metrics(start_dt, end_dt)
-        eligibility_metrics = calculator.calculate_eligibility_metrics(start_dt, end_dt)
-        tone_metrics = calculator.calculate_tone_metrics(start_dt, end_dt)
-        operator_metrics = calculator.calculate_operator_metrics(start_dt, end_dt)
+        # The four calculators are independent; each runs on its own
+        # session and pooled connection so their queries overlap
+        db_started = time.perf_counter()
+        consent, eligibility, tone, operator = await asyncio.gather(*(
+            run_in_threadpool(_run_compliance_calculator, method, start_dt, end_dt)
+            for method in (
+                ComplianceMetricsCalculator.calculate_consent_metrics,
+                ComplianceMetricsCalculator.calculate_eligibility_metrics,
+                ComplianceMetricsCalculator.calculate_tone_metrics,
+                ComplianceMetricsCalculator.calculate_operator_metrics,
+            )
+        ))
+        response.headers["Server-Timing"] = _server_timing(db=time.perf_counter() - db_started)
 
         logger.info(f"Compliance metrics retrieved by {current_operator.username} for {start_dt.date()} to {end_dt.date()}")
 
-        return ComplianceMetricsResponse(
-            consent_metrics=consent_metrics,
-            eligibility_metrics=eligibility_metrics,
-            tone_metrics=tone_metrics,
-            operator_metrics=operator_metrics,
+        metrics = _compliance_metrics_cache[cache_key] = ComplianceMetricsResponse(
+            consent_metrics=consent,
+            eligibility_metrics=eligibility,
+            tone_metrics=tone,
+            operator_metrics=operator,
             date_range={
                 "start_date": start_dt.isoformat(),
                 "end_date": end_dt.isoformat()
             }
         )
+        return metrics
 
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"Failed to calculate compliance metrics: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Metrics calculation failed: {str(e)}")
-    finally:
-        session.close()
+
+
+def _run_compliance_calculator(
+    calculation: Callable[[ComplianceMetricsCalculator, datetime, datetime], Dict[str, Any]],
+    start_dt: datetime,
+    end_dt: datetime
+) -> Dict[str, Any]:
+    """Run one compliance calculation on a dedicated session (blocking; run via threadpool)."""
+    with get_db_session() as session:
+        return calculation(ComplianceMetricsCalculator(session), start_dt, end_dt)
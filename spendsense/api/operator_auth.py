@@ -4,24 +4,38 @@ Operator authentication endpoints (Epic 6 - Story 6.1).
 Provides login, logout, and token refresh functionality for operator access.
 """
 
+import math
+import os
+import queue
+import secrets
+import threading
+import time
 import uuid
 import sqlite3
+import orjson
 import structlog
-from datetime import datetime, timezone, timedelta
+from contextlib import contextmanager
+from functools import partial
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional, Dict, Any
-from collections import defaultdict
+from typing import ContextManager, Iterator, Optional, Dict, Any, Tuple, Union
+from cachetools import TTLCache
 
 from fastapi import APIRouter, HTTPException, status, Request
 from pydantic import BaseModel, Field
+from starlette.concurrency import run_in_threadpool
 
 from spendsense.auth.operator import (
     get_operator_by_username,
+    hash_password,
+    password_needs_rehash,
     update_last_login,
+    update_password_hash,
     verify_password,
     create_operator,
     save_operator,
 )
+from spendsense.config.database import SQLITE_PRAGMAS
 from spendsense.auth.tokens import (
     create_access_token,
     create_refresh_token,
@@ -34,10 +48,25 @@ logger = structlog.get_logger(__name__)
 # Router for operator auth endpoints
 router = APIRouter(prefix="/api/operator", tags=["operator-auth"])
 
-# Rate limiting storage (in-memory for demo; use Redis in production)
-login_attempts: Dict[str, list] = defaultdict(list)
+# Rate limiting: fixed-window failure counters, client_id -> (window_start, failures).
+# Entries expire with the window, so idle clients do not accumulate.
 RATE_LIMIT_ATTEMPTS = 5
 RATE_LIMIT_WINDOW_MINUTES = 15
+RATE_LIMIT_WINDOW_SECONDS = RATE_LIMIT_WINDOW_MINUTES * 60
+login_attempts: TTLCache = TTLCache(maxsize=100_000, ttl=RATE_LIMIT_WINDOW_SECONDS)
+
+# Unknown usernames are checked against this hash (same cost as real ones)
+# so response time does not reveal whether an account exists
+_DUMMY_HASH = hash_password(secrets.token_urlsafe(16))
+
+# Pooled connections live for the process, so sqlite3's per-connection
+# statement cache keeps this insert prepared across requests
+STATEMENT_CACHE_SIZE = 128
+_AUTH_AUDIT_INSERT = (
+    "INSERT INTO auth_audit_log "
+    "(log_id, operator_id, event_type, endpoint, ip_address, user_agent, timestamp, details) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+)
 
 
 # ===== Request/Response Models =====
@@ -95,30 +124,123 @@ class CreateOperatorResponse(BaseModel):
     message: str
 
 
-# ===== Helper Functions =====
+# ===== Connection Pool =====
 
-def get_db_connection() -> sqlite3.Connection:
-    """Get database connection."""
-    # Get path relative to project root
-    db_path = Path(__file__).parent.parent.parent / "data" / "processed" / "spendsense.db"
-    if not db_path.exists():
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Database not found at {db_path}"
+class ConnectionPool:
+    """
+    Process-wide SQLite connections: one writer plus a fixed set of readers.
+
+    SQLite allows a single writer at a time, so writes are serialized on one
+    connection while reads check out from a queue. Connections are opened
+    lazily and tuned with SQLITE_PRAGMAS on first use.
+    """
+
+    def __init__(self, db_path: Path, readers: int):
+        self.db_path = db_path
+        self._writer: Optional[sqlite3.Connection] = None
+        self._writer_lock = threading.Lock()
+        # Unopened slots are None until first checkout
+        self._readers: "queue.Queue[Optional[sqlite3.Connection]]" = queue.Queue()
+        for _ in range(readers):
+            self._readers.put(None)
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self.db_path.exists():
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Database not found at {self.db_path}"
+            )
+        # Checkouts are exclusive, so a connection may move between threads
+        conn = sqlite3.connect(
+            str(self.db_path),
+            check_same_thread=False,
+            cached_statements=STATEMENT_CACHE_SIZE,
         )
-    return sqlite3.connect(str(db_path))
+        for pragma in SQLITE_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    @contextmanager
+    def writer(self) -> Iterator[sqlite3.Connection]:
+        """Check out the writer connection; uncommitted work is rolled back on return."""
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = self._connect()
+            try:
+                yield self._writer
+            finally:
+                self._writer.rollback()
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        """Check out a reader connection, blocking while all readers are in use."""
+        conn = self._readers.get()
+        try:
+            if conn is None:
+                conn = self._connect()
+            yield conn
+        finally:
+            self._readers.put(conn)
+
+
+# Get path relative to project root
+_pool = ConnectionPool(
+    Path(__file__).parent.parent.parent / "data" / "processed" / "spendsense.db",
+    readers=os.cpu_count() or 4
+)
+
+
+# ===== Helper Functions =====
+
+def get_db_connection() -> ContextManager[sqlite3.Connection]:
+    """Check out the pooled writer connection (use as a context manager)."""
+    return _pool.writer()
+
+
+# (unix second, ISO-8601 string) of the last formatted audit timestamp
+_timestamp_cache: Tuple[int, str] = (0, "")
+
+
+def utc_timestamp() -> str:
+    """
+    Current UTC time as ISO-8601, at one-second resolution.
+
+    The formatted string is reused for every call within the same second,
+    so bursts of audit rows skip repeated datetime construction.
+    """
+    global _timestamp_cache
+    second = int(time.time())
+    cached_second, formatted = _timestamp_cache
+    if second != cached_second:
+        formatted = datetime.fromtimestamp(second, timezone.utc).isoformat()
+        _timestamp_cache = (second, formatted)
+    return formatted
+
+
+def get_client_info(request: Request) -> Tuple[str, str]:
+    """Extract (client IP, user agent) once per request for audit logging."""
+    client_ip = request.client.host if request.client else "unknown"
+    return client_ip, request.headers.get("user-agent", "unknown")
 
 
-def get_client_identifier(request: Request, username: str) -> str:
+def get_client_identifier(client_ip: str, username: str) -> str:
     """
     Get unique client identifier for rate limiting.
 
     Combines IP address and username for tracking login attempts.
     """
-    client_ip = request.client.host if request.client else "unknown"
     return f"{client_ip}:{username}"
 
 
+def _current_window(client_id: str) -> Tuple[float, int]:
+    """Return (window_start, failures) for the client's current rate-limit window."""
+    now = time.monotonic()
+    window = login_attempts.get(client_id)
+    if window is None or now - window[0] >= RATE_LIMIT_WINDOW_SECONDS:
+        return now, 0
+    return window
+
+
 def check_rate_limit(client_id: str) -> bool:
     """
     Check if client has exceeded rate limit.
@@ -126,25 +248,35 @@ def check_rate_limit(client_id: str) -> bool:
     Returns:
         True if client is within rate limit, False if exceeded
     """
-    now = datetime.now(timezone.utc)
-    cutoff = now - timedelta(minutes=RATE_LIMIT_WINDOW_MINUTES)
+    return _current_window(client_id)[1] < RATE_LIMIT_ATTEMPTS
+
+
+def record_login_attempt(client_id: str) -> int:
+    """
+    Record a failed login attempt for rate limiting.
 
-    # Remove old attempts
-    login_attempts[client_id] = [
-        attempt for attempt in login_attempts[client_id]
-        if attempt > cutoff
-    ]
+    Returns:
+        Attempts remaining in the current window
+    """
+    window_start, failures = _current_window(client_id)
+    login_attempts[client_id] = (window_start, failures + 1)
+    return max(RATE_LIMIT_ATTEMPTS - failures - 1, 0)
 
-    # Check if limit exceeded
-    if len(login_attempts[client_id]) >= RATE_LIMIT_ATTEMPTS:
-        return False
 
-    return True
+def rate_limit_retry_after(client_id: str) -> int:
+    """Seconds until the client's current rate-limit window resets."""
+    window_start, _ = _current_window(client_id)
+    elapsed = time.monotonic() - window_start
+    return max(math.ceil(RATE_LIMIT_WINDOW_SECONDS - elapsed), 1)
 
 
-def record_login_attempt(client_id: str) -> None:
-    """Record a failed login attempt for rate limiting."""
-    login_attempts[client_id].append(datetime.now(timezone.utc))
+def _serialize_details(details: Optional[Union[Dict[str, Any], str]]) -> Optional[str]:
+    """Compact JSON for the details column; pre-serialized strings pass through."""
+    if not details:
+        return None
+    if isinstance(details, str):
+        return details
+    return orjson.dumps(details).decode()
 
 
 def log_auth_event(
@@ -154,11 +286,15 @@ def log_auth_event(
     endpoint: Optional[str] = None,
     ip_address: Optional[str] = None,
     user_agent: Optional[str] = None,
-    details: Optional[Dict[str, Any]] = None,
+    details: Optional[Union[Dict[str, Any], str]] = None,
+    commit: bool = False,
 ) -> None:
     """
     Log authentication event to audit log.
 
+    The insert joins the connection's open transaction; callers commit it
+    together with their other writes (or pass commit=True).
+
     Args:
         db: Database connection
         event_type: Type of event (login_success, login_failure, logout, unauthorized_access)
@@ -166,18 +302,14 @@ def log_auth_event(
         endpoint: API endpoint
         ip_address: Client IP address
         user_agent: Client user agent
-        details: Additional event details (stored as JSON)
+        details: Additional event details (stored as compact JSON), or an
+            already-serialized JSON string which is stored verbatim
+        commit: Commit immediately after the insert
     """
-    import json
-
     log_id = f"log_{uuid.uuid4().hex[:16]}"
-    cursor = db.cursor()
 
-    cursor.execute(
-        """
-        INSERT INTO auth_audit_log (log_id, operator_id, event_type, endpoint, ip_address, user_agent, timestamp, details)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """,
+    db.execute(
+        _AUTH_AUDIT_INSERT,
         (
             log_id,
             operator_id,
@@ -185,11 +317,12 @@ def log_auth_event(
             endpoint,
             ip_address,
             user_agent,
-            datetime.now(timezone.utc).isoformat(),
-            json.dumps(details) if details else None,
+            utc_timestamp(),
+            _serialize_details(details),
         )
     )
-    db.commit()
+    if commit:
+        db.commit()
 
     # Also log to structlog
     logger.info(
@@ -201,6 +334,12 @@ def log_auth_event(
     )
 
 
+def log_and_commit(event_type: str, **kwargs: Any) -> None:
+    """Log a standalone auth event in its own transaction on the pooled writer."""
+    with get_db_connection() as db:
+        log_auth_event(db, event_type, commit=True, **kwargs)
+
+
 # ===== Endpoints =====
 
 @router.post("/login", response_model=LoginResponse, status_code=status.HTTP_200_OK)
@@ -223,86 +362,75 @@ async def login(request: Request, login_data: LoginRequest):
         HTTPException 429: Too many login attempts
         HTTPException 500: Database error
     """
-    db = None
     try:
-        db = get_db_connection()
-
         # Extract client info
-        client_ip = request.client.host if request.client else "unknown"
-        user_agent = request.headers.get("user-agent", "unknown")
-        client_id = get_client_identifier(request, login_data.username)
+        client_ip, user_agent = get_client_info(request)
+        client_id = get_client_identifier(client_ip, login_data.username)
+        log_failure = partial(
+            log_and_commit,
+            event_type="login_failure",
+            endpoint="/api/operator/login",
+            ip_address=client_ip,
+            user_agent=user_agent
+        )
 
         # Check rate limiting (AC: #8)
         if not check_rate_limit(client_id):
             # Log failed attempt
-            log_auth_event(
-                db,
-                event_type="login_failure",
-                endpoint="/api/operator/login",
-                ip_address=client_ip,
-                user_agent=user_agent,
-                details={"username": login_data.username, "reason": "rate_limit_exceeded"}
-            )
+            log_failure(details={"username": login_data.username, "reason": "rate_limit_exceeded"})
 
             raise HTTPException(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                 detail="Too many login attempts. Please try again later.",
-                headers={"Retry-After": str(RATE_LIMIT_WINDOW_MINUTES * 60)}
+                headers={
+                    "Retry-After": str(rate_limit_retry_after(client_id)),
+                    "X-RateLimit-Remaining": "0",
+                }
             )
 
         # Retrieve operator
-        operator = get_operator_by_username(db, login_data.username)
+        with _pool.reader() as db:
+            operator = get_operator_by_username(db, login_data.username)
 
         if operator is None:
+            # Pay the same hashing cost as a real account before failing
+            await run_in_threadpool(verify_password, login_data.password, _DUMMY_HASH)
+
             # Record failed attempt for rate limiting
-            record_login_attempt(client_id)
+            remaining = record_login_attempt(client_id)
 
             # Log failed attempt
-            log_auth_event(
-                db,
-                event_type="login_failure",
-                endpoint="/api/operator/login",
-                ip_address=client_ip,
-                user_agent=user_agent,
-                details={"username": login_data.username, "reason": "user_not_found"}
-            )
+            log_failure(details={"username": login_data.username, "reason": "user_not_found"})
 
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid username or password"
+                detail="Invalid username or password",
+                headers={"X-RateLimit-Remaining": str(remaining)}
             )
 
-        # Verify password
-        if not verify_password(login_data.password, operator.password_hash):
+        # Verify password in the threadpool: hashing is slow CPU work that
+        # would otherwise stall every request on the event loop
+        if not await run_in_threadpool(verify_password, login_data.password, operator.password_hash):
             # Record failed attempt for rate limiting
-            record_login_attempt(client_id)
+            remaining = record_login_attempt(client_id)
 
             # Log failed attempt
-            log_auth_event(
-                db,
-                event_type="login_failure",
+            log_failure(
                 operator_id=operator.operator_id,
-                endpoint="/api/operator/login",
-                ip_address=client_ip,
-                user_agent=user_agent,
                 details={"username": login_data.username, "reason": "invalid_password"}
             )
 
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid username or password"
+                detail="Invalid username or password",
+                headers={"X-RateLimit-Remaining": str(remaining)}
             )
 
         # Check if operator is active
         if not operator.is_active:
             # Log failed attempt
-            log_auth_event(
-                db,
-                event_type="login_failure",
+            log_failure(
                 operator_id=operator.operator_id,
-                endpoint="/api/operator/login",
-                ip_address=client_ip,
-                user_agent=user_agent,
                 details={"username": login_data.username, "reason": "account_inactive"}
             )
 
@@ -315,25 +443,33 @@ async def login(request: Request, login_data: LoginRequest):
         access_token = create_access_token(operator.operator_id, operator.username, operator.role)
         refresh_token = create_refresh_token(operator.operator_id, operator.username, operator.role)
 
-        # Update last login timestamp
-        update_last_login(db, operator.operator_id)
-
         # Clear rate limit for successful login
-        if client_id in login_attempts:
-            del login_attempts[client_id]
+        login_attempts.pop(client_id, None)
 
-        # Log successful login (AC: #6)
-        log_auth_event(
-            db,
-            event_type="login_success",
-            operator_id=operator.operator_id,
-            endpoint="/api/operator/login",
-            ip_address=client_ip,
-            user_agent=user_agent,
-            details={"username": login_data.username}
-        )
+        # Upgrade legacy bcrypt (or outdated argon2) hashes while the
+        # plaintext is at hand
+        new_hash = None
+        if password_needs_rehash(operator.password_hash):
+            new_hash = await run_in_threadpool(hash_password, login_data.password)
+
+        # Last-login update and audit row commit together (one fsync)
+        with get_db_connection() as db, db:
+            update_last_login(db, operator.operator_id, commit=False)
+            if new_hash:
+                update_password_hash(db, operator.operator_id, new_hash, commit=False)
 
-        return LoginResponse(
+            # Log successful login (AC: #6)
+            log_auth_event(
+                db,
+                event_type="login_success",
+                operator_id=operator.operator_id,
+                endpoint="/api/operator/login",
+                ip_address=client_ip,
+                user_agent=user_agent,
+                details={"username": login_data.username}
+            )
+
+        return LoginResponse.model_construct(
             access_token=access_token,
             refresh_token=refresh_token,
             operator_id=operator.operator_id,
@@ -348,9 +484,6 @@ async def login(request: Request, login_data: LoginRequest):
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An error occurred during login"
         )
-    finally:
-        if db:
-            db.close()
 
 
 @router.post("/refresh", response_model=RefreshResponse, status_code=status.HTTP_200_OK)
@@ -384,7 +517,7 @@ async def refresh_token_endpoint(refresh_data: RefreshRequest):
         token_data.role
     )
 
-    return RefreshResponse(access_token=access_token)
+    return RefreshResponse.model_construct(access_token=access_token)
 
 
 @router.post("/logout", response_model=LogoutResponse, status_code=status.HTTP_200_OK)
@@ -404,21 +537,18 @@ async def logout(request: Request):
     # In production, would invalidate session in database/cache
     # For now, just log the event
 
-    db = None
     try:
-        db = get_db_connection()
-
         # Extract client info
-        client_ip = request.client.host if request.client else "unknown"
-        user_agent = request.headers.get("user-agent", "unknown")
+        client_ip, user_agent = get_client_info(request)
 
         # Try to extract operator ID from Authorization header
         auth_header = request.headers.get("authorization")
         operator_id = None
         if auth_header:
             try:
-                token = auth_header.split()[1] if len(auth_header.split()) == 2 else None
-                if token:
+                # "Bearer <token>": partition avoids building split() lists
+                scheme, sep, token = auth_header.partition(" ")
+                if sep and scheme.lower() == "bearer" and token and " " not in token:
                     token_data = verify_token(token, expected_type="access")
                     if token_data:
                         operator_id = token_data.operator_id
@@ -426,8 +556,7 @@ async def logout(request: Request):
                 pass
 
         # Log logout event (AC: #6)
-        log_auth_event(
-            db,
+        log_and_commit(
             event_type="logout",
             operator_id=operator_id,
             endpoint="/api/operator/logout",
@@ -441,9 +570,6 @@ async def logout(request: Request):
         logger.error("logout_error", error=str(e), exc_info=True)
         # Don't fail logout on error - return success anyway
         return LogoutResponse(message="Logged out successfully")
-    finally:
-        if db:
-            db.close()
 
 
 @router.post("/create", response_model=CreateOperatorResponse, status_code=status.HTTP_201_CREATED)
@@ -465,43 +591,42 @@ async def create_operator_endpoint(request: Request, operator_data: CreateOperat
         HTTPException 400: Username already exists or invalid data
         HTTPException 500: Database error
     """
-    db = None
     try:
-        db = get_db_connection()
-
-        # Check if username already exists
-        existing = get_operator_by_username(db, operator_data.username)
-        if existing:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Username '{operator_data.username}' already exists"
-            )
-
-        # Create operator
-        operator = create_operator(
+        # Create operator (hashing runs before the writer is checked out)
+        operator = await run_in_threadpool(
+            create_operator,
             username=operator_data.username,
             password=operator_data.password,
             role=operator_data.role
         )
 
-        # Save to database
-        save_operator(db, operator)
+        client_ip, user_agent = get_client_info(request)
 
-        # Log event
-        client_ip = request.client.host if request.client else "unknown"
-        user_agent = request.headers.get("user-agent", "unknown")
+        # The insert and its audit row commit together
+        with get_db_connection() as db, db:
+            # Check if username already exists
+            existing = get_operator_by_username(db, operator_data.username)
+            if existing:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Username '{operator_data.username}' already exists"
+                )
 
-        log_auth_event(
-            db,
-            event_type="operator_created",
-            operator_id=operator.operator_id,
-            endpoint="/api/operator/create",
-            ip_address=client_ip,
-            user_agent=user_agent,
-            details={"username": operator.username, "role": operator.role}
-        )
+            # Save to database
+            save_operator(db, operator, commit=False)
+
+            # Log event
+            log_auth_event(
+                db,
+                event_type="operator_created",
+                operator_id=operator.operator_id,
+                endpoint="/api/operator/create",
+                ip_address=client_ip,
+                user_agent=user_agent,
+                details={"username": operator.username, "role": operator.role}
+            )
 
-        return CreateOperatorResponse(
+        return CreateOperatorResponse.model_construct(
             operator_id=operator.operator_id,
             username=operator.username,
             role=operator.role,
@@ -522,6 +647,3 @@ async def create_operator_endpoint(request: Request, operator_data: CreateOperat
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An error occurred creating operator"
         )
-    finally:
-        if db:
-            db.close()
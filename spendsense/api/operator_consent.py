@@ -5,24 +5,47 @@ Provides batch consent operations, consent history, and user filtering
 for compliance officers and administrators.
 """
 
-from typing import List, Optional
+from functools import lru_cache
+from typing import Annotated, Dict, List, Optional
 from datetime import datetime, timedelta
 from pathlib import Path
 import json
+import uuid
 
 from fastapi import APIRouter, HTTPException, Query, Depends
 from pydantic import BaseModel, Field
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import case, func, select, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session, sessionmaker
 
 from spendsense.auth.rbac import require_role
 from spendsense.auth.tokens import TokenData
-from spendsense.guardrails.consent import ConsentService, ConsentStatus
-from spendsense.config.database import get_db_path
-from spendsense.ingestion.database_writer import User, AuditLog
+from spendsense.config.database import get_db_path, get_engine
+from spendsense.ingestion.database_writer import User, AuditLog, Operator
 
 router = APIRouter(prefix="/api/operator/consent", tags=["Operator Consent"])
 
+# Users updated per bulk UPDATE / multi-row audit INSERT in batch operations
+BATCH_CHUNK_SIZE = 500
+
+
+@lru_cache(maxsize=None)
+def _session_factory(db_path: Path) -> sessionmaker:
+    """
+    Session factory bound to the shared pooled engine for db_path.
+
+    The database file is checked once, when the factory is first built;
+    a missing file raises and is not cached, so it is re-checked next time.
+    """
+    if not db_path.exists():
+        raise HTTPException(status_code=500, detail="Database not found")
+    return sessionmaker(bind=get_engine(db_path))
+
+
+def _open_session() -> Session:
+    """Open a session on the pooled engine for the configured database."""
+    return _session_factory(get_db_path())()
+
 
 # Request/Response Models
 class BatchConsentRequest(BaseModel):
@@ -55,6 +78,7 @@ class ConsentUserListResponse(BaseModel):
     total: int
     users: List[ConsentUserInfo]
     filters_applied: dict
+    next_cursor: Optional[str] = None
 
 
 class ConsentHistoryEntry(BaseModel):
@@ -106,54 +130,37 @@ async def batch_consent_change(
             detail=f"Invalid consent_status: {request.consent_status}"
         )
 
-    db_path = get_db_path()
-    if not db_path.exists():
-        raise HTTPException(status_code=500, detail="Database not found")
-
-    engine = create_engine(f"sqlite:///{db_path}")
-    Session = sessionmaker(bind=engine)
-
-    success_count = 0
-    failure_count = 0
+    # Duplicate IDs would only re-apply the same change
+    user_ids = list(dict.fromkeys(request.user_ids))
+    timestamp = datetime.utcnow()
     failed_users = []
 
-    with Session() as session:
-        consent_service = ConsentService(session)
-
-        for user_id in request.user_ids:
+    with _open_session() as session:
+        for start in range(0, len(user_ids), BATCH_CHUNK_SIZE):
+            chunk = user_ids[start:start + BATCH_CHUNK_SIZE]
             try:
-                # Record consent for this user
-                consent_status_enum = ConsentStatus(request.consent_status)
-                consent_service.record_consent(
-                    user_id=user_id,
-                    consent_status=consent_status_enum,
-                    consent_version=request.consent_version
-                )
-
-                # Log to audit trail
-                audit_entry = AuditLog(
-                    event_type="consent_changed_batch",
-                    user_id=user_id,
-                    operator_id=current_operator.operator_id,
-                    timestamp=datetime.utcnow(),
-                    event_data={
-                        "new_status": request.consent_status,
-                        "reason": request.reason,
-                        "consent_version": request.consent_version,
-                        "batch_operation": True
-                    }
+                failed_users.extend(
+                    _apply_consent_chunk(session, chunk, request, current_operator.operator_id, timestamp)
                 )
-                session.add(audit_entry)
-                success_count += 1
-
-            except Exception as e:
-                failure_count += 1
-                failed_users.append({
-                    "user_id": user_id,
-                    "error": str(e)
-                })
-
-        session.commit()
+                session.commit()
+            except SQLAlchemyError:
+                # Retry the failing chunk row by row to isolate the bad user IDs
+                session.rollback()
+                for user_id in chunk:
+                    try:
+                        failed_users.extend(
+                            _apply_consent_chunk(session, [user_id], request, current_operator.operator_id, timestamp)
+                        )
+                        session.commit()
+                    except SQLAlchemyError as e:
+                        session.rollback()
+                        failed_users.append({
+                            "user_id": user_id,
+                            "error": str(e)
+                        })
+
+    failure_count = len(failed_users)
+    success_count = len(user_ids) - failure_count
 
     return BatchConsentResponse(
         success_count=success_count,
@@ -163,18 +170,101 @@ async def batch_consent_change(
     )
 
 
+def _apply_consent_chunk(
+    session: Session,
+    user_ids: List[str],
+    request: BatchConsentRequest,
+    operator_id: str,
+    timestamp: datetime
+) -> List[dict]:
+    """
+    Apply a batch consent change to one chunk of users.
+
+    Issues one SELECT for the previous statuses, one bulk UPDATE and one
+    multi-row audit INSERT, leaving the commit to the caller.
+
+    Returns:
+        Failure entries for user IDs that do not exist
+    """
+    previous: Dict[str, Optional[str]] = dict(session.execute(
+        select(User.user_id, User.consent_status).where(User.user_id.in_(user_ids))
+    ).all())
+    failed = [
+        {"user_id": user_id, "error": f"User {user_id} not found"}
+        for user_id in user_ids
+        if user_id not in previous
+    ]
+    if not previous:
+        return failed
+
+    session.execute(
+        update(User)
+        .where(User.user_id.in_(list(previous)))
+        .values(
+            consent_status=request.consent_status,
+            consent_timestamp=timestamp,
+            consent_version=request.consent_version
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+    audit_rows = []
+    for user_id, old_status in previous.items():
+        # Compliance reporting counts actual status changes (Story 6.5)
+        if old_status != request.consent_status:
+            audit_rows.append(_audit_row("consent_changed", user_id, operator_id, timestamp, {
+                "old_status": old_status or "opted_out",
+                "new_status": request.consent_status,
+                "consent_version": request.consent_version,
+                "changed_by": operator_id
+            }))
+        audit_rows.append(_audit_row("consent_changed_batch", user_id, operator_id, timestamp, {
+            "old_status": old_status,
+            "new_status": request.consent_status,
+            "reason": request.reason,
+            "consent_version": request.consent_version,
+            "batch_operation": True
+        }))
+    # Core insert of plain dicts: one multi-row INSERT, no ORM bookkeeping
+    session.execute(AuditLog.__table__.insert(), audit_rows)
+
+    return failed
+
+
+def _event_field(key: str):
+    """SQL expression for one event_data field; NULL when event_data is not valid JSON."""
+    return case(
+        (func.json_valid(AuditLog.event_data) == 1, func.json_extract(AuditLog.event_data, f"$.{key}"))
+    )
+
+
+def _audit_row(event_type: str, user_id: str, operator_id: str, timestamp: datetime, event_data: dict) -> dict:
+    """Build one comprehensive_audit_log row for a bulk insert."""
+    return {
+        "log_id": f"audit_{uuid.uuid4().hex[:12]}",
+        "event_type": event_type,
+        "user_id": user_id,
+        "operator_id": operator_id,
+        "timestamp": timestamp,
+        "event_data": json.dumps(event_data)
+    }
+
+
 @router.get("/users", response_model=ConsentUserListResponse)
 async def get_users_with_consent_filter(
     consent_status: Optional[str] = Query(None, description="Filter by: 'opted_in', 'opted_out', or None for all"),
     changed_since: Optional[str] = Query(None, description="Filter by changes since date (ISO format)"),
     limit: int = Query(50, ge=1, le=500, description="Results per page"),
     offset: int = Query(0, ge=0, description="Pagination offset"),
-    current_operator: TokenData = Depends(require_role("reviewer"))
+    current_operator: TokenData = Depends(require_role("reviewer")),
+    after_user_id: Annotated[Optional[str], Query(description="Keyset cursor: next_cursor from the previous page")] = None,
 ):
     """
     Get users with consent status filters.
 
-    Supports filtering by consent status and recent changes.
+    Supports filtering by consent status and recent changes. Pages are
+    addressed by offset or, for deep pagination, by passing the previous
+    page's next_cursor as after_user_id (offset is then ignored).
     **Requires reviewer or admin role.**
 
     Args:
@@ -183,6 +273,7 @@ async def get_users_with_consent_filter(
         limit: Results per page
         offset: Pagination offset
         current_operator: Operator info from JWT token
+        after_user_id: Return users ordered after this user_id
 
     Returns:
         ConsentUserListResponse with filtered user list
@@ -199,14 +290,7 @@ async def get_users_with_consent_filter(
             detail=f"Invalid consent_status filter: {consent_status}"
         )
 
-    db_path = get_db_path()
-    if not db_path.exists():
-        raise HTTPException(status_code=500, detail="Database not found")
-
-    engine = create_engine(f"sqlite:///{db_path}")
-    Session = sessionmaker(bind=engine)
-
-    with Session() as session:
+    with _open_session() as session:
         # Build query
         query = session.query(User)
 
@@ -225,15 +309,33 @@ async def get_users_with_consent_filter(
                     detail=f"Invalid date format: {changed_since}. Use ISO format (YYYY-MM-DD)"
                 )
 
-        # Get total count
-        total = query.count()
-
         # Apply pagination
-        users = query.order_by(User.user_id).offset(offset).limit(limit).all()
+        if after_user_id is not None:
+            # Keyset: seek straight past the cursor on the user_id index
+            # instead of scanning and discarding offset rows
+            users = query.filter(User.user_id > after_user_id).order_by(
+                User.user_id
+            ).limit(limit).all()
+            total = query.with_entities(func.count(User.user_id)).scalar()
+        else:
+            # Every row carries the filtered total as a window column so the
+            # count and the page come from one query
+            rows = query.add_columns(func.count().over()).order_by(
+                User.user_id
+            ).offset(offset).limit(limit).all()
+            users = [user for user, _ in rows]
+            if rows:
+                total = rows[0][1]
+            elif offset:
+                # Past the last page: no rows carry the window count
+                total = query.with_entities(func.count(User.user_id)).scalar()
+            else:
+                total = 0
 
         # Build response
+        # Rows come straight from the users table, so skip per-field validation
         user_list = [
-            ConsentUserInfo(
+            ConsentUserInfo.model_construct(
                 user_id=user.user_id,
                 name=user.name,
                 consent_status=user.consent_status,
@@ -243,31 +345,38 @@ async def get_users_with_consent_filter(
             for user in users
         ]
 
-        return ConsentUserListResponse(
+        return ConsentUserListResponse.model_construct(
             total=total,
             users=user_list,
             filters_applied={
                 "consent_status": consent_status,
                 "changed_since": changed_since,
                 "limit": limit,
-                "offset": offset
-            }
+                "offset": offset,
+                "after_user_id": after_user_id
+            },
+            next_cursor=users[-1].user_id if len(users) == limit else None
         )
 
 
 @router.get("/{user_id}/history", response_model=ConsentHistoryResponse)
 async def get_consent_history(
     user_id: str,
+    limit: Annotated[int, Query(ge=1, le=1000, description="Entries per page")] = 200,
+    offset: Annotated[int, Query(ge=0, description="Pagination offset")] = 0,
     current_operator: TokenData = Depends(require_role("reviewer"))
 ):
     """
     Get consent change history for a user.
 
-    Returns timeline of all consent changes from audit log.
+    Returns timeline of consent changes from audit log, newest first,
+    one page at a time; total_changes counts every change.
     **Requires reviewer or admin role.**
 
     Args:
         user_id: User identifier
+        limit: Entries per page
+        offset: Pagination offset
         current_operator: Operator info from JWT token
 
     Returns:
@@ -278,58 +387,60 @@ async def get_consent_history(
         HTTPException 403: Forbidden
         HTTPException 404: User not found
     """
-    db_path = get_db_path()
-    if not db_path.exists():
-        raise HTTPException(status_code=500, detail="Database not found")
-
-    engine = create_engine(f"sqlite:///{db_path}")
-    Session = sessionmaker(bind=engine)
-
-    with Session() as session:
+    with _open_session() as session:
         # Verify user exists
         user = session.query(User).filter(User.user_id == user_id).first()
         if not user:
             raise HTTPException(status_code=404, detail=f"User not found: {user_id}")
 
-        # Get consent changes from audit log
-        consent_logs = session.query(AuditLog).filter(
+        # Get consent changes from audit log, joined to the acting operator
+        # so names resolve in the same query; SQLite extracts the three
+        # event_data fields, so rows arrive as plain tuples
+        consent_logs = session.query(
+            AuditLog.timestamp,
+            AuditLog.operator_id,
+            _event_field('old_status'),
+            func.coalesce(_event_field('new_status'), 'unknown'),
+            _event_field('reason'),
+            Operator.username,
+            func.count().over()
+        ).outerjoin(
+            Operator, AuditLog.operator_id == Operator.operator_id
+        ).filter(
             AuditLog.user_id == user_id,
             AuditLog.event_type.in_(['consent_changed', 'consent_changed_batch'])
-        ).order_by(AuditLog.timestamp.desc()).all()
+        ).order_by(
+            # log_id breaks ties: batch changes write two rows per user with
+            # the same timestamp, and offset pages need a total order
+            AuditLog.timestamp.desc(), AuditLog.log_id.desc()
+        ).offset(offset).limit(limit).all()
 
         # Build history
-        history = []
-        for log in consent_logs:
-            # Parse event_data if it's a JSON string
-            if isinstance(log.event_data, str):
-                try:
-                    event_data = json.loads(log.event_data)
-                except (json.JSONDecodeError, TypeError):
-                    event_data = {}
-            else:
-                event_data = log.event_data or {}
-
-            # Get operator name if available
-            operator_name = None
-            if log.operator_id:
-                from spendsense.auth.operator import Operator
-                operator = session.query(Operator).filter(
-                    Operator.operator_id == log.operator_id
-                ).first()
-                if operator:
-                    operator_name = operator.name
-
-            history.append(ConsentHistoryEntry(
-                timestamp=log.timestamp.isoformat(),
-                old_status=event_data.get('old_status'),
-                new_status=event_data.get('new_status', 'unknown'),
-                changed_by=log.operator_id or 'user',
-                reason=event_data.get('reason'),
+        history = [
+            ConsentHistoryEntry(
+                timestamp=timestamp.isoformat(),
+                old_status=old_status,
+                new_status=new_status,
+                changed_by=operator_id or 'user',
+                reason=reason,
                 operator_name=operator_name
-            ))
+            )
+            for timestamp, operator_id, old_status, new_status, reason, operator_name, _ in consent_logs
+        ]
+
+        if consent_logs:
+            total_changes = consent_logs[0][-1]
+        elif offset:
+            # Past the last page: no rows carry the window count
+            total_changes = session.query(func.count(AuditLog.log_id)).filter(
+                AuditLog.user_id == user_id,
+                AuditLog.event_type.in_(['consent_changed', 'consent_changed_batch'])
+            ).scalar()
+        else:
+            total_changes = 0
 
         return ConsentHistoryResponse(
             user_id=user_id,
             history=history,
-            total_changes=len(history)
+            total_changes=total_changes
         )
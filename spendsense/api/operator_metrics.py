@@ -6,13 +6,32 @@ Integrates all 5 evaluation modules (coverage, explainability, performance,
 auditability, fairness) into the FastAPI operator interface.
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 from fastapi.responses import JSONResponse
-from typing import Dict, List, Optional, Any
+from starlette.concurrency import run_in_threadpool
+from typing import Dict, List, NamedTuple, Optional, Any, Tuple
 from datetime import datetime
 from pathlib import Path
+import asyncio
+import bisect
+import copy
 import json
-import glob
+import os
+import threading
+import time
+
+import orjson
+from cachetools import LRUCache
+
+from spendsense.api.responses import ORJSON_OPTIONS
+
+# Try to import watchdog for change-driven cache invalidation
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
 
 router = APIRouter(
     prefix="/api/operator/metrics",
@@ -20,55 +39,345 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
+# Evaluation modules; each writes {type}_metrics_<timestamp>.json files
+METRIC_TYPES = ('coverage', 'explainability', 'performance', 'auditability', 'fairness')
+
+# Overall score weighting (auditability highest due to compliance importance).
+# Returned as-is in every overall result, so treat it as read-only.
+WEIGHTS = {
+    'coverage': 0.20,
+    'explainability': 0.20,
+    'performance': 0.20,
+    'auditability': 0.25,
+    'fairness': 0.15
+}
+FAIRNESS_SCORES = {'PASS': 100, 'CONCERN': 60, 'FAIL': 30, 'N/A': 50}
+
+# Lower score bounds: bisect_right(bounds, score) indexes the label tuple
+GRADE_BOUNDS, GRADES = (60, 70, 80, 90), ('F', 'D', 'C', 'B', 'A')
+STATUS_BOUNDS, STATUSES = (50, 70), ('FAIL', 'WARNING', 'PASS')
+
+
+def _read_json(path: str) -> Any:
+    """
+    Parse a metrics JSON file with orjson.
+
+    The evaluation modules write with json.dump, which emits NaN/Infinity
+    for undefined statistics; orjson rejects those, so such files fall back
+    to the stdlib parser.
+    """
+    # Unbuffered: FileIO.readall sizes one buffer from fstat and reads the
+    # whole file directly, skipping the BufferedReader copy
+    with open(path, 'rb', buffering=0) as f:
+        raw = f.read()
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return json.loads(raw)
+
+
+class FileMeta(NamedTuple):
+    """Where a metrics document came from; kept apart from the parsed content."""
+    path: str
+    timestamp: str
+
+
+def _with_meta(data: Dict[str, Any], meta: Optional[FileMeta]) -> Dict[str, Any]:
+    """Response document: the shared parsed content plus its file metadata keys."""
+    if meta is None:
+        return data
+    return {**data, '_file_path': meta.path, '_file_timestamp': meta.timestamp}
+
+
+def _summary_view(metrics: Dict[str, Any]) -> Dict[str, Any]:
+    """Key values of the latest metrics for the /summary dashboard widget."""
+    summary = {
+        'overall_score': metrics['overall']['score'],
+        'overall_grade': metrics['overall']['grade'],
+        'overall_status': metrics['overall']['status'],
+        'coverage_rate': None,
+        'explainability_score': None,
+        'performance_latency': None,
+        'compliance_score': None,
+        'fairness_status': None,
+        'timestamp': metrics['timestamp']
+    }
+
+    # Extract key values
+    if metrics.get('coverage'):
+        summary['coverage_rate'] = metrics['coverage'].get('persona_assignment_rate', 0) * 100
+
+    if metrics.get('explainability'):
+        summary['explainability_score'] = metrics['explainability'].get('rationale_quality_score', 0)
+
+    if metrics.get('performance'):
+        summary['performance_latency'] = metrics['performance'].get('average_latency_per_user', 0)
+
+    if metrics.get('auditability'):
+        summary['compliance_score'] = metrics['auditability'].get('overall_compliance_score', 0)
+
+    if metrics.get('fairness'):
+        summary['fairness_status'] = metrics['fairness'].get('overall_fairness_assessment', 'N/A')
+
+    return summary
+
+
+def _components_view(metrics: Dict[str, Any]) -> Dict[str, Any]:
+    """Component scores and weights of the latest metrics for /components."""
+    overall = metrics.get('overall', {})
+    return {
+        'components': overall.get('components', {}),
+        'weights': overall.get('weights', {}),
+        'overall_score': overall.get('score', 0),
+        'timestamp': metrics['timestamp']
+    }
+
 
 class EvaluationMetricsLoader:
-    """Loads evaluation metrics from JSON files for the operator dashboard."""
+    """
+    Loads evaluation metrics from JSON files for the operator dashboard.
+
+    The latest metrics are cached for ttl seconds, so dashboard polling of
+    /latest, /summary and /components shares one scan of eval_dir. Modules
+    with no output yet are cached as None the same way, so an evaluation
+    that has never run costs no filesystem access per poll. While
+    start_watching() has a watchdog observer running, the cache instead
+    lives until a JSON file in eval_dir changes. Parsed
+    files are memoized by (path, mtime, size); metric files are written
+    once, so an unchanged key means unchanged content.
+    """
 
-    def __init__(self, eval_dir: str = "docs/eval"):
+    def __init__(self, eval_dir: str = "docs/eval", ttl: float = 10.0):
         self.eval_dir = Path(eval_dir)
-
-    def get_latest_metrics(self) -> Dict[str, Any]:
-        """Load the latest metrics from all evaluation modules."""
+        self.ttl = ttl
+        # (monotonic load time, views, encoded) of the last get_latest_metrics
+        # scan: the 'latest', 'summary' and 'components' payloads as dicts
+        # and as the JSON bytes the endpoints send
+        self._cache: Optional[Tuple[float, Dict[str, Dict[str, Any]], Dict[str, bytes]]] = None
+        # (monotonic build time, metric_type -> [(mtime, path, size)] newest first)
+        self._history_index: Optional[Tuple[float, Dict[str, List[Tuple[float, str, int]]]]] = None
+        # Bumped by invalidate(); a load that raced an invalidation is not cached
+        self._generation = 0
+        self._observer = None
+        # (path, mtime, size) -> parsed document, shared by latest and history
+        self._parsed: LRUCache = LRUCache(maxsize=64)
+        # Scan entries of all five types -> overall score computed from them
+        self._overall_memo: LRUCache = LRUCache(maxsize=16)
+        # Loads run in the threadpool; LRUCache is not thread-safe
+        self._parsed_lock = threading.Lock()
+
+    def invalidate(self) -> None:
+        """Drop cached metrics so the next call rescans eval_dir."""
+        self._generation += 1
+        self._cache = None
+        self._history_index = None
+
+    def _on_file_event(self, *paths: str) -> None:
+        """Filesystem event callback: any JSON file change invalidates the cache."""
+        if any(path.endswith(".json") for path in paths if path):
+            self.invalidate()
+
+    def start_watching(self) -> bool:
+        """
+        Invalidate on filesystem events instead of expiring after ttl.
+
+        Returns:
+            True if an observer is running; False if watchdog is not
+            installed or eval_dir does not exist (the TTL stays in effect)
+        """
+        if self._observer is not None:
+            return True
+        if not WATCHDOG_AVAILABLE or not self.eval_dir.is_dir():
+            return False
+
+        loader = self
+
+        class _EvalDirHandler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                if not event.is_directory:
+                    loader._on_file_event(event.src_path, getattr(event, 'dest_path', ''))
+
+        observer = Observer()
+        observer.schedule(_EvalDirHandler(), str(self.eval_dir), recursive=False)
+        observer.daemon = True
+        observer.start()
+        self._observer = observer
+        # Anything cached before the watch began may already be stale
+        self.invalidate()
+        return True
+
+    def stop_watching(self) -> None:
+        """Stop the observer and fall back to TTL expiry."""
+        observer, self._observer = self._observer, None
+        if observer is not None:
+            observer.stop()
+            observer.join()
+        self.invalidate()
+
+    def _is_fresh(self, cached_at: float) -> bool:
+        """Cached state is fresh while watched, otherwise for ttl seconds."""
+        return self._observer is not None or time.monotonic() - cached_at < self.ttl
+
+    def _fresh_entry(self) -> Optional[Tuple[float, Dict[str, Dict[str, Any]], Dict[str, bytes]]]:
+        """The cached (load time, views, encoded) entry, or None once stale."""
+        cache = self._cache
+        if cache is not None and self._is_fresh(cache[0]):
+            return cache
+        return None
+
+    def _fresh_views(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Cached latest/summary/components views, or None once stale."""
+        entry = self._fresh_entry()
+        return entry[1] if entry is not None else None
+
+    def _overall_score(
+        self, latest: Dict[str, Tuple[str, float, int]], metrics: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Overall score, memoized by the (path, mtime, size) of each type's file.
+
+        Unchanged files give an unchanged score, so a TTL expiry or an
+        unrelated invalidation reuses it. Results involving an unreadable
+        file are not memoized, so a later successful read is scored.
+        """
+        key = tuple(latest.get(metric_type) for metric_type in METRIC_TYPES)
+        with self._parsed_lock:
+            overall = self._overall_memo.get(key)
+        if overall is None:
+            overall = self._calculate_overall_score(metrics)
+            if not any(metrics[metric_type] and metrics[metric_type].get('error')
+                       for metric_type in METRIC_TYPES):
+                with self._parsed_lock:
+                    self._overall_memo[key] = overall
+        return overall
+
+    def _store_latest(
+        self,
+        latest: Dict[str, Tuple[str, float, int]],
+        loaded: List[Optional[Tuple[Dict[str, Any], Optional[FileMeta]]]],
+        started: float,
+        generation: int,
+    ) -> Tuple[float, Dict[str, Dict[str, Any]], Dict[str, bytes]]:
+        """Assemble per-type documents (in METRIC_TYPES order), score them and cache every view."""
         metrics = {
-            'coverage': self._load_latest('coverage_metrics'),
-            'explainability': self._load_latest('explainability_metrics'),
-            'performance': self._load_latest('performance_metrics'),
-            'auditability': self._load_latest('auditability_metrics'),
-            'fairness': self._load_latest('fairness_metrics'),
-            'timestamp': datetime.now().isoformat()
+            metric_type: None if result is None else _with_meta(*result)
+            for metric_type, result in zip(METRIC_TYPES, loaded)
         }
+        metrics['timestamp'] = datetime.now().isoformat()
 
         # Calculate overall score
-        metrics['overall'] = self._calculate_overall_score(metrics)
+        metrics['overall'] = self._overall_score(latest, metrics)
 
-        return metrics
-
-    def _load_latest(self, metric_type: str) -> Optional[Dict]:
-        """Load the latest JSON file for a specific metric type."""
-        pattern = str(self.eval_dir / f"{metric_type}_*.json")
-        files = glob.glob(pattern)
+        views = {
+            'latest': metrics,
+            'summary': _summary_view(metrics),
+            'components': _components_view(metrics),
+        }
+        encoded = {
+            name: orjson.dumps(view, option=ORJSON_OPTIONS) for name, view in views.items()
+        }
+        entry = (started, views, encoded)
+        if generation == self._generation:
+            self._cache = entry
+        return entry
+
+    def get_latest_views(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Latest metrics with their summary and components projections.
+
+        All three are built together on a miss and cached for ttl seconds
+        (or until invalidated); treat them as read-only.
+        """
+        entry = self._fresh_entry()
+        if entry is None:
+            started, generation = time.monotonic(), self._generation
+            latest = self._scan_latest()
+            loaded = [self._load_latest(latest.get(metric_type)) for metric_type in METRIC_TYPES]
+            entry = self._store_latest(latest, loaded, started, generation)
+        return entry[1]
+
+    async def get_latest_payload_async(self, view: str) -> bytes:
+        """
+        One view ('latest', 'summary' or 'components') as encoded JSON bytes.
+
+        Views are serialized once when cached, so cache hits skip encoding
+        and return without leaving the event loop. On a miss the directory
+        is scanned once in the threadpool, then the five files are read and
+        parsed concurrently, one threadpool task each.
+        """
+        entry = self._fresh_entry()
+        if entry is None:
+            started, generation = time.monotonic(), self._generation
+            latest = await run_in_threadpool(self._scan_latest)
+            loaded = await asyncio.gather(*(
+                run_in_threadpool(self._load_latest, latest.get(metric_type))
+                for metric_type in METRIC_TYPES
+            ))
+            entry = self._store_latest(latest, loaded, started, generation)
+        return entry[2][view]
 
-        if not files:
+    def get_latest_metrics(self) -> Dict[str, Any]:
+        """Load the latest metrics from all evaluation modules (cached for ttl seconds)."""
+        return copy.copy(self.get_latest_views()['latest'])
+
+    def _parse_cached(self, path: str, mtime: float, size: int) -> Dict[str, Any]:
+        """Parsed contents of a metrics file, memoized by (path, mtime, size)."""
+        key = (path, mtime, size)
+        with self._parsed_lock:
+            data = self._parsed.get(key)
+        if data is None:
+            data = _read_json(path)
+            with self._parsed_lock:
+                self._parsed[key] = data
+        return data
+
+    def _scan_latest(self) -> Dict[str, Tuple[str, float, int]]:
+        """
+        Walk eval_dir once and find the newest file of each metric type.
+
+        Returns:
+            metric_type -> (path, mtime, size) of its most recent JSON file
+        """
+        latest: Dict[str, Tuple[str, float, int]] = {}
+        try:
+            with os.scandir(self.eval_dir) as entries:
+                for entry in entries:
+                    name = entry.name
+                    metric_type = name.partition('_')[0]
+                    if (metric_type not in METRIC_TYPES
+                            or not name.startswith(f"{metric_type}_metrics_")
+                            or not name.endswith(".json")):
+                        continue
+                    stat = entry.stat()
+                    if metric_type not in latest or stat.st_mtime > latest[metric_type][1]:
+                        latest[metric_type] = (entry.path, stat.st_mtime, stat.st_size)
+        except FileNotFoundError:
+            pass
+        return latest
+
+    def _load_latest(
+        self, latest: Optional[Tuple[str, float, int]]
+    ) -> Optional[Tuple[Dict[str, Any], Optional[FileMeta]]]:
+        """
+        Load a metric type's latest JSON file, given its (path, mtime, size) from _scan_latest.
+
+        Returns:
+            (document, meta), where document is the memoized parse and must
+            not be mutated; ({'error': ...}, None) if the file is unreadable
+        """
+        if latest is None:
             return None
 
-        # Get most recent file
-        latest_file = max(files, key=lambda f: Path(f).stat().st_mtime)
+        latest_file, mtime, size = latest
 
         try:
-            with open(latest_file, 'r') as f:
-                data = json.load(f)
-                data['_file_path'] = latest_file
-                data['_file_timestamp'] = datetime.fromtimestamp(
-                    Path(latest_file).stat().st_mtime
-                ).isoformat()
-                return data
+            data = self._parse_cached(latest_file, mtime, size)
         except Exception as e:
-            return {'error': str(e)}
+            return {'error': str(e)}, None
+        return data, FileMeta(latest_file, datetime.fromtimestamp(mtime).isoformat())
 
     def _calculate_overall_score(self, metrics: Dict) -> Dict:
         """Calculate weighted overall score from all metrics."""
-        score = 0
-        weight_total = 0
         components = {}
 
         # Coverage (20%)
@@ -77,8 +386,6 @@ class EvaluationMetricsLoader:
                 metrics['coverage'].get('persona_assignment_rate', 0) * 0.5 +
                 metrics['coverage'].get('behavioral_signal_rate', 0) * 0.5
             ) * 100
-            score += coverage_score * 0.20
-            weight_total += 0.20
             components['coverage'] = coverage_score
 
         # Explainability (20%)
@@ -89,8 +396,6 @@ class EvaluationMetricsLoader:
                 (expl.get('rationale_quality_score', 0) / 5.0) * 0.3 +
                 expl.get('decision_trace_completeness', 0) * 0.2
             ) * 100
-            score += explainability_score * 0.20
-            weight_total += 0.20
             components['explainability'] = explainability_score
 
         # Performance (20%)
@@ -99,74 +404,74 @@ class EvaluationMetricsLoader:
             # Invert latency (lower is better)
             avg_latency = perf.get('average_latency_per_user', 0)
             latency_score = max(0, (1 - (avg_latency / 5.0))) * 100  # 5s target
-            score += latency_score * 0.20
-            weight_total += 0.20
             components['performance'] = latency_score
 
         # Auditability (25% - highest weight due to compliance importance)
         if metrics.get('auditability') and not metrics['auditability'].get('error'):
             audit_score = metrics['auditability'].get('overall_compliance_score', 0)
-            score += audit_score * 0.25
-            weight_total += 0.25
             components['auditability'] = audit_score
 
         # Fairness (15%)
         if metrics.get('fairness') and not metrics['fairness'].get('error'):
             fair = metrics['fairness']
             assessment = fair.get('overall_fairness_assessment', 'N/A')
-            fairness_score = {
-                'PASS': 100,
-                'CONCERN': 60,
-                'FAIL': 30,
-                'N/A': 50
-            }.get(assessment, 50)
-            score += fairness_score * 0.15
-            weight_total += 0.15
+            fairness_score = FAIRNESS_SCORES.get(assessment, 50)
             components['fairness'] = fairness_score
 
-        # Normalize if weights don't add up to 1.0
-        if weight_total > 0:
-            score = score / weight_total
+        # Weighted mean over the components present, so missing modules
+        # renormalize the remaining weights
+        weight_total = sum(WEIGHTS[name] for name in components)
+        score = (
+            sum(value * WEIGHTS[name] for name, value in components.items()) / weight_total
+            if weight_total > 0 else 0
+        )
 
         # Determine grade and status
-        grade = 'A' if score >= 90 else 'B' if score >= 80 else 'C' if score >= 70 else 'D' if score >= 60 else 'F'
-        status = 'PASS' if score >= 70 else 'WARNING' if score >= 50 else 'FAIL'
+        grade = GRADES[bisect.bisect_right(GRADE_BOUNDS, score)]
+        status = STATUSES[bisect.bisect_right(STATUS_BOUNDS, score)]
 
         return {
             'score': round(score, 1),
             'grade': grade,
             'status': status,
             'components': components,
-            'weights': {
-                'coverage': 0.20,
-                'explainability': 0.20,
-                'performance': 0.20,
-                'auditability': 0.25,
-                'fairness': 0.15
-            }
+            'weights': WEIGHTS
         }
 
+    def _build_history_index(self) -> Dict[str, List[Tuple[float, str, int]]]:
+        """One scandir pass bucketing every {type}_*.json file, newest first."""
+        index: Dict[str, List[Tuple[float, str, int]]] = {metric_type: [] for metric_type in METRIC_TYPES}
+        try:
+            with os.scandir(self.eval_dir) as entries:
+                for entry in entries:
+                    metric_type = entry.name.partition('_')[0]
+                    if metric_type in index and entry.name.endswith(".json"):
+                        stat = entry.stat()
+                        index[metric_type].append((stat.st_mtime, entry.path, stat.st_size))
+        except FileNotFoundError:
+            pass
+        for files in index.values():
+            files.sort(reverse=True)
+        return index
+
+    def _history_files(self, metric_type: str) -> List[Tuple[float, str, int]]:
+        """(mtime, path, size) of a metric type's files, newest first, from the cached index."""
+        cached = self._history_index
+        if cached is None or not self._is_fresh(cached[0]):
+            started, generation = time.monotonic(), self._generation
+            cached = (started, self._build_history_index())
+            if generation == self._generation:
+                self._history_index = cached
+        return cached[1].get(metric_type, [])
+
     def get_metrics_history(self, metric_type: str, limit: int = 10) -> List[Dict]:
         """Get historical metrics for trend analysis."""
-        pattern = str(self.eval_dir / f"{metric_type}_*.json")
-        files = glob.glob(pattern)
-
-        if not files:
-            return []
-
-        # Sort by modification time, most recent first
-        files.sort(key=lambda f: Path(f).stat().st_mtime, reverse=True)
-        files = files[:limit]
-
         history = []
-        for file_path in files:
+        # The index already carries each file's stat; no per-file stat here
+        for mtime, file_path, size in self._history_files(metric_type)[:limit]:
             try:
-                with open(file_path, 'r') as f:
-                    data = json.load(f)
-                    data['file_timestamp'] = datetime.fromtimestamp(
-                        Path(file_path).stat().st_mtime
-                    ).isoformat()
-                    history.append(data)
+                data = self._parse_cached(file_path, mtime, size)
+                history.append({**data, 'file_timestamp': datetime.fromtimestamp(mtime).isoformat()})
             except Exception:
                 continue
 
@@ -191,8 +496,8 @@ async def get_latest_metrics():
         - overall: Weighted score, grade, and status
     """
     try:
-        metrics = metrics_loader.get_latest_metrics()
-        return JSONResponse(content=metrics)
+        payload = await metrics_loader.get_latest_payload_async('latest')
+        return Response(content=payload, media_type="application/json")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error loading metrics: {str(e)}")
 
@@ -209,15 +514,14 @@ async def get_metrics_history(metric_type: str, limit: int = 10):
     Returns:
         List of historical metrics in reverse chronological order
     """
-    valid_types = ['coverage', 'explainability', 'performance', 'auditability', 'fairness']
-    if metric_type not in valid_types:
+    if metric_type not in METRIC_TYPES:
         raise HTTPException(
             status_code=400,
-            detail=f"Invalid metric_type. Must be one of: {', '.join(valid_types)}"
+            detail=f"Invalid metric_type. Must be one of: {', '.join(METRIC_TYPES)}"
         )
 
     try:
-        history = metrics_loader.get_metrics_history(metric_type, limit)
+        history = await run_in_threadpool(metrics_loader.get_metrics_history, metric_type, limit)
         return JSONResponse(content={'metric_type': metric_type, 'history': history, 'count': len(history)})
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error loading history: {str(e)}")
@@ -231,37 +535,8 @@ async def get_metrics_summary():
     Returns key metrics only for quick dashboard display.
     """
     try:
-        metrics = metrics_loader.get_latest_metrics()
-
-        summary = {
-            'overall_score': metrics['overall']['score'],
-            'overall_grade': metrics['overall']['grade'],
-            'overall_status': metrics['overall']['status'],
-            'coverage_rate': None,
-            'explainability_score': None,
-            'performance_latency': None,
-            'compliance_score': None,
-            'fairness_status': None,
-            'timestamp': metrics['timestamp']
-        }
-
-        # Extract key values
-        if metrics.get('coverage'):
-            summary['coverage_rate'] = metrics['coverage'].get('persona_assignment_rate', 0) * 100
-
-        if metrics.get('explainability'):
-            summary['explainability_score'] = metrics['explainability'].get('rationale_quality_score', 0)
-
-        if metrics.get('performance'):
-            summary['performance_latency'] = metrics['performance'].get('average_latency_per_user', 0)
-
-        if metrics.get('auditability'):
-            summary['compliance_score'] = metrics['auditability'].get('overall_compliance_score', 0)
-
-        if metrics.get('fairness'):
-            summary['fairness_status'] = metrics['fairness'].get('overall_fairness_assessment', 'N/A')
-
-        return JSONResponse(content=summary)
+        payload = await metrics_loader.get_latest_payload_async('summary')
+        return Response(content=payload, media_type="application/json")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error loading summary: {str(e)}")
 
@@ -274,14 +549,7 @@ async def get_component_scores():
     Returns the weighted score for each evaluation dimension.
     """
     try:
-        metrics = metrics_loader.get_latest_metrics()
-        overall = metrics.get('overall', {})
-
-        return JSONResponse(content={
-            'components': overall.get('components', {}),
-            'weights': overall.get('weights', {}),
-            'overall_score': overall.get('score', 0),
-            'timestamp': metrics['timestamp']
-        })
+        payload = await metrics_loader.get_latest_payload_async('components')
+        return Response(content=payload, media_type="application/json")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error loading components: {str(e)}")
@@ -7,27 +7,57 @@ decision traces, including qualifying personas, match evidence, and prioritizati
 
 from __future__ import annotations
 
-import json
+import hashlib
+import logging
+import secrets
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from types import MappingProxyType
+from typing import Optional, Iterator, List, Dict, Any
 
-from fastapi import APIRouter, HTTPException, Query, Depends, Body
+import orjson
+from cachetools import TTLCache
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Query, Depends, Body, Request, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
-from sqlalchemy import create_engine, desc
-from sqlalchemy.orm import sessionmaker
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy import Result, Row, bindparam, desc, exists, func, select
+from sqlalchemy.orm import Session, sessionmaker
 
+from spendsense.api.responses import ORJSON_OPTIONS, ORJSONResponse
 from spendsense.auth.rbac import require_role
 from spendsense.auth.tokens import TokenData
+from spendsense.config.database import get_engine, get_readonly_engine
 from spendsense.ingestion.database_writer import User, PersonaAssignmentRecord, Operator, AuthAuditLog
+from spendsense.services.audit_service import AuditService
 
+logger = logging.getLogger(__name__)
 
 # Router for operator persona endpoints
-router = APIRouter(prefix="/api/operator", tags=["operator-personas"])
+# Read endpoints return pre-built dicts in an ORJSONResponse; the models below
+# document them in OpenAPI (responses=) without runtime validation
+router = APIRouter(
+    prefix="/api/operator",
+    tags=["operator-personas"],
+    default_response_class=ORJSONResponse,
+)
 
 # Database path
 DB_PATH = Path(__file__).parent.parent.parent / "data" / "processed" / "spendsense.db"
 
+# Built once at import and shared by every request; the engines are lazy and
+# do not touch the database file until the first session connects. The GET
+# endpoints never write, so they read through a mode=ro engine.
+_SessionLocal = sessionmaker(bind=get_engine(DB_PATH), autoflush=False, expire_on_commit=False)
+_ReadOnlySessionLocal = sessionmaker(bind=get_readonly_engine(DB_PATH), autoflush=False)
+
+# Encoded assignment responses keyed by (user_id, latest assigned_at per
+# window): a new assignment or override changes the key, and the TTL bounds
+# staleness of anything else in the payload (e.g. the user's name). Only
+# touched from the event loop, so no lock needed.
+ASSIGNMENTS_CACHE_TTL_SECONDS = 300
+_assignments_cache: TTLCache = TTLCache(maxsize=2048, ttl=ASSIGNMENTS_CACHE_TTL_SECONDS)
+
 
 # ===== Persona Definitions Registry =====
 # These definitions come from Epic 3 persona registry
@@ -137,6 +167,19 @@ PERSONA_DEFINITIONS = {
     }
 }
 
+# The registry is fixed at import; everything below is derived from it once
+PERSONA_DEFINITIONS = MappingProxyType(PERSONA_DEFINITIONS)
+
+# Flat lookups and the sorted registry, derived once from PERSONA_DEFINITIONS
+PERSONA_NAME_BY_ID = {k: v["display_name"] for k, v in PERSONA_DEFINITIONS.items()}
+PERSONA_PRIORITY_BY_ID = {k: v["priority_rank"] for k, v in PERSONA_DEFINITIONS.items()}
+PERSONA_DEFINITIONS_LIST_SORTED = sorted(PERSONA_DEFINITIONS.values(), key=lambda d: d["priority_rank"])
+
+# The registry is static at runtime, so the definitions endpoint serves
+# these bytes directly and lets clients revalidate against the ETag
+_DEFINITIONS_JSON = orjson.dumps(PERSONA_DEFINITIONS_LIST_SORTED, option=ORJSON_OPTIONS)
+_DEFINITIONS_ETAG = f'"{hashlib.sha1(_DEFINITIONS_JSON).hexdigest()}"'
+
 
 # ===== Response Models =====
 
@@ -214,208 +257,300 @@ class PersonaOverrideResponse(BaseModel):
 
 # ===== Utility Functions =====
 
-def get_db_session():
-    """Get database session."""
+def _yield_session(factory: sessionmaker):
+    """Yield a session from factory, closed once the request finishes."""
     if not DB_PATH.exists():
         raise HTTPException(
             status_code=503,
             detail="Database not available. Please run data ingestion first."
         )
 
-    engine = create_engine(f"sqlite:///{str(DB_PATH)}")
-    Session = sessionmaker(bind=engine)
-    return Session()
-
+    session = factory()
+    try:
+        yield session
+    finally:
+        session.close()
 
-def get_persona_name(persona_id: str) -> str:
-    """Get display name for a persona ID."""
-    return PERSONA_DEFINITIONS.get(persona_id, {}).get("display_name", persona_id)
 
+def get_db():
+    """Yield a pooled read-write database session."""
+    yield from _yield_session(_SessionLocal)
+
+
+def get_ro_db():
+    """Yield a pooled read-only database session."""
+    yield from _yield_session(_ReadOnlySessionLocal)
+
+
+TIME_WINDOWS = ("30d", "180d")
+
+
+# ===== Statements =====
+# Built once at import with bound parameters, so each request only binds and
+# executes; the SQL compiled for each is reused from SQLAlchemy's cache.
+
+_USER_ID = bindparam("user_id")
+_IN_TIME_WINDOWS = PersonaAssignmentRecord.time_window.in_(TIME_WINDOWS)
+
+# Columns of the latest assignment that the assignments endpoint returns
+LATEST_ASSIGNMENT_COLUMNS = (
+    PersonaAssignmentRecord.assignment_id,
+    PersonaAssignmentRecord.time_window,
+    PersonaAssignmentRecord.assigned_persona_id,
+    PersonaAssignmentRecord.assigned_at,
+    PersonaAssignmentRecord.priority,
+    PersonaAssignmentRecord.qualifying_personas,
+    PersonaAssignmentRecord.match_evidence,
+    PersonaAssignmentRecord.prioritization_reason,
+)
+
+# Latest assignment per time window: ROW_NUMBER() ranks each window's rows by
+# assigned_at, so both windows come back together instead of one query each
+_ranked = select(
+    *LATEST_ASSIGNMENT_COLUMNS,
+    func.row_number().over(
+        partition_by=PersonaAssignmentRecord.time_window,
+        order_by=desc(PersonaAssignmentRecord.assigned_at)
+    ).label("rn")
+).where(PersonaAssignmentRecord.user_id == _USER_ID, _IN_TIME_WINDOWS).subquery()
+
+_LATEST_ASSIGNMENTS_STMT = (
+    select(*(_ranked.c[column.key] for column in LATEST_ASSIGNMENT_COLUMNS))
+    .where(_ranked.c.rn == 1)
+)
+
+# Most recent persona changes across both windows, newest first: LAG() pairs
+# each assignment with the previous one in its window, so SQLite does the diff.
+# A window's first assignment has no previous persona (NULL) and drops out.
+_paired = select(
+    PersonaAssignmentRecord.time_window,
+    PersonaAssignmentRecord.assigned_at.label("changed_at"),
+    PersonaAssignmentRecord.assigned_persona_id.label("new_persona"),
+    func.lag(PersonaAssignmentRecord.assigned_persona_id).over(
+        partition_by=PersonaAssignmentRecord.time_window,
+        order_by=PersonaAssignmentRecord.assigned_at
+    ).label("previous_persona"),
+    PersonaAssignmentRecord.prioritization_reason.label("reason")
+).where(PersonaAssignmentRecord.user_id == _USER_ID, _IN_TIME_WINDOWS).subquery()
+
+_PERSONA_CHANGES_STMT = (
+    select(_paired)
+    .where(_paired.c.new_persona != _paired.c.previous_persona)
+    .order_by(desc(_paired.c.changed_at))
+    .limit(bindparam("limit"))
+)
+
+# Latest assigned_at per window: the assignments response cache version
+_ASSIGNMENTS_VERSION_STMT = (
+    select(PersonaAssignmentRecord.time_window, func.max(PersonaAssignmentRecord.assigned_at))
+    .where(PersonaAssignmentRecord.user_id == _USER_ID, _IN_TIME_WINDOWS)
+    .group_by(PersonaAssignmentRecord.time_window)
+)
+
+_USER_EXISTS_STMT = select(exists().where(User.user_id == _USER_ID))
+
+_CURRENT_ASSIGNMENT_STMT = (
+    select(PersonaAssignmentRecord.assigned_persona_id)
+    .where(
+        PersonaAssignmentRecord.user_id == _USER_ID,
+        PersonaAssignmentRecord.time_window == bindparam("time_window")
+    )
+    .order_by(desc(PersonaAssignmentRecord.assigned_at))
+    .limit(1)
+)
+
+
+def get_latest_assignments(session: Session, user_id: str) -> Dict[str, Row]:
+    """
+    Latest assignment per time window, in one query.
 
-# ===== API Endpoints =====
+    Args:
+        session: Database session
+        user_id: User identifier
 
-@router.get("/personas/definitions", response_model=List[PersonaDefinition])
-async def get_persona_definitions(
-    current_operator: TokenData = Depends(require_role("viewer"))
-):
+    Returns:
+        Dict of time window -> assignment row (windows without rows omitted)
     """
-    Get all persona definitions from registry (AC #5).
+    rows = session.execute(_LATEST_ASSIGNMENTS_STMT, {"user_id": user_id}).all()
+    return {row.time_window: row for row in rows}
 
-    Returns complete persona definitions including criteria, educational focus,
-    and priority rankings.
+
+def iter_persona_changes(session: Session, user_id: str, limit: int) -> Result:
+    """
+    Most recent persona changes across both time windows, newest first.
 
     Args:
-        current_operator: Authenticated operator (injected by FastAPI)
+        session: Database session
+        user_id: User identifier
+        limit: Maximum changes to return
 
     Returns:
-        List of PersonaDefinition objects
-
-    Raises:
-        HTTPException 401: Unauthorized (missing/invalid token)
-        HTTPException 403: Forbidden (insufficient permissions)
+        Result of (time_window, changed_at, new_persona, previous_persona, reason) rows
     """
-    definitions = [PersonaDefinition(**data) for data in PERSONA_DEFINITIONS.values()]
-    # Sort by priority rank
-    definitions.sort(key=lambda x: x.priority_rank)
-    return definitions
+    return session.execute(_PERSONA_CHANGES_STMT, {"user_id": user_id, "limit": limit})
 
 
-@router.get("/personas/{user_id}", response_model=PersonaAssignmentsResponse)
-async def get_persona_assignments(
-    user_id: str,
+# ===== API Endpoints =====
+
+@router.get("/personas/definitions", responses={200: {"model": List[PersonaDefinition]}})
+async def get_persona_definitions(
+    request: Request,
     current_operator: TokenData = Depends(require_role("viewer"))
 ):
     """
-    Get persona assignments for a user (AC #1, #2, #3, #4, #7).
+    Get all persona definitions from registry (AC #5).
 
-    Returns assignments for both 30-day and 180-day windows with complete
-    decision traces including qualifying personas, match evidence, and
-    prioritization reasoning.
+    Returns complete persona definitions including criteria, educational focus,
+    and priority rankings.
 
     Args:
-        user_id: User identifier
+        request: Incoming request (for If-None-Match revalidation)
         current_operator: Authenticated operator (injected by FastAPI)
 
     Returns:
-        PersonaAssignmentsResponse with assignments and change history
+        List of persona definitions (PersonaDefinition schema), or an empty
+        304 Not Modified when If-None-Match carries the current ETag
 
     Raises:
         HTTPException 401: Unauthorized (missing/invalid token)
         HTTPException 403: Forbidden (insufficient permissions)
-        HTTPException 404: User not found or no assignments
-        HTTPException 503: Database unavailable
     """
-    session = get_db_session()
+    headers = {"ETag": _DEFINITIONS_ETAG}
+    if_none_match = request.headers.get("if-none-match", "")
+    if _DEFINITIONS_ETAG in if_none_match or if_none_match.strip() == "*":
+        return Response(status_code=304, headers=headers)
+    return Response(content=_DEFINITIONS_JSON, media_type="application/json", headers=headers)
 
-    try:
-        # Verify user exists
-        user = session.query(User).filter(User.user_id == user_id).first()
-        if not user:
-            raise HTTPException(
-                status_code=404,
-                detail=f"User {user_id} not found"
-            )
 
-        # Get assignments for both time windows
-        assignments_30d = session.query(PersonaAssignmentRecord).filter(
-            PersonaAssignmentRecord.user_id == user_id,
-            PersonaAssignmentRecord.time_window == "30d"
-        ).order_by(desc(PersonaAssignmentRecord.assigned_at)).first()
+def _assignments_version(session: Session, user_id: str) -> tuple:
+    """Latest assigned_at per time window for a user (blocking; run in the threadpool)."""
+    rows = session.execute(_ASSIGNMENTS_VERSION_STMT, {"user_id": user_id}).all()
+    return tuple(sorted(tuple(row) for row in rows))
 
-        assignments_180d = session.query(PersonaAssignmentRecord).filter(
-            PersonaAssignmentRecord.user_id == user_id,
-            PersonaAssignmentRecord.time_window == "180d"
-        ).order_by(desc(PersonaAssignmentRecord.assigned_at)).first()
 
-        if not assignments_30d and not assignments_180d:
-            raise HTTPException(
-                status_code=404,
-                detail=f"No persona assignments found for user {user_id}"
-            )
+def _persona_assignments_payload(session: Session, user_id: str) -> Dict[str, Any]:
+    """Build the assignments response body (blocking; run in the threadpool)."""
+    # Verify user exists
+    user = session.get(User, user_id)
+    if not user:
+        raise HTTPException(
+            status_code=404,
+            detail=f"User {user_id} not found"
+        )
 
-        # Build response
-        response_assignments = {}
-
-        for window, assignment in [("30d", assignments_30d), ("180d", assignments_180d)]:
-            if assignment:
-                # Parse qualifying personas from JSON
-                qualifying_list = []
-                for persona_id in assignment.qualifying_personas:
-                    evidence = assignment.match_evidence.get(persona_id, {})
-                    qualifying_list.append(QualifyingPersona(
-                        persona_id=persona_id,
-                        persona_name=get_persona_name(persona_id),
-                        priority_rank=PERSONA_DEFINITIONS.get(persona_id, {}).get("priority_rank", 99),
-                        match_evidence=evidence
-                    ))
-
-                # Sort by priority
-                qualifying_list.sort(key=lambda x: x.priority_rank)
-
-                response_assignments[window] = PersonaAssignment(
-                    assignment_id=assignment.assignment_id,
-                    time_window=assignment.time_window,
-                    assigned_persona_id=assignment.assigned_persona_id,
-                    assigned_persona_name=get_persona_name(assignment.assigned_persona_id),
-                    assigned_at=assignment.assigned_at.isoformat(),
-                    priority_rank=assignment.priority,
-                    qualifying_personas=qualifying_list,
-                    prioritization_reason=assignment.prioritization_reason,
-                    confidence_level=None,  # Not implemented yet
-                    is_override=False  # Would check audit log in production
-                )
-
-        # Get change history (simplified - queries last 10 assignments per window)
-        change_history = []
-        for window in ["30d", "180d"]:
-            history_records = session.query(PersonaAssignmentRecord).filter(
-                PersonaAssignmentRecord.user_id == user_id,
-                PersonaAssignmentRecord.time_window == window
-            ).order_by(desc(PersonaAssignmentRecord.assigned_at)).limit(10).all()
-
-            # Compare consecutive assignments to detect changes
-            for i in range(len(history_records) - 1):
-                current = history_records[i]
-                previous = history_records[i + 1]
-
-                if current.assigned_persona_id != previous.assigned_persona_id:
-                    change_history.append(PersonaChangeHistoryItem(
-                        changed_at=current.assigned_at.isoformat(),
-                        time_window=window,
-                        previous_persona=previous.assigned_persona_id,
-                        previous_persona_name=get_persona_name(previous.assigned_persona_id),
-                        new_persona=current.assigned_persona_id,
-                        new_persona_name=get_persona_name(current.assigned_persona_id),
-                        reason=current.prioritization_reason,
-                        is_override=False  # Would check audit log
-                    ))
-
-        # Sort history by date
-        change_history.sort(key=lambda x: x.changed_at, reverse=True)
-
-        return PersonaAssignmentsResponse(
-            user_id=user_id,
-            user_name=user.name,
-            assignments=response_assignments,
-            change_history=change_history[:5]  # Return last 5 changes
+    latest = get_latest_assignments(session, user_id)
+
+    if not latest:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No persona assignments found for user {user_id}"
         )
 
-    finally:
-        session.close()
+    # Build response
+    response_assignments = {}
+
+    for window in TIME_WINDOWS:
+        if window in latest:
+            assignment = latest[window]
+            # Parse qualifying personas from JSON
+            qualifying_list = []
+            for persona_id in assignment.qualifying_personas:
+                evidence = assignment.match_evidence.get(persona_id, {})
+                qualifying_list.append({
+                    "persona_id": persona_id,
+                    "persona_name": PERSONA_NAME_BY_ID.get(persona_id, persona_id),
+                    "priority_rank": PERSONA_PRIORITY_BY_ID.get(persona_id, 99),
+                    "match_evidence": evidence
+                })
+
+            # Sort by priority
+            qualifying_list.sort(key=lambda x: x["priority_rank"])
+
+            response_assignments[window] = {
+                "assignment_id": assignment.assignment_id,
+                "time_window": assignment.time_window,
+                "assigned_persona_id": assignment.assigned_persona_id,
+                "assigned_persona_name": PERSONA_NAME_BY_ID.get(assignment.assigned_persona_id, assignment.assigned_persona_id),
+                "assigned_at": assignment.assigned_at,
+                "priority_rank": assignment.priority,
+                "qualifying_personas": qualifying_list,
+                "prioritization_reason": assignment.prioritization_reason,
+                "confidence_level": None,  # Not implemented yet
+                "is_override": False  # Would check audit log in production
+            }
 
+    # Last 5 changes across both windows
+    change_history = [
+        {
+            "changed_at": change.changed_at,
+            "time_window": change.time_window,
+            "previous_persona": change.previous_persona,
+            "previous_persona_name": PERSONA_NAME_BY_ID.get(change.previous_persona, change.previous_persona),
+            "new_persona": change.new_persona,
+            "new_persona_name": PERSONA_NAME_BY_ID.get(change.new_persona, change.new_persona),
+            "reason": change.reason,
+            "is_override": False  # Would check audit log
+        }
+        for change in iter_persona_changes(session, user_id, limit=5)
+    ]
+
+    return {
+        "user_id": user_id,
+        "user_name": user.name,
+        "assignments": response_assignments,
+        "change_history": change_history
+    }
 
-@router.post("/personas/{user_id}/override", response_model=PersonaOverrideResponse)
-async def override_persona_assignment(
+
+@router.get("/personas/{user_id}", responses={200: {"model": PersonaAssignmentsResponse}})
+async def get_persona_assignments(
     user_id: str,
-    override_request: PersonaOverrideRequest = Body(...),
-    current_operator: TokenData = Depends(require_role("admin"))
+    current_operator: TokenData = Depends(require_role("viewer")),
+    session: Session = Depends(get_ro_db)
 ):
     """
-    Manually override persona assignment (AC #9, #10).
+    Get persona assignments for a user (AC #1, #2, #3, #4, #7).
 
-    Allows admin operators to manually assign a different persona to a user
-    with required justification. All overrides are logged in audit trail.
+    Returns assignments for both 30-day and 180-day windows with complete
+    decision traces including qualifying personas, match evidence, and
+    prioritization reasoning.
 
     Args:
         user_id: User identifier
-        override_request: Override details (new persona, justification, time window)
-        current_operator: Authenticated admin operator (injected by FastAPI)
+        current_operator: Authenticated operator (injected by FastAPI)
+        session: Read-only database session (injected by FastAPI)
 
     Returns:
-        PersonaOverrideResponse with override details
+        PersonaAssignmentsResponse with assignments and change history
 
     Raises:
         HTTPException 401: Unauthorized (missing/invalid token)
-        HTTPException 403: Forbidden (insufficient permissions - admin required)
-        HTTPException 404: User not found
-        HTTPException 400: Invalid persona ID or missing justification
+        HTTPException 403: Forbidden (insufficient permissions)
+        HTTPException 404: User not found or no assignments
         HTTPException 503: Database unavailable
     """
-    session = get_db_session()
-
+    version = await run_in_threadpool(_assignments_version, session, user_id)
+    cache_key = (user_id, version)
+    body = _assignments_cache.get(cache_key)
+    if body is None:
+        payload = await run_in_threadpool(_persona_assignments_payload, session, user_id)
+        body = orjson.dumps(payload, option=ORJSON_OPTIONS)
+        # Missing users and users without assignments raise 404 above, so
+        # only real payloads are cached
+        _assignments_cache[cache_key] = body
+    return Response(content=body, media_type="application/json")
+
+
+def _apply_persona_override(
+    session: Session,
+    user_id: str,
+    override_request: PersonaOverrideRequest,
+    current_operator: TokenData
+) -> PersonaOverrideResponse:
+    """Record a persona override and its audit entries (blocking; run in the threadpool)."""
     try:
         # Verify user exists
-        user = session.query(User).filter(User.user_id == user_id).first()
+        user = session.get(User, user_id)
         if not user:
             raise HTTPException(
                 status_code=404,
@@ -430,22 +565,24 @@ async def override_persona_assignment(
             )
 
         # Get current assignment
-        current_assignment = session.query(PersonaAssignmentRecord).filter(
-            PersonaAssignmentRecord.user_id == user_id,
-            PersonaAssignmentRecord.time_window == override_request.time_window
-        ).order_by(desc(PersonaAssignmentRecord.assigned_at)).first()
+        current_persona = session.execute(
+            _CURRENT_ASSIGNMENT_STMT,
+            {"user_id": user_id, "time_window": override_request.time_window}
+        ).scalar_one_or_none()
 
-        old_persona = current_assignment.assigned_persona_id if current_assignment else "unclassified"
+        old_persona = current_persona or "unclassified"
 
-        # Create new assignment record with override
-        new_assignment_id = f"assign_override_{user_id}_{override_request.time_window}_{datetime.now().timestamp()}"
+        # Create new assignment record with override; one timestamp is shared by
+        # the assignment and its audit entry, and random suffixes keep IDs unique
+        now = datetime.now()
+        new_assignment_id = f"assign_override_{user_id}_{override_request.time_window}_{secrets.token_hex(8)}"
 
         new_assignment = PersonaAssignmentRecord(
             assignment_id=new_assignment_id,
             user_id=user_id,
             time_window=override_request.time_window,
             assigned_persona_id=override_request.new_persona_id,
-            assigned_at=datetime.now(),
+            assigned_at=now,
             priority=PERSONA_DEFINITIONS[override_request.new_persona_id]["priority_rank"],
             qualifying_personas=[override_request.new_persona_id],  # Only the overridden persona
             match_evidence={override_request.new_persona_id: {"override": True}},
@@ -456,40 +593,26 @@ async def override_persona_assignment(
 
         # Log to audit trail
         audit_entry = AuthAuditLog(
-            log_id=f"audit_override_{datetime.now().timestamp()}",
+            log_id=f"audit_override_{secrets.token_hex(8)}",
             event_type="persona_override",
             operator_id=current_operator.operator_id,
             endpoint=f"/api/operator/personas/{user_id}/override",
-            timestamp=datetime.now(),
-            details=json.dumps({
+            timestamp=now,
+            details=orjson.dumps({
                 "user_id": user_id,
                 "old_persona": old_persona,
                 "new_persona": override_request.new_persona_id,
                 "time_window": override_request.time_window,
                 "justification": override_request.justification,
                 "operator_username": current_operator.username
-            })
+            }).decode()
         )
 
         session.add(audit_entry)
         session.commit()
 
-        # Epic 6 Story 6.5: Log to audit_log table for compliance reporting
-        try:
-            from spendsense.services.audit_service import AuditService
-            AuditService.log_persona_overridden(
-                operator_id=current_operator.operator_id,
-                user_id=user_id,
-                old_persona=old_persona,
-                new_persona=override_request.new_persona_id,
-                justification=override_request.justification,
-                session=session
-            )
-        except Exception as e:
-            # Log but don't fail persona override if audit logging fails
-            logger.warning(f"audit_log_failed: {e}", extra={"user_id": user_id})
-
-        return PersonaOverrideResponse(
+        # Every field was checked above or generated here, so skip revalidation
+        return PersonaOverrideResponse.model_construct(
             assignment_id=new_assignment_id,
             user_id=user_id,
             old_persona=old_persona,
@@ -505,28 +628,144 @@ async def override_persona_assignment(
             raise
         raise HTTPException(status_code=500, detail=f"Override failed: {str(e)}")
 
+
+def _log_persona_override(
+    operator_id: str,
+    user_id: str,
+    old_persona: str,
+    new_persona: str,
+    justification: str
+) -> None:
+    """Epic 6 Story 6.5: Log to audit_log table for compliance reporting (runs after the response)."""
+    # The request's session is closed by now, so write on a fresh one
+    session = _SessionLocal()
+    try:
+        AuditService.log_persona_overridden(
+            operator_id=operator_id,
+            user_id=user_id,
+            old_persona=old_persona,
+            new_persona=new_persona,
+            justification=justification,
+            session=session
+        )
+    except Exception as e:
+        # Log but don't fail persona override if audit logging fails
+        logger.warning(f"audit_log_failed: {e}", extra={"user_id": user_id})
     finally:
         session.close()
 
 
-@router.get("/personas/{user_id}/history", response_model=List[PersonaChangeHistoryItem])
+@router.post("/personas/{user_id}/override", response_model=PersonaOverrideResponse)
+async def override_persona_assignment(
+    user_id: str,
+    background_tasks: BackgroundTasks,
+    override_request: PersonaOverrideRequest = Body(...),
+    current_operator: TokenData = Depends(require_role("admin")),
+    session: Session = Depends(get_db)
+):
+    """
+    Manually override persona assignment (AC #9, #10).
+
+    Allows admin operators to manually assign a different persona to a user
+    with required justification. All overrides are logged in audit trail.
+
+    Args:
+        user_id: User identifier
+        background_tasks: FastAPI background task queue (injected)
+        override_request: Override details (new persona, justification, time window)
+        current_operator: Authenticated admin operator (injected by FastAPI)
+        session: Database session (injected by FastAPI)
+
+    Returns:
+        PersonaOverrideResponse with override details
+
+    Raises:
+        HTTPException 401: Unauthorized (missing/invalid token)
+        HTTPException 403: Forbidden (insufficient permissions - admin required)
+        HTTPException 404: User not found
+        HTTPException 400: Invalid persona ID or missing justification
+        HTTPException 503: Database unavailable
+    """
+    response = await run_in_threadpool(
+        _apply_persona_override, session, user_id, override_request, current_operator
+    )
+
+    # The compliance audit row is written once the client has its response
+    background_tasks.add_task(
+        _log_persona_override,
+        current_operator.operator_id,
+        user_id,
+        response.old_persona,
+        response.new_persona,
+        override_request.justification
+    )
+    return response
+
+
+def _ensure_user_exists(session: Session, user_id: str) -> None:
+    """Raise 404 unless the user exists (blocking; run in the threadpool)."""
+    if not session.execute(_USER_EXISTS_STMT, {"user_id": user_id}).scalar():
+        raise HTTPException(
+            status_code=404,
+            detail=f"User {user_id} not found"
+        )
+
+
+def _change_history_item(change: Row) -> Dict[str, Any]:
+    """Shape an iter_persona_changes row as a PersonaChangeHistoryItem dict."""
+    return {
+        "changed_at": change.changed_at,
+        "time_window": change.time_window,
+        "previous_persona": change.previous_persona,
+        "previous_persona_name": PERSONA_NAME_BY_ID.get(change.previous_persona, change.previous_persona),
+        "new_persona": change.new_persona,
+        "new_persona_name": PERSONA_NAME_BY_ID.get(change.new_persona, change.new_persona),
+        "reason": change.reason,
+        "is_override": "override" in change.reason.lower()
+    }
+
+
+def _persona_change_history(session: Session, user_id: str, limit: int) -> List[Dict[str, Any]]:
+    """Build the change history response body (blocking; run in the threadpool)."""
+    _ensure_user_exists(session, user_id)
+    return [_change_history_item(change) for change in iter_persona_changes(session, user_id, limit)]
+
+
+def _stream_change_history(user_id: str, limit: int) -> Iterator[bytes]:
+    """Yield change history items as NDJSON lines, closing the session when done."""
+    session = _ReadOnlySessionLocal()
+    try:
+        for change in iter_persona_changes(session, user_id, limit):
+            yield orjson.dumps(_change_history_item(change), option=ORJSON_OPTIONS) + b"\n"
+    finally:
+        session.close()
+
+
+@router.get("/personas/{user_id}/history", responses={200: {"model": List[PersonaChangeHistoryItem]}})
 async def get_persona_change_history(
+    request: Request,
     user_id: str,
     limit: int = Query(default=10, ge=1, le=50, description="Maximum history items to return"),
-    current_operator: TokenData = Depends(require_role("viewer"))
+    current_operator: TokenData = Depends(require_role("viewer")),
+    session: Session = Depends(get_ro_db)
 ):
     """
     Get persona change history for a user (AC #8).
 
     Returns timeline of persona changes with reasons for each change.
+    Clients sending Accept: application/x-ndjson get the items streamed one
+    JSON object per line instead of as a single array.
 
     Args:
+        request: Incoming request (Accept header selects NDJSON streaming)
         user_id: User identifier
         limit: Maximum number of history items (default 10, max 50)
         current_operator: Authenticated operator (injected by FastAPI)
+        session: Read-only database session (injected by FastAPI)
 
     Returns:
-        List of PersonaChangeHistoryItem objects
+        List of persona changes (PersonaChangeHistoryItem schema), or the
+        same items as NDJSON
 
     Raises:
         HTTPException 401: Unauthorized (missing/invalid token)
@@ -534,47 +773,13 @@ async def get_persona_change_history(
         HTTPException 404: User not found
         HTTPException 503: Database unavailable
     """
-    session = get_db_session()
-
-    try:
-        # Verify user exists
-        user = session.query(User).filter(User.user_id == user_id).first()
-        if not user:
-            raise HTTPException(
-                status_code=404,
-                detail=f"User {user_id} not found"
-            )
-
-        change_history = []
-
-        # Get assignment history for both windows
-        for window in ["30d", "180d"]:
-            history_records = session.query(PersonaAssignmentRecord).filter(
-                PersonaAssignmentRecord.user_id == user_id,
-                PersonaAssignmentRecord.time_window == window
-            ).order_by(desc(PersonaAssignmentRecord.assigned_at)).limit(limit).all()
-
-            # Detect changes between consecutive assignments
-            for i in range(len(history_records) - 1):
-                current = history_records[i]
-                previous = history_records[i + 1]
-
-                if current.assigned_persona_id != previous.assigned_persona_id:
-                    change_history.append(PersonaChangeHistoryItem(
-                        changed_at=current.assigned_at.isoformat(),
-                        time_window=window,
-                        previous_persona=previous.assigned_persona_id,
-                        previous_persona_name=get_persona_name(previous.assigned_persona_id),
-                        new_persona=current.assigned_persona_id,
-                        new_persona_name=get_persona_name(current.assigned_persona_id),
-                        reason=current.prioritization_reason,
-                        is_override="override" in current.prioritization_reason.lower()
-                    ))
-
-        # Sort by date descending
-        change_history.sort(key=lambda x: x.changed_at, reverse=True)
-
-        return change_history[:limit]
+    if "application/x-ndjson" in request.headers.get("accept", ""):
+        await run_in_threadpool(_ensure_user_exists, session, user_id)
+        # Sync generator: Starlette iterates it in the threadpool
+        return StreamingResponse(
+            _stream_change_history(user_id, limit),
+            media_type="application/x-ndjson"
+        )
 
-    finally:
-        session.close()
+    history = await run_in_threadpool(_persona_change_history, session, user_id, limit)
+    return ORJSONResponse(content=history)
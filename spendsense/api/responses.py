@@ -0,0 +1,30 @@
+"""
+Shared response classes for the SpendSense API.
+
+Provides an orjson-backed JSON response used as the application default
+so handler payloads are encoded by a C serializer instead of stdlib json.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+# Options shared by ORJSONResponse and payloads pre-encoded for caching
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+
+    orjson natively encodes dates, datetimes, dataclasses and numpy scalars,
+    so handlers can return detector metrics without manual isoformat() passes.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=ORJSON_OPTIONS)
@@ -4,11 +4,23 @@ from __future__ import annotations
 
 import uuid
 import bcrypt
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
 from datetime import datetime, timezone
 from typing import Optional
 from dataclasses import dataclass
 
-# Bcrypt rounds for password hashing (12 rounds = secure and performant)
+# Argon2id parameters for new hashes (OWASP minimum: 19 MiB, 2 iterations)
+ARGON2_TIME_COST = 2
+ARGON2_MEMORY_COST = 19456  # KiB
+ARGON2_PARALLELISM = 1
+_password_hasher = PasswordHasher(
+    time_cost=ARGON2_TIME_COST,
+    memory_cost=ARGON2_MEMORY_COST,
+    parallelism=ARGON2_PARALLELISM,
+)
+
+# Bcrypt rounds of legacy hashes, which are upgraded to argon2id on login
 BCRYPT_ROUNDS = 12
 
 
@@ -58,7 +70,7 @@ class AuthAuditLog:
 
 def hash_password(password: str) -> str:
     """
-    Hash a password using bcrypt.
+    Hash a password using argon2id.
 
     Args:
         password: Plain text password
@@ -66,15 +78,7 @@ def hash_password(password: str) -> str:
     Returns:
         Hashed password string
     """
-    # Encode password to bytes
-    password_bytes = password.encode('utf-8')
-
-    # Generate salt and hash
-    salt = bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
-    hashed = bcrypt.hashpw(password_bytes, salt)
-
-    # Return as string
-    return hashed.decode('utf-8')
+    return _password_hasher.hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -88,6 +92,13 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         True if password matches, False otherwise
     """
+    if hashed_password.startswith("$argon2"):
+        try:
+            return _password_hasher.verify(hashed_password, plain_password)
+        except (VerificationError, InvalidHashError):
+            return False
+
+    # Legacy bcrypt hash
     try:
         # Encode inputs to bytes
         password_bytes = plain_password.encode('utf-8')
@@ -99,6 +110,21 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         return False
 
 
+def password_needs_rehash(hashed_password: str) -> bool:
+    """
+    Check whether a stored hash should be replaced after a successful login.
+
+    True for legacy bcrypt hashes and for argon2 hashes made with parameters
+    other than the current ones.
+    """
+    if not hashed_password.startswith("$argon2"):
+        return True
+    try:
+        return _password_hasher.check_needs_rehash(hashed_password)
+    except InvalidHashError:
+        return True
+
+
 def validate_password_strength(password: str) -> tuple[bool, str]:
     """
     Validate password meets security requirements.
@@ -246,13 +272,14 @@ def get_operator_by_id(db, operator_id: str) -> Optional[Operator]:
     )
 
 
-def save_operator(db, operator: Operator) -> None:
+def save_operator(db, operator: Operator, commit: bool = True) -> None:
     """
     Save operator to database (insert or update).
 
     Args:
         db: Database connection
         operator: Operator to save
+        commit: Commit immediately; pass False to batch into the caller's transaction
     """
     cursor = db.cursor()
     cursor.execute(
@@ -276,20 +303,42 @@ def save_operator(db, operator: Operator) -> None:
             int(operator.is_active),
         )
     )
-    db.commit()
+    if commit:
+        db.commit()
+
+
+def update_password_hash(db, operator_id: str, password_hash: str, commit: bool = True) -> None:
+    """
+    Replace an operator's stored password hash.
+
+    Args:
+        db: Database connection
+        operator_id: Operator ID to update
+        password_hash: New password hash
+        commit: Commit immediately; pass False to batch into the caller's transaction
+    """
+    cursor = db.cursor()
+    cursor.execute(
+        "UPDATE operators SET password_hash = ? WHERE operator_id = ?",
+        (password_hash, operator_id)
+    )
+    if commit:
+        db.commit()
 
 
-def update_last_login(db, operator_id: str) -> None:
+def update_last_login(db, operator_id: str, commit: bool = True) -> None:
     """
     Update operator's last login timestamp.
 
     Args:
         db: Database connection
         operator_id: Operator ID to update
+        commit: Commit immediately; pass False to batch into the caller's transaction
     """
     cursor = db.cursor()
     cursor.execute(
         "UPDATE operators SET last_login_at = ? WHERE operator_id = ?",
         (datetime.now(timezone.utc).isoformat(), operator_id)
     )
-    db.commit()
+    if commit:
+        db.commit()
@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 import os
+import time
 from datetime import datetime, timedelta, timezone
+from hashlib import blake2b
 from typing import Optional
 from dataclasses import dataclass
 
+from cachetools import TTLCache
 from jose import JWTError, jwt
 
 # JWT Configuration
@@ -15,6 +18,12 @@ ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60  # 1 hour
 REFRESH_TOKEN_EXPIRE_DAYS = 7  # 7 days
 
+# Successful verifications are reused for a short while: repeat requests with
+# the same bearer token skip the HMAC check and payload decode. Keyed by a
+# digest of the token, never the raw token.
+VERIFIED_TOKEN_CACHE_TTL_SECONDS = 30
+_verified_tokens: TTLCache = TTLCache(maxsize=4096, ttl=VERIFIED_TOKEN_CACHE_TTL_SECONDS)
+
 
 @dataclass
 class TokenData:
@@ -85,6 +94,14 @@ def verify_token(token: str, expected_type: str = "access") -> Optional[TokenDat
     Returns:
         TokenData if token is valid, None otherwise
     """
+    cache_key = (blake2b(token.encode(), digest_size=16).digest(), expected_type)
+    cached = _verified_tokens.get(cache_key)
+    if cached is not None:
+        token_data, expires_at = cached
+        if time.time() < expires_at:
+            return token_data
+        del _verified_tokens[cache_key]
+
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
 
@@ -99,12 +116,15 @@ def verify_token(token: str, expected_type: str = "access") -> Optional[TokenDat
         if token_type != expected_type:
             return None
 
-        return TokenData(
+        token_data = TokenData(
             operator_id=operator_id,
             username=username,
             role=role,
             token_type=token_type,
         )
+        # Never serve a cached result past the token's own expiry
+        _verified_tokens[cache_key] = (token_data, payload.get("exp", 0))
+        return token_data
     except JWTError:
         return None
 
@@ -5,8 +5,10 @@ Centralized database path configuration for all modules.
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker, Session
 
 # Default database path (can be overridden via environment variable)
@@ -15,6 +17,25 @@ DEFAULT_DB_PATH = Path(__file__).parent.parent.parent / "data" / "processed" / "
 # Get database path from environment or use default
 DB_PATH = Path(os.environ.get("SPENDSENSE_DB_PATH", str(DEFAULT_DB_PATH)))
 
+# Connection tuning applied once to every new pooled SQLite connection
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA cache_size=-64000",  # ~64 MB page cache
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256 MB memory-mapped I/O
+)
+
+# Read-side subset of SQLITE_PRAGMAS for read-only connections, which cannot
+# change the journal mode
+SQLITE_READONLY_PRAGMAS = (
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA cache_size=-64000",  # ~64 MB page cache
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256 MB memory-mapped I/O
+)
+
 # Create database engine and session factory
 _engine = None
 _SessionLocal = None
@@ -54,3 +75,64 @@ def get_db_session() -> Session:
         _SessionLocal = sessionmaker(bind=_engine)
 
     return _SessionLocal()
+
+
+@lru_cache(maxsize=None)
+def get_engine(db_path: Path) -> Engine:
+    """
+    Get the shared, pooled engine for a SQLite database file.
+
+    One engine is built per path for the life of the process, and each
+    connection it opens is tuned with SQLITE_PRAGMAS.
+
+    Args:
+        db_path: Path to the SQLite database file
+
+    Returns:
+        SQLAlchemy Engine backed by a connection pool
+    """
+    engine = create_engine(
+        f"sqlite:///{db_path}",
+        pool_size=1 + (os.cpu_count() or 4),
+        connect_args={"check_same_thread": False}
+    )
+
+    @event.listens_for(engine, "connect")
+    def _apply_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+
+    return engine
+
+
+@lru_cache(maxsize=None)
+def get_readonly_engine(db_path: Path) -> Engine:
+    """
+    Get the shared, pooled read-only engine for a SQLite database file.
+
+    Connections open the file with mode=ro, so read paths never take the
+    write lock, and are tuned with SQLITE_READONLY_PRAGMAS. Writes through
+    this engine fail with "attempt to write a readonly database".
+
+    Args:
+        db_path: Path to the SQLite database file
+
+    Returns:
+        SQLAlchemy Engine backed by a connection pool
+    """
+    engine = create_engine(
+        f"sqlite:///file:{db_path.resolve().as_posix()}?mode=ro&uri=true",
+        pool_size=1 + (os.cpu_count() or 4),
+        connect_args={"check_same_thread": False}
+    )
+
+    @event.listens_for(engine, "connect")
+    def _apply_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in SQLITE_READONLY_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+
+    return engine
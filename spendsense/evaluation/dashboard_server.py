@@ -14,10 +14,10 @@ Usage:
 from flask import Flask, render_template, jsonify, request
 from flask_cors import CORS
 import json
+import os
 from pathlib import Path
 from datetime import datetime
-import glob
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 
 app = Flask(__name__,
             template_folder='../../templates',
@@ -25,6 +25,24 @@ app = Flask(__name__,
 CORS(app)
 
 
+def _json_files(eval_dir: Path, prefix: str) -> List[Tuple[str, float]]:
+    """
+    (path, mtime) of each {prefix}*.json file in eval_dir.
+
+    A plain prefix/suffix check on a scandir listing; each DirEntry is
+    stat'ed once and there is no fnmatch pattern to match per file.
+    """
+    try:
+        with os.scandir(eval_dir) as entries:
+            return [
+                (entry.path, entry.stat().st_mtime)
+                for entry in entries
+                if entry.name.startswith(prefix) and entry.name.endswith(".json")
+            ]
+    except FileNotFoundError:
+        return []
+
+
 class EvaluationDashboard:
     """Dashboard data provider for evaluation metrics."""
 
@@ -49,14 +67,13 @@ class EvaluationDashboard:
 
     def _load_latest(self, metric_type: str) -> Optional[Dict]:
         """Load the latest JSON file for a specific metric type."""
-        pattern = str(self.eval_dir / f"{metric_type}_*.json")
-        files = glob.glob(pattern)
+        files = _json_files(self.eval_dir, f"{metric_type}_")
 
         if not files:
             return None
 
         # Get most recent file
-        latest_file = max(files, key=lambda f: Path(f).stat().st_mtime)
+        latest_file, _ = max(files, key=lambda f: f[1])
 
         try:
             with open(latest_file, 'r') as f:
@@ -140,24 +157,21 @@ class EvaluationDashboard:
 
     def get_metrics_history(self, metric_type: str, limit: int = 10) -> List[Dict]:
         """Get historical metrics for trend analysis."""
-        pattern = str(self.eval_dir / f"{metric_type}_*.json")
-        files = glob.glob(pattern)
+        files = _json_files(self.eval_dir, f"{metric_type}_")
 
         if not files:
             return []
 
         # Sort by modification time, most recent first
-        files.sort(key=lambda f: Path(f).stat().st_mtime, reverse=True)
+        files.sort(key=lambda f: f[1], reverse=True)
         files = files[:limit]
 
         history = []
-        for file_path in files:
+        for file_path, mtime in files:
             try:
                 with open(file_path, 'r') as f:
                     data = json.load(f)
-                    data['file_timestamp'] = datetime.fromtimestamp(
-                        Path(file_path).stat().st_mtime
-                    ).isoformat()
+                    data['file_timestamp'] = datetime.fromtimestamp(mtime).isoformat()
                     history.append(data)
             except Exception:
                 continue
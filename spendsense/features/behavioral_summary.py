@@ -14,6 +14,7 @@ from spendsense.features.subscription_detector import SubscriptionDetector, Subs
 from spendsense.features.savings_detector import SavingsDetector, SavingsMetrics
 from spendsense.features.credit_detector import CreditDetector, CreditMetrics
 from spendsense.features.income_detector import IncomeDetector, IncomeMetrics
+from spendsense.features.time_windows import TimeWindowCalculator, PreloadedTimeWindowCalculator
 
 
 logger = logging.getLogger(__name__)
@@ -152,10 +153,8 @@ class BehavioralSummaryGenerator:
         Args:
             db_path: Path to SQLite database
         """
-        self.subscription_detector = SubscriptionDetector(db_path)
-        self.savings_detector = SavingsDetector(db_path)
-        self.credit_detector = CreditDetector(db_path)
-        self.income_detector = IncomeDetector(db_path)
+        self.db_path = db_path
+        self.time_calc = TimeWindowCalculator(db_path)
 
     def generate_summary(
         self,
@@ -165,6 +164,10 @@ class BehavioralSummaryGenerator:
         """
         Generate comprehensive behavioral summary for a user.
 
+        The user's accounts, liabilities and transactions are loaded once and
+        shared by all four detectors, rather than each detector querying the
+        database for every window.
+
         Args:
             user_id: User identifier
             reference_date: End date for analysis windows
@@ -179,14 +182,26 @@ class BehavioralSummaryGenerator:
         data_completeness = {}
         fallbacks_applied = []
 
+        # Load the user's data in one pass for all detectors
+        try:
+            time_calc = PreloadedTimeWindowCalculator(self.time_calc, user_id, reference_date)
+        except Exception as e:
+            logger.error(f"Error preloading data for {user_id}, querying per detector: {e}")
+            time_calc = self.time_calc
+
+        subscription_detector = SubscriptionDetector(self.db_path, time_calc=time_calc)
+        savings_detector = SavingsDetector(self.db_path, time_calc=time_calc)
+        credit_detector = CreditDetector(self.db_path, time_calc=time_calc)
+        income_detector = IncomeDetector(self.db_path, time_calc=time_calc)
+
         # Detect subscriptions (30 and 180 days)
         try:
-            subscriptions_30d = self.subscription_detector.detect_subscriptions(
+            subscriptions_30d = subscription_detector.detect_subscriptions(
                 user_id=user_id,
                 reference_date=reference_date,
                 window_days=30
             )
-            subscriptions_180d = self.subscription_detector.detect_subscriptions(
+            subscriptions_180d = subscription_detector.detect_subscriptions(
                 user_id=user_id,
                 reference_date=reference_date,
                 window_days=180
@@ -217,12 +232,12 @@ class BehavioralSummaryGenerator:
 
         # Detect savings (30 and 180 days)
         try:
-            savings_30d = self.savings_detector.detect_savings_patterns(
+            savings_30d = savings_detector.detect_savings_patterns(
                 user_id=user_id,
                 reference_date=reference_date,
                 window_days=30
             )
-            savings_180d = self.savings_detector.detect_savings_patterns(
+            savings_180d = savings_detector.detect_savings_patterns(
                 user_id=user_id,
                 reference_date=reference_date,
                 window_days=180
@@ -252,12 +267,12 @@ class BehavioralSummaryGenerator:
 
         # Detect credit (30 and 180 days)
         try:
-            credit_30d = self.credit_detector.detect_credit_patterns(
+            credit_30d = credit_detector.detect_credit_patterns(
                 user_id=user_id,
                 reference_date=reference_date,
                 window_days=30
             )
-            credit_180d = self.credit_detector.detect_credit_patterns(
+            credit_180d = credit_detector.detect_credit_patterns(
                 user_id=user_id,
                 reference_date=reference_date,
                 window_days=180
@@ -289,12 +304,12 @@ class BehavioralSummaryGenerator:
 
         # Detect income (30 and 180 days)
         try:
-            income_30d = self.income_detector.detect_income_patterns(
+            income_30d = income_detector.detect_income_patterns(
                 user_id=user_id,
                 reference_date=reference_date,
                 window_days=30
             )
-            income_180d = self.income_detector.detect_income_patterns(
+            income_180d = income_detector.detect_income_patterns(
                 user_id=user_id,
                 reference_date=reference_date,
                 window_days=180
@@ -7,7 +7,7 @@ and debt stress indicators to identify users needing debt paydown education.
 
 from dataclasses import dataclass, field
 from datetime import date
-from typing import List
+from typing import List, Optional
 import pandas as pd
 
 from spendsense.features.time_windows import TimeWindowCalculator
@@ -93,14 +93,16 @@ class CreditDetector:
         print(f"High utilization cards: {metrics.high_utilization_count}")
     """
 
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, time_calc: Optional[TimeWindowCalculator] = None):
         """
         Initialize credit detector.
 
         Args:
             db_path: Path to SQLite database
+            time_calc: Optional calculator to query through (e.g. a
+                PreloadedTimeWindowCalculator); defaults to one on db_path
         """
-        self.time_calc = TimeWindowCalculator(db_path)
+        self.time_calc = time_calc or TimeWindowCalculator(db_path)
 
     def detect_credit_patterns(
         self,
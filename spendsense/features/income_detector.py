@@ -7,7 +7,7 @@ to help identify users with variable income who need specialized budgeting guida
 
 from dataclasses import dataclass, field
 from datetime import date
-from typing import List
+from typing import List, Optional
 import pandas as pd
 import numpy as np
 
@@ -76,14 +76,16 @@ class IncomeDetector:
         print(f"Income variability: {metrics.income_variability_cv:.2f}")
     """
 
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, time_calc: Optional[TimeWindowCalculator] = None):
         """
         Initialize income detector.
 
         Args:
             db_path: Path to SQLite database
+            time_calc: Optional calculator to query through (e.g. a
+                PreloadedTimeWindowCalculator); defaults to one on db_path
         """
-        self.time_calc = TimeWindowCalculator(db_path)
+        self.time_calc = time_calc or TimeWindowCalculator(db_path)
 
     def detect_income_patterns(
         self,
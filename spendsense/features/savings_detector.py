@@ -7,7 +7,7 @@ and emergency fund coverage to identify users building financial resilience.
 
 from dataclasses import dataclass
 from datetime import date, timedelta
-from typing import List
+from typing import List, Optional
 import pandas as pd
 import numpy as np
 
@@ -70,14 +70,16 @@ class SavingsDetector:
         print(f"Emergency fund: {metrics.emergency_fund_months:.1f} months")
     """
 
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, time_calc: Optional[TimeWindowCalculator] = None):
         """
         Initialize savings detector.
 
         Args:
             db_path: Path to SQLite database
+            time_calc: Optional calculator to query through (e.g. a
+                PreloadedTimeWindowCalculator); defaults to one on db_path
         """
-        self.time_calc = TimeWindowCalculator(db_path)
+        self.time_calc = time_calc or TimeWindowCalculator(db_path)
 
     def detect_savings_patterns(
         self,
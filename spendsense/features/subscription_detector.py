@@ -99,14 +99,16 @@ class SubscriptionDetector:
     # Use 180 days (supported by TimeWindowCalculator)
     LOOKBACK_DAYS = 180
 
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, time_calc: Optional[TimeWindowCalculator] = None):
         """
         Initialize subscription detector.
 
         Args:
             db_path: Path to SQLite database
+            time_calc: Optional calculator to query through (e.g. a
+                PreloadedTimeWindowCalculator); defaults to one on db_path
         """
-        self.time_calc = TimeWindowCalculator(db_path)
+        self.time_calc = time_calc or TimeWindowCalculator(db_path)
 
     def detect_subscriptions(
         self,
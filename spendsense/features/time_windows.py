@@ -16,6 +16,55 @@ from sqlalchemy.orm import sessionmaker
 from spendsense.ingestion.database_writer import User, Account, Transaction, Liability
 
 
+def _transactions_to_frame(transactions) -> pd.DataFrame:
+    """Convert Transaction rows to the DataFrame layout detectors expect."""
+    if not transactions:
+        return pd.DataFrame()
+
+    return pd.DataFrame([{
+        'transaction_id': t.transaction_id,
+        'account_id': t.account_id,
+        'date': t.date if isinstance(t.date, date) else datetime.strptime(t.date, '%Y-%m-%d').date(),
+        'amount': float(t.amount),
+        'merchant_name': t.merchant_name,
+        'category': t.personal_finance_category,
+        'payment_channel': t.payment_channel,
+        'pending': t.pending
+    } for t in transactions])
+
+
+def _account_to_dict(acc) -> dict:
+    """Convert an Account row to the snapshot dict layout."""
+    return {
+        'account_id': acc.account_id,
+        'user_id': acc.user_id,
+        'type': acc.type,
+        'subtype': acc.subtype,
+        'balance': float(acc.balance_current) if acc.balance_current else 0.0
+    }
+
+
+def _liability_to_dict(lib) -> dict:
+    """Convert a Liability row to the snapshot dict layout."""
+    return {
+        'account_id': lib.account_id,
+        'liability_type': lib.liability_type,
+        'aprs': lib.aprs,
+        'is_overdue': lib.is_overdue,
+        'last_payment_amount': float(lib.last_payment_amount) if lib.last_payment_amount else None,
+        'minimum_payment_amount': float(lib.minimum_payment_amount) if lib.minimum_payment_amount else None,
+        'last_statement_balance': float(lib.last_statement_balance) if lib.last_statement_balance else None,
+        'next_payment_due_date': lib.next_payment_due_date
+    }
+
+
+def _is_window_complete(df: pd.DataFrame, window_start: date) -> bool:
+    """Window is complete if data starts within 7 days of the window start."""
+    if df.empty:
+        return False
+    return df['date'].min() <= (window_start + timedelta(days=7))
+
+
 class TimeWindowResult:
     """
     Result container for time window queries with metadata.
@@ -174,33 +223,13 @@ class TimeWindowCalculator:
             ).all()
 
             # Convert to DataFrame
-            if transactions:
-                df = pd.DataFrame([{
-                    'transaction_id': t.transaction_id,
-                    'account_id': t.account_id,
-                    'date': t.date if isinstance(t.date, date) else datetime.strptime(t.date, '%Y-%m-%d').date(),
-                    'amount': float(t.amount),
-                    'merchant_name': t.merchant_name,
-                    'category': t.personal_finance_category,
-                    'payment_channel': t.payment_channel,
-                    'pending': t.pending
-                } for t in transactions])
-            else:
-                df = pd.DataFrame()
-
-            # Check if we have data from window start
-            is_complete = False
-            if not df.empty:
-                earliest_txn = df['date'].min()
-                # Complete if we have data from near the start of window
-                # (within 7 days tolerance)
-                is_complete = earliest_txn <= (window_start + timedelta(days=7))
+            df = _transactions_to_frame(transactions)
 
             return TimeWindowResult(
                 data=df,
                 window_start=window_start,
                 window_end=window_end,
-                is_complete=is_complete,
+                is_complete=_is_window_complete(df, window_start),
                 record_count=len(df)
             )
 
@@ -238,13 +267,7 @@ class TimeWindowCalculator:
             ).all()
 
             # Convert to list of dicts for consistent interface
-            account_list = [{
-                'account_id': acc.account_id,
-                'user_id': acc.user_id,
-                'type': acc.type,
-                'subtype': acc.subtype,
-                'balance': float(acc.balance_current) if acc.balance_current else 0.0
-            } for acc in accounts]
+            account_list = [_account_to_dict(acc) for acc in accounts]
 
             return TimeWindowResult(
                 data=account_list,
@@ -301,16 +324,7 @@ class TimeWindowCalculator:
             ).all()
 
             # Convert to list of dicts
-            liability_list = [{
-                'account_id': lib.account_id,
-                'liability_type': lib.liability_type,
-                'aprs': lib.aprs,
-                'is_overdue': lib.is_overdue,
-                'last_payment_amount': float(lib.last_payment_amount) if lib.last_payment_amount else None,
-                'minimum_payment_amount': float(lib.minimum_payment_amount) if lib.minimum_payment_amount else None,
-                'last_statement_balance': float(lib.last_statement_balance) if lib.last_statement_balance else None,
-                'next_payment_due_date': lib.next_payment_due_date
-            } for lib in liabilities]
+            liability_list = [_liability_to_dict(lib) for lib in liabilities]
 
             return TimeWindowResult(
                 data=liability_list,
@@ -324,6 +338,149 @@ class TimeWindowCalculator:
             session.close()
 
 
+class PreloadedTimeWindowCalculator(TimeWindowCalculator):
+    """
+    TimeWindowCalculator answering queries from one user's preloaded data.
+
+    Loads the user's accounts, liabilities and every transaction in the widest
+    supported window up front, then serves window and snapshot queries
+    in-process. Lets the behavioral detectors share a single read instead of
+    each issuing its own SELECTs.
+
+    Queries for a different user or reference date fall through to the database.
+
+    Usage:
+        base = TimeWindowCalculator("data/processed/spendsense.db")
+        preloaded = PreloadedTimeWindowCalculator(base, "user_001", date(2025, 11, 4))
+
+        result = preloaded.get_transactions_in_window("user_001", date(2025, 11, 4), 30)
+    """
+
+    def __init__(
+        self,
+        calculator: TimeWindowCalculator,
+        user_id: str,
+        reference_date: date
+    ):
+        """
+        Load a user's data for all supported windows ending at reference_date.
+
+        Args:
+            calculator: Database-backed calculator whose engine is reused
+            user_id: User identifier
+            reference_date: End date of the windows that will be queried
+        """
+        self.db_path = calculator.db_path
+        self.engine = calculator.engine
+        self.Session = calculator.Session
+
+        self.user_id = user_id
+        self.reference_date = reference_date
+        self.max_window_days = max(self.SUPPORTED_WINDOWS)
+
+        session = self.Session()
+        try:
+            accounts = session.query(Account).filter(
+                Account.user_id == user_id
+            ).all()
+            account_ids = [acc.account_id for acc in accounts]
+
+            if account_ids:
+                liabilities = session.query(Liability).filter(
+                    Liability.account_id.in_(account_ids)
+                ).all()
+                transactions = session.query(Transaction).filter(
+                    Transaction.account_id.in_(account_ids),
+                    Transaction.date >= (reference_date - timedelta(days=self.max_window_days)).isoformat(),
+                    Transaction.date <= reference_date.isoformat()
+                ).all()
+            else:
+                liabilities = []
+                transactions = []
+
+            self._accounts = [_account_to_dict(acc) for acc in accounts]
+            self._liabilities = [_liability_to_dict(lib) for lib in liabilities]
+            self._transactions = _transactions_to_frame(transactions)
+
+        finally:
+            session.close()
+
+    def _is_preloaded(self, user_id: str, reference_date: date) -> bool:
+        return user_id == self.user_id and reference_date == self.reference_date
+
+    def get_transactions_in_window(
+        self,
+        user_id: str,
+        reference_date: date,
+        window_days: int
+    ) -> TimeWindowResult:
+        """Get transactions in the window, filtered from the preloaded frame."""
+        if not self._is_preloaded(user_id, reference_date) or window_days > self.max_window_days:
+            return super().get_transactions_in_window(user_id, reference_date, window_days)
+
+        window_start, window_end = self._calculate_window_bounds(
+            reference_date, window_days
+        )
+
+        df = self._transactions
+        if not df.empty:
+            df = df[df['date'] >= window_start].reset_index(drop=True)
+            if df.empty:
+                df = pd.DataFrame()
+
+        return TimeWindowResult(
+            data=df,
+            window_start=window_start,
+            window_end=window_end,
+            is_complete=_is_window_complete(df, window_start),
+            record_count=len(df)
+        )
+
+    def get_accounts_snapshot(
+        self,
+        user_id: str,
+        reference_date: date
+    ) -> TimeWindowResult:
+        """Get account balances from the preloaded accounts."""
+        if not self._is_preloaded(user_id, reference_date):
+            return super().get_accounts_snapshot(user_id, reference_date)
+
+        if reference_date > date.today():
+            raise ValueError(
+                f"Reference date {reference_date} cannot be in the future"
+            )
+
+        return TimeWindowResult(
+            data=list(self._accounts),
+            window_start=reference_date,
+            window_end=reference_date,
+            is_complete=len(self._accounts) > 0,
+            record_count=len(self._accounts)
+        )
+
+    def get_liabilities_snapshot(
+        self,
+        user_id: str,
+        reference_date: date
+    ) -> TimeWindowResult:
+        """Get liability data from the preloaded liabilities."""
+        if not self._is_preloaded(user_id, reference_date):
+            return super().get_liabilities_snapshot(user_id, reference_date)
+
+        if reference_date > date.today():
+            raise ValueError(
+                f"Reference date {reference_date} cannot be in the future"
+            )
+
+        return TimeWindowResult(
+            data=list(self._liabilities),
+            window_start=reference_date,
+            window_end=reference_date,
+            is_complete=len(self._liabilities) > 0,
+            record_count=len(self._liabilities)
+        )
+
+
 def get_default_fallback_values() -> dict:
     """
     Get default fallback values for users with insufficient data.
@@ -41,6 +41,11 @@ class User(Base):
     # Relationships
     accounts = relationship("Account", back_populates="user", cascade="all, delete-orphan")
 
+    # Operator consent listing: filter by status, page in user_id order
+    __table_args__ = (
+        Index('idx_users_consent_user', 'consent_status', 'user_id'),
+    )
+
 
 class Account(Base):
     """Account table."""
@@ -121,9 +126,9 @@ class PersonaAssignmentRecord(Base):
     prioritization_reason = Column(Text, nullable=False)
     signal_id = Column(String, nullable=True)  # Future: link to behavioral_signals table
 
-    # Performance index for common queries
+    # Serves "latest N per user and window" lookups in index order (no sort step)
     __table_args__ = (
-        Index('idx_assignments_user_window', 'user_id', 'time_window'),
+        Index('idx_assignments_user_window_assigned', user_id, time_window, assigned_at.desc()),
     )
 
 
@@ -273,12 +278,16 @@ class AuditLog(Base):
     ip_address = Column(String, nullable=True)
     user_agent = Column(String, nullable=True)
 
-    # Performance indexes for common query patterns
+    # Performance indexes for common query patterns. Every listing is ordered
+    # by (timestamp, log_id) DESC, so each filter column leads an index that
+    # continues in that order; SQLite walks them backwards for DESC.
     __table_args__ = (
-        Index('idx_audit_timestamp', 'timestamp'),
-        Index('idx_audit_event_type', 'event_type'),
-        Index('idx_audit_user', 'user_id'),
-        Index('idx_audit_operator', 'operator_id'),
+        Index('idx_audit_timestamp_log', 'timestamp', 'log_id'),
+        Index('idx_audit_event_type_ts', 'event_type', 'timestamp', 'log_id'),
+        Index('idx_audit_user_ts', 'user_id', 'timestamp', 'log_id'),
+        Index('idx_audit_operator_ts', 'operator_id', 'timestamp', 'log_id'),
+        # Consent history: one user's rows of a few event types, newest first
+        Index('idx_audit_user_event_ts', 'user_id', 'event_type', 'timestamp'),
     )
 
     # Valid event types (enforced at application level)
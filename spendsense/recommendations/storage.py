@@ -75,12 +75,12 @@ class RecommendationStorage:
         filename = f"recommendations_{time_window}_{timestamp}.json"
         file_path = user_dir / filename
 
-        # Convert to dict and save as JSON
+        # Convert to dict and serialize once; the same text backs both files
         data = recommendation_set.to_dict()
 
         try:
-            with open(file_path, "w") as f:
-                json.dump(data, f, indent=2, default=str)
+            serialized = json.dumps(data, indent=2, default=str)
+            file_path.write_text(serialized)
 
             logger.info(
                 f"Saved recommendation set for {user_id} "
@@ -89,8 +89,7 @@ class RecommendationStorage:
 
             # Also save as "latest" for easy retrieval
             latest_path = user_dir / f"latest_{time_window}.json"
-            with open(latest_path, "w") as f:
-                json.dump(data, f, indent=2, default=str)
+            latest_path.write_text(serialized)
 
             return str(file_path)
 
@@ -143,6 +142,41 @@ class RecommendationStorage:
             logger.error(f"Error loading recommendation set: {e}", exc_info=True)
             return None
 
+    def get_by_hash(
+        self,
+        user_id: str,
+        content_hash: str,
+        time_window: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get the latest recommendation set if it was built from identical inputs.
+
+        Compares content_hash against the metadata.content_hash stored on the
+        user's latest set(s), so callers can skip re-assembling recommendations
+        when persona, signals and reference date are unchanged.
+
+        Args:
+            user_id: User identifier
+            content_hash: Hash of the inputs the set was assembled from
+            time_window: Optional time window to check ("30d" or "180d");
+                checks both when omitted
+
+        Returns:
+            Recommendation set dict if a matching set is stored, None otherwise
+
+        Example:
+            >>> storage = RecommendationStorage()
+            >>> cached = storage.get_by_hash("user_123", content_hash, "30d")
+        """
+        time_windows = [time_window] if time_window else ["30d", "180d"]
+
+        for window in time_windows:
+            data = self.get_latest_by_user(user_id, window)
+            if data and data.get("metadata", {}).get("content_hash") == content_hash:
+                return data
+
+        return None
+
     def get_all_by_user(
         self,
         user_id: str,
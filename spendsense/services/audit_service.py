@@ -67,8 +67,9 @@ class AuditService:
         # Serialize event data to JSON
         event_data_json = json.dumps(event_data, default=str)
 
-        # Create audit log entry
-        audit_entry = AuditLog(
+        # Audit rows are write-only here, so insert through Core and skip
+        # building a tracked ORM object
+        insert_stmt = AuditLog.__table__.insert().values(
             log_id=log_id,
             event_type=event_type,
             user_id=user_id,
@@ -87,7 +88,7 @@ class AuditService:
             close_session = True
 
         try:
-            session.add(audit_entry)
+            session.execute(insert_stmt)
             session.commit()
             return log_id
         except Exception as e:
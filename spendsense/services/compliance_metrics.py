@@ -5,12 +5,11 @@ Calculates comprehensive metrics from audit log for regulatory
 compliance monitoring and reporting.
 """
 
-import json
 from datetime import datetime
 from typing import Dict, List, Any
 from collections import Counter
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, or_, true
 
 from spendsense.ingestion.database_writer import AuditLog, User
 
@@ -45,7 +44,7 @@ class ComplianceMetricsCalculator:
 
         Args:
             start_date: Start of date range
-            end_date: End of date range
+            end_date: End of date range (exclusive)
 
         Returns:
             Dict with consent metrics:
@@ -78,7 +77,7 @@ class ComplianceMetricsCalculator:
 
         Args:
             start_date: Start of date range
-            end_date: End of date range
+            end_date: End of date range (exclusive)
 
         Returns:
             Dict with eligibility metrics:
@@ -88,30 +87,32 @@ class ComplianceMetricsCalculator:
                 - pass_rate_pct: Percentage passed
                 - failure_reasons: List of {"reason": str, "count": int}
         """
-        # Get eligibility check events from audit log
-        eligibility_entries = self.session.query(AuditLog).filter(
+        # Aggregate eligibility check events in SQL, grouped by outcome and
+        # failure reason, instead of loading and parsing every row
+        check_result = func.json_extract(AuditLog.event_data, "$.check_result")
+        failure_reason = func.json_extract(AuditLog.event_data, "$.failure_reason")
+        groups = self.session.query(
+            check_result, failure_reason, func.count()
+        ).filter(
             AuditLog.event_type == "eligibility_checked",
             AuditLog.timestamp >= start_date,
-            AuditLog.timestamp <= end_date
-        ).all()
+            AuditLog.timestamp < end_date
+        ).group_by(check_result, failure_reason).all()
 
-        total_checks = len(eligibility_entries)
+        total_checks = 0
         passed = 0
         failed = 0
         failure_reasons_counter = Counter()
 
-        for entry in eligibility_entries:
-            event_data = json.loads(entry.event_data)
-            check_result = event_data.get("check_result", "unknown")
-
-            if check_result == "passed":
-                passed += 1
+        for result, reason, count in groups:
+            total_checks += count
+            if result == "passed":
+                passed += count
             else:
-                failed += 1
+                failed += count
                 # Count failure reason (singular in our format)
-                failure_reason = event_data.get("failure_reason")
-                if failure_reason:
-                    failure_reasons_counter[failure_reason] += 1
+                if reason:
+                    failure_reasons_counter[reason] += count
 
         pass_rate = (passed / total_checks * 100) if total_checks > 0 else 0.0
 
@@ -139,7 +140,7 @@ class ComplianceMetricsCalculator:
 
         Args:
             start_date: Start of date range
-            end_date: End of date range
+            end_date: End of date range (exclusive)
 
         Returns:
             Dict with tone metrics:
@@ -149,36 +150,41 @@ class ComplianceMetricsCalculator:
                 - pass_rate_pct: Percentage passed
                 - violations_by_category: List of {"category": str, "count": int}
         """
-        # Get tone validation events from audit log
-        tone_entries = self.session.query(AuditLog).filter(
+        # Aggregate tone validation events in SQL: outcome counts, then the
+        # top violation phrases across failed validations via json_each
+        in_range = (
             AuditLog.event_type == "tone_validated",
             AuditLog.timestamp >= start_date,
-            AuditLog.timestamp <= end_date
-        ).all()
-
-        total_validations = len(tone_entries)
-        passed = 0
-        failed = 0
-        violations_counter = Counter()
-
-        for entry in tone_entries:
-            event_data = json.loads(entry.event_data)
-            validation_result = event_data.get("validation_result", "unknown")
-
-            if validation_result == "passed":
-                passed += 1
-            else:
-                failed += 1
-                # Count each detected violation phrase
-                for violation in event_data.get("violations", []):
-                    violations_counter[violation] += 1
+            AuditLog.timestamp < end_date
+        )
+        validation_result = func.json_extract(AuditLog.event_data, "$.validation_result")
+        outcomes = dict(
+            self.session.query(validation_result == "passed", func.count())
+            .filter(*in_range)
+            .group_by(validation_result == "passed")
+            .all()
+        )
+        passed = outcomes.get(True, 0)
+        failed = outcomes.get(False, 0) + outcomes.get(None, 0)
+        total_validations = passed + failed
+
+        violation = func.json_each(AuditLog.event_data, "$.violations").table_valued("value")
+        violation_count = func.count().label("count")
+        top_violations = self.session.query(
+            violation.c.value, violation_count
+        ).select_from(AuditLog).join(violation, true()).filter(
+            *in_range,
+            or_(validation_result.is_(None), validation_result != "passed")
+        ).group_by(violation.c.value).order_by(
+            violation_count.desc(), violation.c.value
+        ).limit(10).all()
 
         pass_rate = (passed / total_validations * 100) if total_validations > 0 else 0.0
 
         # Convert violations to list format
         violations_by_category = [
             {"category": phrase, "count": count}
-            for phrase, count in violations_counter.most_common(10)  # Top 10
+            for phrase, count in top_violations  # Top 10
         ]
 
         return {
@@ -199,7 +205,7 @@ class ComplianceMetricsCalculator:
 
         Args:
             start_date: Start of date range
-            end_date: End of date range
+            end_date: End of date range (exclusive)
 
         Returns:
             Dict with operator metrics:
@@ -209,38 +215,40 @@ class ComplianceMetricsCalculator:
                 - flags: Number of flags
                 - actions_by_operator: List of {"operator_id": str, "count": int}
         """
-        # Get operator action events from audit log
-        operator_entries = self.session.query(AuditLog).filter(
+        # Aggregate operator action events in SQL by action and by operator
+        in_range = (
             AuditLog.event_type == "operator_action",
             AuditLog.timestamp >= start_date,
-            AuditLog.timestamp <= end_date
+            AuditLog.timestamp < end_date
+        )
+        action = func.json_extract(AuditLog.event_data, "$.action")
+        action_counts = dict(
+            self.session.query(action, func.count())
+            .filter(*in_range)
+            .group_by(action)
+            .all()
+        )
+        total_actions = sum(action_counts.values())
+        approvals = action_counts.get("approved", 0)
+        overrides = action_counts.get("overridden", 0)
+        flags = action_counts.get("flagged", 0)
+
+        # Count actions by operator
+        operator_count = func.count().label("count")
+        operator_counts = self.session.query(
+            AuditLog.operator_id, operator_count
+        ).filter(
+            *in_range,
+            AuditLog.operator_id.isnot(None),
+            AuditLog.operator_id != ""
+        ).group_by(AuditLog.operator_id).order_by(
+            operator_count.desc(), AuditLog.operator_id
         ).all()
 
-        total_actions = len(operator_entries)
-        approvals = 0
-        overrides = 0
-        flags = 0
-        actions_by_operator_counter = Counter()
-
-        for entry in operator_entries:
-            event_data = json.loads(entry.event_data)
-            action = event_data.get("action", "unknown")
-
-            if action == "approved":
-                approvals += 1
-            elif action == "overridden":
-                overrides += 1
-            elif action == "flagged":
-                flags += 1
-
-            # Count actions by operator
-            if entry.operator_id:
-                actions_by_operator_counter[entry.operator_id] += 1
-
         # Convert operator actions to list format
         actions_by_operator = [
             {"operator_id": operator_id, "count": count}
-            for operator_id, count in actions_by_operator_counter.most_common()
+            for operator_id, count in operator_counts
         ]
 
         return {
@@ -9,7 +9,7 @@ import json
 import pytest
 from datetime import datetime, timedelta
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 
 from spendsense.api.main import app
@@ -346,6 +346,48 @@ def test_calculate_operator_metrics(test_db):
     assert metrics["actions_by_operator"][0]["count"] == 3
 
 
+def test_grouped_metrics_rank_reasons_and_violations(test_db):
+    """SQL aggregation ranks failure reasons and violations by frequency."""
+    now = datetime.utcnow()
+    rows = [
+        ("eligibility_checked", {"check_result": "passed"}),
+        ("eligibility_checked", {"check_result": "failed", "failure_reason": "income"}),
+        ("eligibility_checked", {"check_result": "failed", "failure_reason": "age"}),
+        ("eligibility_checked", {"check_result": "failed", "failure_reason": "age"}),
+        ("eligibility_checked", {}),
+        ("tone_validated", {"validation_result": "passed", "violations": ["ignored"]}),
+        ("tone_validated", {"validation_result": "failed", "violations": ["lazy", "shame"]}),
+        ("tone_validated", {"violations": ["shame"]}),
+    ]
+    for i, (event_type, event_data) in enumerate(rows):
+        test_db.add(AuditLog(
+            log_id=f"log_grouped_{i}",
+            event_type=event_type,
+            user_id="test_user_001",
+            timestamp=now,
+            event_data=json.dumps(event_data)
+        ))
+    test_db.commit()
+
+    calculator = ComplianceMetricsCalculator(test_db)
+    start_date = now - timedelta(days=1)
+    end_date = now + timedelta(seconds=1)
+
+    eligibility = calculator.calculate_eligibility_metrics(start_date, end_date)
+    assert (eligibility["passed"], eligibility["failed"]) == (1, 4)
+    assert eligibility["failure_reasons"] == [
+        {"reason": "age", "count": 2},
+        {"reason": "income", "count": 1},
+    ]
+
+    tone = calculator.calculate_tone_metrics(start_date, end_date)
+    assert (tone["passed"], tone["failed"]) == (1, 2)
+    assert tone["violations_by_category"] == [
+        {"category": "shame", "count": 2},
+        {"category": "lazy", "count": 1},
+    ]
+
+
 # ===== API Tests (RBAC enforcement) =====
 
 def test_audit_log_requires_admin_role(client):
@@ -460,5 +502,275 @@ def test_audit_log_filtering_by_date_range(test_db):
     assert len(logs_in_range) == 1
 
 
+# ===== Export Tests =====
+
+@pytest.fixture
+def export_client(tmp_path, monkeypatch):
+    """Client whose audit endpoints read from a file-backed test database."""
+    from spendsense.api import operator_audit
+    from spendsense.auth.tokens import create_access_token
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'audit.db'}")
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+
+    session = Session()
+    session.add(User(
+        user_id="test_user_001",
+        name="Test User",
+        persona="low_savings",
+        annual_income=50000,
+        characteristics={},
+        consent_status="opted_in"
+    ))
+    session.commit()
+    for i in range(3):
+        AuditService.log_consent_changed(
+            user_id="test_user_001",
+            old_status="opted_out",
+            new_status="opted_in",
+            consent_version=f"1.{i}",
+            session=session
+        )
+    session.close()
+
+    monkeypatch.setattr(operator_audit, "get_db_session", Session)
+    monkeypatch.setattr(operator_audit, "EXPORT_DIR", tmp_path / "exports")
+    operator_audit._compliance_metrics_cache.clear()
+    token = create_access_token(operator_id="op_admin_001", username="admin", role="admin")
+    test_client = TestClient(app)
+    test_client.headers["Authorization"] = f"Bearer {token}"
+    return test_client
+
+
+def test_export_csv_streams_one_line_per_entry(export_client):
+    """Test AC#7: CSV export has a header plus one row per audit entry."""
+    response = export_client.get("/api/operator/audit/export?format=csv")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    lines = response.text.strip().splitlines()
+    assert lines[0].startswith("log_id,event_type,user_id")
+    assert len(lines) == 4
+    assert all("consent_changed" in line for line in lines[1:])
+
+
+def test_export_json_is_a_valid_array(export_client):
+    """Test AC#7: Streamed JSON export parses as one array with parsed event_data."""
+    response = export_client.get("/api/operator/audit/export?format=json")
+
+    assert response.status_code == 200
+    entries = json.loads(response.text)
+    assert len(entries) == 3
+    assert all(isinstance(entry["event_data"], dict) for entry in entries)
+
+
+def test_export_ndjson_has_one_object_per_line(export_client):
+    """Test AC#7: NDJSON export emits one JSON object per line."""
+    response = export_client.get("/api/operator/audit/export?format=ndjson")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = response.text.splitlines()
+    assert len(lines) == 3
+    assert [json.loads(line)["event_type"] for line in lines] == ["consent_changed"] * 3
+
+
+def test_export_json_keeps_malformed_event_data_valid(export_client):
+    """Test AC#7: Rows with malformed event_data still export as valid JSON."""
+    from spendsense.api import operator_audit
+
+    with operator_audit.get_db_session() as session:
+        session.add(AuditLog(log_id="log_bad", event_type="consent_changed", user_id="test_user_001",
+                             timestamp=datetime.utcnow(), event_data="not json"))
+        session.commit()
+
+    entries = json.loads(export_client.get("/api/operator/audit/export?format=json").text)
+    lines = export_client.get("/api/operator/audit/export?format=ndjson").text.splitlines()
+    ndjson_entries = [json.loads(line) for line in lines]
+
+    for exported in (entries, ndjson_entries):
+        assert len(exported) == 4
+        bad = next(entry for entry in exported if entry["log_id"] == "log_bad")
+        assert bad["event_data"] == "not json"
+        assert sum(isinstance(entry["event_data"], dict) for entry in exported) == 3
+
+
+def test_audit_log_page_reports_filtered_total(export_client):
+    """Test AC#6: Each page carries the total matching count."""
+    response = export_client.get("/api/operator/audit/log?page=2&page_size=2")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["total_count"] == 3
+    assert len(body["entries"]) == 1
+
+
+def test_audit_log_page_past_end_still_reports_total(export_client):
+    """Test AC#6: An empty page past the end still reports the total."""
+    response = export_client.get("/api/operator/audit/log?page=5&page_size=2")
+
+    assert response.status_code == 200
+    assert response.json()["total_count"] == 3
+    assert response.json()["entries"] == []
+
+
+def test_audit_log_unfiltered_total_is_estimated_unless_exact(export_client):
+    """Test AC#6: Unfiltered totals use the rowid estimate; exact_count recounts."""
+    from spendsense.api import operator_audit
+
+    with operator_audit.get_db_session() as session:
+        session.execute(text("DELETE FROM comprehensive_audit_log WHERE rowid = 1"))
+        session.commit()
+
+    estimated = export_client.get("/api/operator/audit/log").json()
+    exact = export_client.get("/api/operator/audit/log?exact_count=true").json()
+    filtered = export_client.get("/api/operator/audit/log?event_type=consent_changed").json()
+
+    assert (estimated["total_count"], estimated["total_count_is_estimate"]) == (3, True)
+    assert (exact["total_count"], exact["total_count_is_estimate"]) == (2, False)
+    assert (filtered["total_count"], filtered["total_count_is_estimate"]) == (2, False)
+    assert len(estimated["entries"]) == 2
+
+
+def test_audit_log_cursor_pagination_walks_all_entries(export_client):
+    """Test AC#6: Following next_cursor visits every entry exactly once."""
+    first = export_client.get("/api/operator/audit/log?page_size=2").json()
+    assert first["next_cursor"] is not None
+
+    second = export_client.get(
+        f"/api/operator/audit/log?page_size=2&cursor={first['next_cursor']}"
+    ).json()
+
+    seen = [e["log_id"] for e in first["entries"] + second["entries"]]
+    assert len(seen) == len(set(seen)) == 3
+    assert second["total_count"] == 3
+    assert second["next_cursor"] is None
+
+
+def test_audit_log_reports_server_timing(export_client):
+    """Audit log and fresh metrics responses carry Server-Timing phases."""
+    log = export_client.get("/api/operator/audit/log")
+    metrics = export_client.get("/api/operator/audit/metrics")
+
+    assert log.headers["server-timing"].startswith("db;dur=")
+    assert ", ser;dur=" in log.headers["server-timing"]
+    assert metrics.headers["server-timing"].startswith("db;dur=")
+
+
+def test_audit_log_rejects_malformed_cursor(export_client):
+    """Test AC#6: Malformed cursors are rejected with 400."""
+    response = export_client.get("/api/operator/audit/log?cursor=not-a-cursor")
+
+    assert response.status_code == 400
+
+
+def test_audit_log_date_only_end_includes_whole_day(export_client):
+    """Test AC#6: A bare end_date includes entries logged later that day."""
+    today = datetime.utcnow().date().isoformat()
+    response = export_client.get(
+        f"/api/operator/audit/log?start_date={today}&end_date={today}"
+    )
+
+    assert response.status_code == 200
+    assert response.json()["total_count"] == 3
+
+
+def test_audit_metrics_endpoint_returns_all_sections(export_client):
+    """Test AC#8: Metrics endpoint aggregates every calculator section."""
+    response = export_client.get("/api/operator/audit/metrics")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["consent_metrics"]["total_users"] == 1
+    assert body["eligibility_metrics"]["total_checks"] == 0
+    assert set(body["date_range"]) == {"start_date", "end_date"}
+
+
+def test_audit_metrics_cached_between_refreshes(export_client, monkeypatch):
+    """Test AC#8: Repeated metrics requests within the TTL reuse one calculation."""
+    from spendsense.api import operator_audit
+
+    calls = []
+    original = operator_audit._run_compliance_calculator
+
+    def counting(calculation, start_dt, end_dt):
+        calls.append(calculation.__name__)
+        return original(calculation, start_dt, end_dt)
+
+    monkeypatch.setattr(operator_audit, "_run_compliance_calculator", counting)
+
+    first = export_client.get("/api/operator/audit/metrics")
+    second = export_client.get("/api/operator/audit/metrics")
+    export_client.get("/api/operator/audit/metrics?start_date=2024-01-01")
+
+    assert second.json() == first.json()
+    assert calls.count("calculate_consent_metrics") == 2
+    assert len(calls) == 8
+
+
+def test_background_export_job_completes_and_downloads(export_client):
+    """Test AC#7: Background export job writes a downloadable file."""
+    created = export_client.post("/api/operator/audit/export", json={"format": "ndjson"})
+
+    assert created.status_code == 202
+    job_id = created.json()["job_id"]
+
+    status = export_client.get(f"/api/operator/audit/export/{job_id}").json()
+    assert status["status"] == "completed"
+    assert status["size_bytes"] > 0
+
+    download = export_client.get(status["download_url"])
+    assert download.status_code == 200
+    assert len(download.text.splitlines()) == 3
+
+
+def test_background_export_removes_expired_export_files(export_client):
+    """Test AC#7: Files of expired export jobs are deleted from disk."""
+    import os
+    import time
+    from spendsense.api import operator_audit
+
+    operator_audit.EXPORT_DIR.mkdir(parents=True)
+    expired = operator_audit.EXPORT_DIR / "audit_log_expired.csv"
+    recent = operator_audit.EXPORT_DIR / "audit_log_recent.csv"
+    expired.write_text("log_id\n")
+    recent.write_text("log_id\n")
+    old = time.time() - operator_audit.EXPORT_JOB_TTL_SECONDS - 60
+    os.utime(expired, (old, old))
+
+    created = export_client.post("/api/operator/audit/export", json={"format": "csv"})
+    status = export_client.get(f"/api/operator/audit/export/{created.json()['job_id']}").json()
+
+    assert status["status"] == "completed"
+    assert not expired.exists()
+    assert recent.exists()
+    assert len(list(operator_audit.EXPORT_DIR.iterdir())) == 2
+
+
+def test_background_export_rejects_bad_filters_and_unknown_jobs(export_client):
+    """Test AC#7: Invalid filters fail up front; unknown job IDs return 404."""
+    response = export_client.post(
+        "/api/operator/audit/export", json={"format": "csv", "event_type": "bogus"}
+    )
+    assert response.status_code == 400
+
+    assert export_client.get("/api/operator/audit/export/missing").status_code == 404
+
+
+def test_export_compressed_download_is_gzip_file(export_client):
+    """Test AC#7: compress=true streams a .gz file of the same CSV."""
+    import gzip
+
+    plain = export_client.get("/api/operator/audit/export?format=csv")
+    compressed = export_client.get("/api/operator/audit/export?format=csv&compress=true")
+
+    assert compressed.status_code == 200
+    assert compressed.headers["content-type"] == "application/gzip"
+    assert ".csv.gz" in compressed.headers["content-disposition"]
+    lines = gzip.decompress(compressed.content).decode().splitlines()
+    assert len(lines) == len(plain.text.splitlines()) == 4
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
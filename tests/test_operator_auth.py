@@ -74,8 +74,8 @@ def test_password_hashing():
     hashed = hash_password(password)
 
     assert hashed != password
-    assert len(hashed) > 50  # bcrypt hashes are long
-    assert hashed.startswith("$2b$")  # bcrypt format
+    assert len(hashed) > 50  # argon2 hashes are long
+    assert hashed.startswith("$argon2id$")  # argon2id format
 
 
 def test_password_verification():
@@ -87,6 +87,19 @@ def test_password_verification():
     assert not verify_password("WrongPassword123!", hashed)
 
 
+def test_legacy_bcrypt_hash_still_verifies_and_needs_rehash():
+    """Legacy bcrypt hashes verify and are flagged for upgrade; argon2id ones are not."""
+    import bcrypt
+    from spendsense.auth.operator import password_needs_rehash
+
+    legacy = bcrypt.hashpw(b"LegacyPass123!", bcrypt.gensalt(rounds=4)).decode()
+
+    assert verify_password("LegacyPass123!", legacy)
+    assert not verify_password("WrongPass123!", legacy)
+    assert password_needs_rehash(legacy)
+    assert not password_needs_rehash(hash_password("CurrentPass123!"))
+
+
 # ===== Unit Tests - Operator Creation (AC #1, #2) =====
 
 def test_create_operator_success():
@@ -174,6 +187,32 @@ def test_verify_token_wrong_type():
     assert verify_token(access_token, expected_type="refresh") is None
 
 
+def test_verify_token_reuses_cached_result(monkeypatch):
+    """Repeat verification of the same token skips the JWT decode."""
+    from spendsense.auth import tokens
+
+    token = create_access_token("op_cache", "cacheuser", "viewer")
+    first = verify_token(token)
+
+    monkeypatch.setattr(tokens.jwt, "decode", lambda *args, **kwargs: pytest.fail("decoded again"))
+    assert verify_token(token) == first
+
+
+def test_verify_token_cache_respects_token_expiry():
+    """A cached verification is not served once the token itself has expired."""
+    import time
+    from spendsense.auth import tokens
+
+    token = "expired.cached.token"
+    key = (tokens.blake2b(token.encode(), digest_size=16).digest(), "access")
+    tokens._verified_tokens[key] = (
+        tokens.TokenData("op_old", "olduser", "admin", "access"), time.time() - 1
+    )
+
+    assert verify_token(token) is None
+    assert key not in tokens._verified_tokens
+
+
 # ===== Unit Tests - RBAC (AC #2, #4) =====
 
 def test_rbac_permission_hierarchy():
@@ -228,7 +267,7 @@ def test_rate_limiting_allows_within_limit():
         record_login_attempt(client_id)
 
     # Verify we have exactly 5 attempts recorded
-    assert len(login_attempts[client_id]) == RATE_LIMIT_ATTEMPTS
+    assert login_attempts[client_id][1] == RATE_LIMIT_ATTEMPTS
 
 
 def test_rate_limiting_blocks_after_limit():
@@ -259,40 +298,31 @@ def test_rate_limiting_blocks_after_limit():
 
 
 def test_rate_limiting_clears_old_attempts():
-    """Test rate limiting clears attempts older than 15 minutes."""
+    """Test rate limiting resets once the 15-minute window has elapsed."""
+    import time
     from spendsense.api.operator_auth import (
         check_rate_limit,
+        record_login_attempt,
         login_attempts,
-        RATE_LIMIT_WINDOW_MINUTES
+        RATE_LIMIT_ATTEMPTS,
+        RATE_LIMIT_WINDOW_SECONDS
     )
-    from datetime import datetime, timezone, timedelta
 
     # Use unique client_id for this test
     client_id = "test_rate_limit_clear:testuser"
 
-    # Clear any existing attempts
-    if client_id in login_attempts:
-        del login_attempts[client_id]
-
-    now = datetime.now(timezone.utc)
-
-    # Add 3 old attempts (older than 15 minutes)
-    old_time = now - timedelta(minutes=RATE_LIMIT_WINDOW_MINUTES + 1)
-    login_attempts[client_id] = [old_time] * 3
-
-    # Add 2 recent attempts (within 15 minutes)
-    recent_time = now - timedelta(minutes=5)
-    login_attempts[client_id].extend([recent_time, recent_time])
+    # A full window of failures that started more than 15 minutes ago
+    expired_start = time.monotonic() - RATE_LIMIT_WINDOW_SECONDS - 60
+    login_attempts[client_id] = (expired_start, RATE_LIMIT_ATTEMPTS)
 
-    # Should have 5 total attempts now
-    assert len(login_attempts[client_id]) == 5
+    # Should be allowed because the old window has expired
+    assert check_rate_limit(client_id) is True
 
-    # Check rate limit - this should clean up old attempts
-    result = check_rate_limit(client_id)
-
-    # Should be allowed because only 2 recent attempts remain after cleanup
-    assert result is True
-    assert len(login_attempts[client_id]) == 2, "Should have only 2 recent attempts after cleanup"
+    # The next failure opens a fresh window
+    assert record_login_attempt(client_id) == RATE_LIMIT_ATTEMPTS - 1
+    window_start, failures = login_attempts[client_id]
+    assert window_start > expired_start
+    assert failures == 1, "Should count only the attempt in the new window"
 
 
 # ===== Integration Tests - Login Flow (AC #1, #8) =====
@@ -394,6 +424,187 @@ def test_integration_audit_logging(test_db):
     assert row[3] == "/api/operator/login"  # endpoint
 
 
+@pytest.fixture
+def pooled_client(test_db, tmp_path, monkeypatch):
+    """Client whose auth endpoints use a pool over the temporary database."""
+    from fastapi.testclient import TestClient
+    from spendsense.api import operator_auth
+    from spendsense.api.main import app
+
+    monkeypatch.setattr(
+        operator_auth, "_pool", operator_auth.ConnectionPool(tmp_path / "test_auth.db", readers=2)
+    )
+    return TestClient(app)
+
+
+def test_connection_pool_applies_pragmas_once(tmp_path):
+    """Pooled connections are tuned on open and reused across checkouts."""
+    from spendsense.api.operator_auth import ConnectionPool
+
+    db_path = tmp_path / "pool.db"
+    sqlite3.connect(db_path).close()
+    pool = ConnectionPool(db_path, readers=1)
+
+    with pool.writer() as first:
+        assert first.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert first.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+    with pool.writer() as second:
+        assert second is first
+    with pool.reader() as reader:
+        assert reader is not first
+        assert reader.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+
+
+def test_login_failures_report_rate_limit_headers(pooled_client):
+    """Failed logins count down X-RateLimit-Remaining, then 429 with Retry-After (AC #8)."""
+    from spendsense.api.operator_auth import RATE_LIMIT_ATTEMPTS, RATE_LIMIT_WINDOW_SECONDS
+
+    credentials = {"username": "rate_limit_headers", "password": "WrongPass123!"}
+    remaining = [
+        pooled_client.post("/api/operator/login", json=credentials).headers["x-ratelimit-remaining"]
+        for _ in range(RATE_LIMIT_ATTEMPTS)
+    ]
+    blocked = pooled_client.post("/api/operator/login", json=credentials)
+
+    assert remaining == [str(n) for n in range(RATE_LIMIT_ATTEMPTS - 1, -1, -1)]
+    assert blocked.status_code == 429
+    assert 0 < int(blocked.headers["retry-after"]) <= RATE_LIMIT_WINDOW_SECONDS
+
+
+def test_login_upgrades_legacy_bcrypt_hash(pooled_client, test_db):
+    """A successful login replaces a bcrypt hash with argon2id (AC #7)."""
+    import bcrypt
+    from spendsense.auth.operator import save_operator
+
+    operator = create_operator(username="legacy_admin", password="LegacyPass123!", role="admin")
+    operator.password_hash = bcrypt.hashpw(b"LegacyPass123!", bcrypt.gensalt(rounds=4)).decode()
+    save_operator(test_db, operator)
+
+    response = pooled_client.post(
+        "/api/operator/login",
+        json={"username": "legacy_admin", "password": "LegacyPass123!"}
+    )
+
+    assert response.status_code == 200
+    stored = test_db.execute(
+        "SELECT password_hash FROM operators WHERE operator_id = ?", (operator.operator_id,)
+    ).fetchone()[0]
+    assert stored.startswith("$argon2id$")
+    assert verify_password("LegacyPass123!", stored)
+
+
+def test_unknown_username_still_runs_bcrypt(pooled_client, monkeypatch):
+    """Unknown usernames are verified against a dummy hash to keep timing uniform (AC #8)."""
+    from spendsense.api import operator_auth
+
+    checked = []
+    monkeypatch.setattr(
+        operator_auth, "verify_password",
+        lambda password, hashed: checked.append(hashed) or False
+    )
+
+    response = pooled_client.post(
+        "/api/operator/login",
+        json={"username": "no_such_operator", "password": "Whatever123!!"}
+    )
+
+    assert response.status_code == 401
+    assert checked == [operator_auth._DUMMY_HASH]
+
+
+def test_password_verification_runs_off_the_event_loop(pooled_client, monkeypatch):
+    """Password hashing work runs in the threadpool, not on the event loop thread."""
+    import threading
+    from spendsense.api import operator_auth
+
+    threads = []
+    monkeypatch.setattr(
+        operator_auth, "verify_password",
+        lambda password, hashed: threads.append(threading.current_thread().name) or False
+    )
+    loop_threads = []
+    monkeypatch.setattr(
+        operator_auth, "get_client_identifier",
+        lambda client_ip, username: loop_threads.append(threading.current_thread().name) or "threadpool:test"
+    )
+
+    pooled_client.post("/api/operator/login", json={"username": "nobody", "password": "Whatever123!!"})
+
+    assert len(threads) == 1
+    assert threads != loop_threads
+
+
+def test_utc_timestamp_reuses_formatting_within_a_second(monkeypatch):
+    """Audit timestamps are formatted once per second and stay ISO-8601 UTC."""
+    from spendsense.api import operator_auth
+
+    monkeypatch.setattr(operator_auth, "_timestamp_cache", (0, ""))
+    monkeypatch.setattr(operator_auth.time, "time", lambda: 1_700_000_000.25)
+    first = operator_auth.utc_timestamp()
+    monkeypatch.setattr(operator_auth.time, "time", lambda: 1_700_000_000.75)
+
+    assert operator_auth.utc_timestamp() is first
+    assert datetime.fromisoformat(first) == datetime.fromtimestamp(1_700_000_000, timezone.utc)
+
+
+def test_logout_attributes_event_to_bearer_token_only(pooled_client, test_db):
+    """Logout records the operator from a well-formed Bearer header only (AC #6)."""
+    token = create_access_token("op_logout", "logout_user", "viewer")
+
+    for header in (f"Bearer {token}", f"Basic {token}", f"Bearer {token} extra", "Bearer"):
+        assert pooled_client.post("/api/operator/logout", headers={"Authorization": header}).status_code == 200
+
+    operator_ids = [row[0] for row in test_db.execute(
+        "SELECT operator_id FROM auth_audit_log WHERE event_type = 'logout' ORDER BY rowid"
+    )]
+    assert operator_ids == ["op_logout", None, None, None]
+
+
+def test_log_auth_event_joins_callers_transaction(test_db):
+    """Audit inserts are left uncommitted unless commit=True (AC #6)."""
+    from spendsense.api.operator_auth import log_auth_event
+
+    log_auth_event(test_db, event_type="logout")
+    assert test_db.in_transaction
+    test_db.rollback()
+
+    log_auth_event(test_db, event_type="logout", commit=True)
+    assert not test_db.in_transaction
+    assert test_db.execute("SELECT COUNT(*) FROM auth_audit_log").fetchone()[0] == 1
+
+
+def test_log_auth_event_stores_compact_details(test_db):
+    """Details are stored as compact JSON; pre-serialized strings pass through (AC #6)."""
+    from spendsense.api.operator_auth import log_auth_event
+
+    log_auth_event(test_db, event_type="login_failure", details={"username": "ü", "reason": "x"})
+    log_auth_event(test_db, event_type="login_failure", details='{"reason":"batch"}', commit=True)
+
+    stored = [row[0] for row in test_db.execute("SELECT details FROM auth_audit_log ORDER BY rowid")]
+    assert stored == ['{"username":"ü","reason":"x"}', '{"reason":"batch"}']
+
+
+def test_login_through_pool_records_audit_events(pooled_client, test_db):
+    """Create, login and logout each persist an auth audit event (AC #1, #6)."""
+    created = pooled_client.post(
+        "/api/operator/create",
+        json={"username": "pool_admin", "password": "PoolAdmin123!", "role": "admin"}
+    )
+    login = pooled_client.post(
+        "/api/operator/login",
+        json={"username": "pool_admin", "password": "PoolAdmin123!"}
+    )
+    logout = pooled_client.post("/api/operator/logout")
+
+    assert created.status_code == 201
+    assert login.status_code == 200
+    assert login.json()["token_type"] == "bearer"
+    assert created.json()["username"] == "pool_admin"
+    assert logout.status_code == 200
+    events = [row[0] for row in test_db.execute("SELECT event_type FROM auth_audit_log")]
+    assert sorted(events) == ["login_success", "logout", "operator_created"]
+
+
 # ===== Integration Tests - Epic 5 Consent Endpoint Protection (AC #4) =====
 
 def test_consent_endpoint_requires_admin():
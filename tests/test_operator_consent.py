@@ -419,3 +419,248 @@ def test_get_consent_history_no_changes(test_db, monkeypatch):
     assert result.user_id == "user_003"
     assert result.total_changes == 0
     assert len(result.history) == 0
+
+
+def test_sessions_share_one_pooled_engine(tmp_path, monkeypatch):
+    """Consent endpoints reuse a single tuned engine per database file."""
+    from spendsense.api.operator_consent import _open_session
+
+    db_path = tmp_path / "pooled.db"
+    Base.metadata.create_all(create_engine(f"sqlite:///{db_path}"))
+    monkeypatch.setattr("spendsense.api.operator_consent.get_db_path", lambda: db_path)
+
+    with _open_session() as first, _open_session() as second:
+        assert first.get_bind() is second.get_bind()
+        assert first.connection().exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+
+
+def test_open_session_checks_database_file_once(tmp_path, monkeypatch):
+    """A missing database is reported; once found, the file is not stat'ed again."""
+    from fastapi import HTTPException
+    from spendsense.api.operator_consent import _open_session
+
+    db_path = tmp_path / "late.db"
+    monkeypatch.setattr("spendsense.api.operator_consent.get_db_path", lambda: db_path)
+    with pytest.raises(HTTPException):
+        _open_session()
+
+    Base.metadata.create_all(create_engine(f"sqlite:///{db_path}"))
+    _open_session().close()
+    monkeypatch.setattr(Path, "exists", lambda self: pytest.fail("stat per request"))
+    _open_session().close()
+
+
+def test_batch_consent_bulk_update_writes_audit_rows(tmp_path, monkeypatch):
+    """Batch consent updates every known user and audits each change."""
+    import asyncio
+    import json
+    from spendsense.api import operator_consent
+    from spendsense.api.operator_consent import BatchConsentRequest, batch_consent_change
+    from spendsense.auth.tokens import TokenData
+
+    db_path = tmp_path / "batch.db"
+    engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    with Session() as session:
+        session.add_all([
+            User(user_id=f"user_{i:03d}", name=f"User {i}", persona="p", annual_income=1,
+                 characteristics={}, consent_status="opted_in" if i % 2 else "opted_out")
+            for i in range(5)
+        ])
+        session.commit()
+
+    monkeypatch.setattr(operator_consent, "get_db_path", lambda: db_path)
+    monkeypatch.setattr(operator_consent, "BATCH_CHUNK_SIZE", 2)
+
+    result = asyncio.run(batch_consent_change(
+        request=BatchConsentRequest(
+            user_ids=[f"user_{i:03d}" for i in range(5)] + ["user_missing", "user_000"],
+            consent_status="opted_in",
+            reason="Bulk opt-in after consent form migration"
+        ),
+        current_operator=TokenData(operator_id="op_admin", username="admin", role="admin", token_type="access")
+    ))
+
+    assert (result.success_count, result.failure_count) == (5, 1)
+    assert result.failed_users[0]["user_id"] == "user_missing"
+    with Session() as session:
+        assert {u.consent_status for u in session.query(User)} == {"opted_in"}
+        events = [(log.event_type, json.loads(log.event_data)) for log in session.query(AuditLog)]
+    changed = [data for event_type, data in events if event_type == "consent_changed"]
+    assert len(changed) == 3  # only the previously opted-out users
+    assert all(data["changed_by"] == "op_admin" for data in changed)
+    assert sum(event_type == "consent_changed_batch" for event_type, _ in events) == 5
+
+
+def test_consent_history_resolves_operator_names_in_one_query(tmp_path, monkeypatch):
+    """History entries carry the acting operator's username without per-row lookups."""
+    import asyncio
+    import json
+    from sqlalchemy import event
+    from spendsense.api import operator_consent
+    from spendsense.api.operator_consent import get_consent_history
+    from spendsense.auth.tokens import TokenData
+    from spendsense.config.database import get_engine
+    from spendsense.ingestion.database_writer import Operator as OperatorRecord
+
+    db_path = tmp_path / "history.db"
+    engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(engine)
+    with sessionmaker(bind=engine)() as session:
+        session.add(User(user_id="user_001", name="Alice", persona="p", annual_income=1, characteristics={}))
+        session.add(OperatorRecord(operator_id="op_1", username="alice_admin", password_hash="x",
+                                   role="admin", created_at=datetime.utcnow()))
+        for i, operator_id in enumerate(["op_1", "op_1", None, "op_gone"]):
+            session.add(AuditLog(
+                log_id=f"log_{i}", event_type="consent_changed", user_id="user_001",
+                operator_id=operator_id, timestamp=datetime.utcnow() - timedelta(days=i),
+                event_data=json.dumps({"old_status": "opted_out", "new_status": "opted_in"})
+            ))
+        session.commit()
+
+    monkeypatch.setattr(operator_consent, "get_db_path", lambda: db_path)
+    statements = []
+    event.listen(get_engine(db_path), "before_cursor_execute",
+                 lambda *args: statements.append(args[2]))
+
+    result = asyncio.run(get_consent_history(
+        user_id="user_001",
+        current_operator=TokenData(operator_id="op_1", username="alice_admin", role="reviewer", token_type="access")
+    ))
+
+    assert [entry.operator_name for entry in result.history] == ["alice_admin", "alice_admin", None, None]
+    assert [entry.changed_by for entry in result.history] == ["op_1", "op_1", "user", "op_gone"]
+    assert len(statements) == 2  # user lookup + history query
+
+
+def test_consent_history_tolerates_malformed_event_data(tmp_path, monkeypatch):
+    """Rows whose event_data is not JSON still appear, with unknown status."""
+    import asyncio
+    from spendsense.api import operator_consent
+    from spendsense.api.operator_consent import get_consent_history
+    from spendsense.auth.tokens import TokenData
+
+    db_path = tmp_path / "malformed.db"
+    engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(engine)
+    with sessionmaker(bind=engine)() as session:
+        session.add(User(user_id="user_001", name="Alice", persona="p", annual_income=1, characteristics={}))
+        session.add(AuditLog(log_id="log_bad", event_type="consent_changed", user_id="user_001",
+                             timestamp=datetime.utcnow(), event_data="not json"))
+        session.add(AuditLog(log_id="log_ok", event_type="consent_changed_batch", user_id="user_001",
+                             timestamp=datetime.utcnow() - timedelta(days=1),
+                             event_data='{"new_status": "opted_out", "reason": "Requested by user"}'))
+        session.commit()
+
+    monkeypatch.setattr(operator_consent, "get_db_path", lambda: db_path)
+    result = asyncio.run(get_consent_history(
+        user_id="user_001",
+        current_operator=TokenData(operator_id="op_1", username="reviewer", role="reviewer", token_type="access")
+    ))
+
+    assert [(e.new_status, e.old_status, e.reason) for e in result.history] == [
+        ("unknown", None, None),
+        ("opted_out", None, "Requested by user"),
+    ]
+
+
+def test_consent_history_pages_with_full_total(tmp_path, monkeypatch):
+    """History is paged newest-first while total_changes counts every change."""
+    import asyncio
+    import json
+    from spendsense.api import operator_consent
+    from spendsense.api.operator_consent import get_consent_history
+    from spendsense.auth.tokens import TokenData
+
+    db_path = tmp_path / "paged.db"
+    engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(engine)
+    with sessionmaker(bind=engine)() as session:
+        session.add(User(user_id="user_001", name="Alice", persona="p", annual_income=1, characteristics={}))
+        for i in range(5):
+            session.add(AuditLog(
+                log_id=f"log_{i}", event_type="consent_changed", user_id="user_001",
+                timestamp=datetime.utcnow() - timedelta(days=i),
+                event_data=json.dumps({"new_status": "opted_in", "reason": f"change {i}"})
+            ))
+        session.commit()
+
+    monkeypatch.setattr(operator_consent, "get_db_path", lambda: db_path)
+    token = TokenData(operator_id="op_1", username="reviewer", role="reviewer", token_type="access")
+
+    page = asyncio.run(get_consent_history(user_id="user_001", limit=2, offset=2, current_operator=token))
+    past_end = asyncio.run(get_consent_history(user_id="user_001", limit=2, offset=10, current_operator=token))
+
+    assert [entry.reason for entry in page.history] == ["change 2", "change 3"]
+    assert page.total_changes == 5
+    assert past_end.history == [] and past_end.total_changes == 5
+
+
+def test_consent_history_pages_rows_with_equal_timestamps_once(tmp_path, monkeypatch):
+    """Rows sharing a timestamp (as batch changes write) page in a stable order."""
+    import asyncio
+    import json
+    from spendsense.api import operator_consent
+    from spendsense.api.operator_consent import get_consent_history
+    from spendsense.auth.tokens import TokenData
+
+    db_path = tmp_path / "ties.db"
+    engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(engine)
+    now = datetime.utcnow()
+    with sessionmaker(bind=engine)() as session:
+        session.add(User(user_id="user_001", name="Alice", persona="p", annual_income=1, characteristics={}))
+        for i, event_type in enumerate(["consent_changed", "consent_changed_batch"] * 2):
+            session.add(AuditLog(
+                log_id=f"log_{i}", event_type=event_type, user_id="user_001", timestamp=now,
+                event_data=json.dumps({"new_status": "opted_out", "reason": f"change {i}"})
+            ))
+        session.commit()
+
+    monkeypatch.setattr(operator_consent, "get_db_path", lambda: db_path)
+    token = TokenData(operator_id="op_1", username="reviewer", role="reviewer", token_type="access")
+
+    reasons = [
+        entry.reason
+        for offset in range(4)
+        for entry in asyncio.run(get_consent_history(
+            user_id="user_001", limit=1, offset=offset, current_operator=token
+        )).history
+    ]
+
+    assert reasons == ["change 3", "change 2", "change 1", "change 0"]
+
+
+def test_get_users_keyset_pagination_walks_every_user(tmp_path, monkeypatch):
+    """after_user_id pages seek past the cursor and cover each user once."""
+    import asyncio
+    from spendsense.api.operator_consent import get_users_with_consent_filter
+    from spendsense.auth.tokens import TokenData
+
+    db_path = tmp_path / "keyset.db"
+    engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(engine)
+    with sessionmaker(bind=engine)() as session:
+        session.add_all([
+            User(user_id=f"user_{i:03d}", name=f"User {i}", persona="p", annual_income=1,
+                 characteristics={}, consent_status="opted_in" if i % 3 else "opted_out")
+            for i in range(10)
+        ])
+        session.commit()
+    monkeypatch.setattr("spendsense.api.operator_consent.get_db_path", lambda: db_path)
+
+    token = TokenData(operator_id="op_1", username="reviewer", role="reviewer", token_type="access")
+    seen, cursor = [], None
+    while True:
+        page = asyncio.run(get_users_with_consent_filter(
+            consent_status="opted_in", changed_since=None, limit=2, offset=0,
+            current_operator=token, after_user_id=cursor
+        ))
+        assert page.total == 6
+        seen += [user.user_id for user in page.users]
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert seen == [f"user_{i:03d}" for i in range(10) if i % 3]
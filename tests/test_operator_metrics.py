@@ -0,0 +1,324 @@
+"""
+Tests for the operator evaluation metrics loader and endpoints (Epic 7).
+"""
+
+import json
+import os
+from datetime import datetime
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from spendsense.api import operator_metrics
+from spendsense.api.operator_metrics import EvaluationMetricsLoader
+
+
+def write_metrics(eval_dir, metric_type, stamp, data):
+    """Write one evaluation metrics JSON file into eval_dir, with mtime taken from stamp."""
+    path = eval_dir / f"{metric_type}_{stamp}.json"
+    path.write_text(json.dumps(data))
+    mtime = datetime.strptime(stamp, "%Y%m%d_%H%M").timestamp()
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+@pytest.fixture
+def eval_dir(tmp_path):
+    """Evaluation directory with one file per metric type."""
+    write_metrics(tmp_path, "coverage_metrics", "20251107_0900",
+                  {"persona_assignment_rate": 1.0, "behavioral_signal_rate": 0.8})
+    write_metrics(tmp_path, "explainability_metrics", "20251107_0900",
+                  {"rationale_presence_rate": 1.0, "rationale_quality_score": 4.0,
+                   "decision_trace_completeness": 1.0})
+    write_metrics(tmp_path, "performance_metrics", "20251107_0900",
+                  {"average_latency_per_user": 0.5})
+    write_metrics(tmp_path, "auditability_metrics", "20251107_0900",
+                  {"overall_compliance_score": 96.0})
+    write_metrics(tmp_path, "fairness_metrics", "20251107_0900",
+                  {"overall_fairness_assessment": "PASS"})
+    return tmp_path
+
+
+@pytest.fixture
+def client(eval_dir, monkeypatch):
+    """TestClient for the metrics router backed by eval_dir."""
+    monkeypatch.setattr(operator_metrics, "metrics_loader", EvaluationMetricsLoader(str(eval_dir)))
+    app = FastAPI()
+    app.include_router(operator_metrics.router)
+    return TestClient(app)
+
+
+def test_latest_metrics_cached_within_ttl(eval_dir):
+    """A repeat call inside the TTL does not rescan the directory."""
+    loader = EvaluationMetricsLoader(str(eval_dir), ttl=60)
+    first = loader.get_latest_metrics()
+
+    write_metrics(eval_dir, "fairness_metrics", "20251108_0900",
+                  {"overall_fairness_assessment": "FAIL"})
+    assert loader.get_latest_metrics() == first
+
+    loader.invalidate()
+    assert loader.get_latest_metrics()["fairness"]["overall_fairness_assessment"] == "FAIL"
+
+
+def test_latest_metrics_refreshed_after_ttl(eval_dir):
+    """With a zero TTL every call reflects the files on disk."""
+    loader = EvaluationMetricsLoader(str(eval_dir), ttl=0)
+    loader.get_latest_metrics()
+
+    write_metrics(eval_dir, "auditability_metrics", "20251108_0900",
+                  {"overall_compliance_score": 40.0})
+    assert loader.get_latest_metrics()["auditability"]["overall_compliance_score"] == 40.0
+
+
+def test_overall_score_combines_all_components(eval_dir):
+    """Weighted overall score, grade and status from all five modules."""
+    overall = EvaluationMetricsLoader(str(eval_dir)).get_latest_metrics()["overall"]
+
+    assert overall["components"] == pytest.approx({
+        "coverage": 90.0, "explainability": 94.0, "performance": 90.0,
+        "auditability": 96.0, "fairness": 100,
+    })
+    assert overall["score"] == 93.8
+    assert (overall["grade"], overall["status"]) == ("A", "PASS")
+
+
+def test_latest_metrics_picks_newest_file_by_mtime(eval_dir):
+    """The newest file per metric type wins; other types' files are ignored."""
+    newest = write_metrics(eval_dir, "coverage_metrics", "20251109_0900",
+                           {"persona_assignment_rate": 0.5, "behavioral_signal_rate": 0.5})
+    write_metrics(eval_dir, "coverage_metrics", "20251108_0900", {"persona_assignment_rate": 0.1})
+    (eval_dir / "coverage_metrics_notes.txt").write_text("not json")
+
+    coverage = EvaluationMetricsLoader(str(eval_dir)).get_latest_metrics()["coverage"]
+
+    assert coverage["_file_path"] == str(newest)
+    assert coverage["_file_timestamp"] == datetime(2025, 11, 9, 9, 0).isoformat()
+
+
+def test_missing_eval_dir_yields_no_metrics(tmp_path):
+    """A missing evaluation directory reports every module as absent."""
+    metrics = EvaluationMetricsLoader(str(tmp_path / "missing")).get_latest_metrics()
+
+    assert metrics["coverage"] is None and metrics["fairness"] is None
+    assert metrics["overall"]["score"] == 0
+
+
+def test_latest_metrics_scan_directory_once(eval_dir, monkeypatch):
+    """All five metric types are found in a single directory walk."""
+    scans = []
+    real_scandir = os.scandir
+    monkeypatch.setattr(operator_metrics.os, "scandir", lambda path: scans.append(path) or real_scandir(path))
+
+    metrics = EvaluationMetricsLoader(str(eval_dir)).get_latest_metrics()
+
+    assert len(scans) == 1
+    assert all(metrics[t] for t in operator_metrics.METRIC_TYPES)
+
+
+def test_metric_files_with_nan_still_parse(eval_dir):
+    """NaN written by json.dump is accepted; malformed files report an error."""
+    write_metrics(eval_dir, "fairness_metrics", "20251108_0900", {}).write_text(
+        '{"overall_fairness_assessment": "CONCERN", "parity_ratio": NaN}'
+    )
+    write_metrics(eval_dir, "coverage_metrics", "20251108_0900", {}).write_text("{not json")
+
+    metrics = EvaluationMetricsLoader(str(eval_dir)).get_latest_metrics()
+
+    assert metrics["fairness"]["overall_fairness_assessment"] == "CONCERN"
+    assert "error" in metrics["coverage"]
+
+
+def test_unchanged_files_parsed_once(eval_dir, monkeypatch):
+    """Latest and history reuse the parsed document until the file changes."""
+    parsed = []
+    real_read = operator_metrics._read_json
+    monkeypatch.setattr(operator_metrics, "_read_json", lambda path: parsed.append(path) or real_read(path))
+    loader = EvaluationMetricsLoader(str(eval_dir), ttl=0)
+
+    loader.get_latest_metrics()
+    loader.get_latest_metrics()
+    history = loader.get_metrics_history("fairness")
+    assert len(parsed) == 5
+    assert "_file_path" not in history[0]
+
+    write_metrics(eval_dir, "fairness_metrics", "20251107_0900",
+                  {"overall_fairness_assessment": "CONCERN"})
+    assert loader.get_latest_metrics()["fairness"]["overall_fairness_assessment"] == "CONCERN"
+    assert len(parsed) == 6
+
+
+def test_metrics_endpoints_load_in_threadpool(client, monkeypatch):
+    """File loads run off the event loop thread; polls within the TTL reuse them."""
+    import threading
+
+    loader = operator_metrics.metrics_loader
+    threads = []
+    for name in ("_scan_latest", "_load_latest", "get_metrics_history"):
+        real = getattr(loader, name)
+        monkeypatch.setattr(loader, name, lambda *args, _real=real: threads.append(
+            threading.current_thread()) or _real(*args))
+    loop_threads = []
+    for name in ("Response", "JSONResponse"):
+        real = getattr(operator_metrics, name)
+        monkeypatch.setattr(operator_metrics, name, lambda _real=real, **kwargs: loop_threads.append(
+            threading.current_thread()) or _real(**kwargs))
+
+    latest = client.get("/api/operator/metrics/latest").json()
+    summary = client.get("/api/operator/metrics/summary").json()
+    components = client.get("/api/operator/metrics/components").json()
+    history = client.get("/api/operator/metrics/history/fairness").json()
+
+    assert summary["overall_score"] == components["overall_score"] == latest["overall"]["score"]
+    assert history["count"] == 1
+    # One scan, five file loads and one history read; summary/components hit the cache
+    assert len(threads) == 7
+    assert not set(threads) & set(loop_threads)
+
+
+@pytest.mark.parametrize("score, grade, status", [
+    (90.0, "A", "PASS"), (89.9, "B", "PASS"), (70.0, "C", "PASS"), (69.9, "D", "WARNING"),
+    (60.0, "D", "WARNING"), (50.0, "F", "WARNING"), (49.9, "F", "FAIL"),
+])
+def test_grade_and_status_boundaries(score, grade, status):
+    """Grade and status thresholds are inclusive lower bounds."""
+    overall = EvaluationMetricsLoader()._calculate_overall_score(
+        {"auditability": {"overall_compliance_score": score}}
+    )
+
+    assert (overall["grade"], overall["status"]) == (grade, status)
+    assert overall["weights"] == operator_metrics.WEIGHTS
+
+
+def test_json_file_events_invalidate_cache(eval_dir):
+    """Watcher callbacks for JSON files drop the cache; other files do not."""
+    loader = EvaluationMetricsLoader(str(eval_dir), ttl=60)
+    loader.get_latest_metrics()
+
+    loader._on_file_event(str(eval_dir / "latency_distribution_20251108.png"), "")
+    assert loader._cache is not None
+
+    loader._on_file_event(str(eval_dir / "fairness_metrics_20251108.json.tmp"),
+                          str(eval_dir / "fairness_metrics_20251108.json"))
+    assert loader._cache is None
+
+
+def test_load_racing_an_invalidation_is_not_cached(eval_dir, monkeypatch):
+    """A load that overlaps an invalidation returns its result but does not cache it."""
+    loader = EvaluationMetricsLoader(str(eval_dir), ttl=60)
+    real_scan = loader._scan_latest
+    monkeypatch.setattr(loader, "_scan_latest", lambda: loader.invalidate() or real_scan())
+
+    assert loader.get_latest_metrics()["fairness"] is not None
+    assert loader._cache is None
+
+
+def test_start_watching_without_watchdog_keeps_ttl(eval_dir, monkeypatch):
+    """Without watchdog the loader reports no watcher and keeps expiring by TTL."""
+    monkeypatch.setattr(operator_metrics, "WATCHDOG_AVAILABLE", False)
+    loader = EvaluationMetricsLoader(str(eval_dir), ttl=0)
+
+    assert loader.start_watching() is False
+    loader.get_latest_metrics()
+    assert loader._fresh_views() is None
+
+
+def test_history_served_from_index_newest_first(eval_dir, monkeypatch):
+    """History is ordered by mtime and reuses one directory scan within the TTL."""
+    loader = EvaluationMetricsLoader(str(eval_dir), ttl=60)
+    write_metrics(eval_dir, "fairness_metrics", "20251109_0900", {"overall_fairness_assessment": "FAIL"})
+    write_metrics(eval_dir, "fairness_metrics", "20251108_0900", {"overall_fairness_assessment": "CONCERN"})
+
+    scans = []
+    real_scandir = os.scandir
+    monkeypatch.setattr(operator_metrics.os, "scandir", lambda path: scans.append(path) or real_scandir(path))
+
+    first = loader.get_metrics_history("fairness", limit=2)
+    assert [h["overall_fairness_assessment"] for h in first] == ["FAIL", "CONCERN"]
+    assert len(loader.get_metrics_history("fairness")) == 3
+    assert len(loader.get_metrics_history("coverage")) == 1
+    assert len(scans) == 1
+
+    loader.invalidate()
+    loader.get_metrics_history("fairness")
+    assert len(scans) == 2
+
+
+def test_history_reuses_index_stat_results(eval_dir, monkeypatch):
+    """Building history entries does not stat the files again."""
+    loader = EvaluationMetricsLoader(str(eval_dir))
+    loader.get_metrics_history("coverage")
+    loader._parsed.clear()
+    monkeypatch.setattr(operator_metrics.os, "stat", lambda *args, **kwargs: pytest.fail("extra stat"))
+
+    history = loader.get_metrics_history("coverage")
+
+    assert history[0]["file_timestamp"] == datetime(2025, 11, 7, 9, 0).isoformat()
+
+
+def test_missing_metric_types_are_negatively_cached(tmp_path, monkeypatch):
+    """Absent modules are remembered as None; polls within the TTL touch no files."""
+    write_metrics(tmp_path, "coverage_metrics", "20251107_0900", {"persona_assignment_rate": 1.0})
+    loader = EvaluationMetricsLoader(str(tmp_path), ttl=60)
+    assert loader.get_latest_metrics()["fairness"] is None
+
+    monkeypatch.setattr(operator_metrics.os, "scandir", lambda path: pytest.fail("rescanned"))
+    metrics = loader.get_latest_metrics()
+
+    assert metrics["fairness"] is None and metrics["coverage"] is not None
+
+    loader._on_file_event(str(tmp_path / "fairness_metrics_20251108_0900.json"))
+    assert loader._cache is None
+
+
+def test_summary_and_components_views_built_with_latest(eval_dir):
+    """Summary and components projections are cached alongside the latest metrics."""
+    loader = EvaluationMetricsLoader(str(eval_dir), ttl=60)
+    views = loader.get_latest_views()
+
+    assert views["summary"] == {
+        "overall_score": 93.8, "overall_grade": "A", "overall_status": "PASS",
+        "coverage_rate": 100.0, "explainability_score": 4.0, "performance_latency": 0.5,
+        "compliance_score": 96.0, "fairness_status": "PASS",
+        "timestamp": views["latest"]["timestamp"],
+    }
+    assert views["components"]["components"] == views["latest"]["overall"]["components"]
+    assert loader.get_latest_views() is views
+
+
+def test_cached_views_served_as_pre_encoded_bytes(client, monkeypatch):
+    """Cache hits send the bytes encoded at load time without re-serializing."""
+    first = client.get("/api/operator/metrics/summary")
+    monkeypatch.setattr(operator_metrics.orjson, "dumps", lambda *a, **k: pytest.fail("re-encoded"))
+    second = client.get("/api/operator/metrics/summary")
+
+    assert second.headers["content-type"] == "application/json"
+    assert second.content == first.content
+    assert second.json()["overall_grade"] == "A"
+
+
+def test_memoized_documents_are_never_mutated(eval_dir):
+    """File metadata is attached to response copies, not the shared parsed documents."""
+    loader = EvaluationMetricsLoader(str(eval_dir), ttl=0)
+    loader.get_latest_metrics()
+    loader.get_metrics_history("coverage")
+
+    for document in loader._parsed.values():
+        assert not {"_file_path", "_file_timestamp", "file_timestamp"} & document.keys()
+
+
+def test_overall_score_reused_while_files_unchanged(eval_dir, monkeypatch):
+    """The overall score is recomputed only when a metric file changes."""
+    loader = EvaluationMetricsLoader(str(eval_dir), ttl=0)
+    calls = []
+    real_score = loader._calculate_overall_score
+    monkeypatch.setattr(loader, "_calculate_overall_score", lambda m: calls.append(1) or real_score(m))
+
+    first = loader.get_latest_metrics()["overall"]
+    assert loader.get_latest_metrics()["overall"] is first
+    assert len(calls) == 1
+
+    write_metrics(eval_dir, "performance_metrics", "20251108_0900", {"average_latency_per_user": 2.5})
+    assert loader.get_latest_metrics()["overall"]["components"]["performance"] == 50.0
+    assert len(calls) == 2
@@ -10,6 +10,8 @@ Tests cover:
 - Authentication and authorization
 """
 
+import json
+
 import pytest
 from datetime import datetime
 from fastapi.testclient import TestClient
@@ -84,6 +86,31 @@ def test_get_persona_definitions(viewer_headers):
     assert ranks == sorted(ranks)
 
 
+def test_persona_definitions_etag_revalidation(viewer_headers):
+    """Test persona definitions carry an ETag and revalidate with 304."""
+    response = client.get(
+        "/api/operator/personas/definitions",
+        headers=viewer_headers
+    )
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+
+    revalidated = client.get(
+        "/api/operator/personas/definitions",
+        headers={**viewer_headers, "If-None-Match": etag}
+    )
+    assert revalidated.status_code == 304
+    assert revalidated.headers["etag"] == etag
+    assert revalidated.content == b""
+
+    stale = client.get(
+        "/api/operator/personas/definitions",
+        headers={**viewer_headers, "If-None-Match": '"stale"'}
+    )
+    assert stale.status_code == 200
+    assert stale.json() == response.json()
+
+
 def test_persona_definitions_requires_auth():
     """Test persona definitions endpoint requires authentication."""
     response = client.get("/api/operator/personas/definitions")
@@ -176,6 +203,59 @@ def test_persona_assignment_has_timestamp(viewer_headers):
     datetime.fromisoformat(assignment["assigned_at"].replace("Z", "+00:00"))
 
 
+def test_get_persona_assignments_cached_until_new_assignment(viewer_headers, admin_headers, monkeypatch):
+    """Test repeat reads reuse the cached payload and an override refreshes it."""
+    from spendsense.api import operator_personas
+
+    url = "/api/operator/personas/user_MASKED_000"
+    operator_personas._assignments_cache.clear()
+    builds = []
+    build = operator_personas._persona_assignments_payload
+    monkeypatch.setattr(
+        operator_personas,
+        "_persona_assignments_payload",
+        lambda session, user_id: builds.append(user_id) or build(session, user_id)
+    )
+
+    first = client.get(url, headers=viewer_headers)
+    second = client.get(url, headers=viewer_headers)
+    assert first.status_code == second.status_code == 200
+    assert second.content == first.content
+    assert len(builds) == 1
+
+    override = client.post(
+        f"{url}/override",
+        json={
+            "new_persona_id": "young_professional",
+            "justification": "Cache refresh check after a manual persona override",
+            "time_window": "30d"
+        },
+        headers=admin_headers
+    )
+    assert override.status_code == 200
+
+    third = client.get(url, headers=viewer_headers)
+    assert len(builds) == 2
+    assert third.json()["assignments"]["30d"]["assignment_id"] == override.json()["assignment_id"]
+
+
+def test_persona_assignment_change_history_is_latest_five(viewer_headers):
+    """Test the assignments view carries the 5 newest changes from history."""
+    assignments = client.get(
+        "/api/operator/personas/user_MASKED_000",
+        headers=viewer_headers
+    )
+    history = client.get(
+        "/api/operator/personas/user_MASKED_000/history?limit=50",
+        headers=viewer_headers
+    )
+
+    assert assignments.status_code == history.status_code == 200
+    recent = assignments.json()["change_history"]
+    assert len(recent) <= 5
+    assert [c["changed_at"] for c in recent] == [c["changed_at"] for c in history.json()[:5]]
+
+
 def test_get_persona_assignments_user_not_found(viewer_headers):
     """Test 404 when user doesn't exist."""
     response = client.get(
@@ -232,6 +312,50 @@ def test_get_persona_history_with_limit(viewer_headers):
     assert len(data) <= 3
 
 
+def test_get_persona_history_only_changes_newest_first(viewer_headers):
+    """Test history items are real persona changes, newest first."""
+    response = client.get(
+        "/api/operator/personas/user_MASKED_000/history?limit=50",
+        headers=viewer_headers
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+
+    for item in data:
+        assert item["previous_persona"] != item["new_persona"]
+        assert item["time_window"] in ("30d", "180d")
+
+    changed_at = [item["changed_at"] for item in data]
+    assert changed_at == sorted(changed_at, reverse=True)
+
+
+def test_get_persona_history_ndjson(viewer_headers):
+    """Test history streams as NDJSON when the client asks for it."""
+    as_json = client.get(
+        "/api/operator/personas/user_MASKED_000/history?limit=50",
+        headers=viewer_headers
+    )
+    as_ndjson = client.get(
+        "/api/operator/personas/user_MASKED_000/history?limit=50",
+        headers={**viewer_headers, "Accept": "application/x-ndjson"}
+    )
+
+    assert as_ndjson.status_code == 200
+    assert as_ndjson.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in as_ndjson.text.splitlines()]
+    assert lines == as_json.json()
+
+
+def test_get_persona_history_ndjson_user_not_found(viewer_headers):
+    """Test NDJSON history still returns 404 for unknown users."""
+    response = client.get(
+        "/api/operator/personas/nonexistent_user/history",
+        headers={**viewer_headers, "Accept": "application/x-ndjson"}
+    )
+    assert response.status_code == 404
+
+
 def test_get_persona_history_requires_auth():
     """Test history endpoint requires authentication."""
     response = client.get("/api/operator/personas/user_MASKED_000/history")
@@ -0,0 +1,114 @@
+"""
+Tests for the in-process signal/profile cache in the SpendSense API.
+"""
+
+import sqlite3
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+
+from spendsense.api import main
+from spendsense.features.subscription_detector import SubscriptionMetrics
+
+
+class CountingSubscriptionDetector:
+    """Stand-in detector that records how often it is invoked."""
+
+    calls = 0
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+
+    def detect_subscriptions(self, user_id, reference_date, window_days):
+        CountingSubscriptionDetector.calls += 1
+        return SubscriptionMetrics(
+            user_id=user_id,
+            window_days=window_days,
+            reference_date=reference_date,
+            subscription_count=2,
+            monthly_recurring_spend=25.0,
+            total_spend=500.0,
+            subscription_share=0.05,
+        )
+
+
+@pytest.fixture
+def client(monkeypatch, tmp_path):
+    """TestClient with a counting detector and an empty cache."""
+    db_file = tmp_path / "spendsense.db"
+    db_file.touch()
+    monkeypatch.setattr(main, "DB_PATH", db_file)
+    monkeypatch.setattr(main, "SubscriptionDetector", CountingSubscriptionDetector)
+    CountingSubscriptionDetector.calls = 0
+    main._signals_cache.clear()
+    yield TestClient(main.app)
+    main._signals_cache.clear()
+
+
+def test_repeat_signal_request_served_from_cache(client):
+    """Second identical request must not recompute the metrics."""
+    url = "/api/signals/user_001/subscriptions?window_days=30&reference_date=2025-11-01"
+
+    first = client.get(url)
+    second = client.get(url)
+
+    assert first.status_code == 200
+    assert second.json() == first.json()
+    assert second.json()["reference_date"] == "2025-11-01"
+    assert CountingSubscriptionDetector.calls == 1
+
+
+def test_different_window_is_a_cache_miss(client):
+    """Cache key includes the window size."""
+    client.get("/api/signals/user_001/subscriptions?window_days=30&reference_date=2025-11-01")
+    client.get("/api/signals/user_001/subscriptions?window_days=180&reference_date=2025-11-01")
+
+    assert CountingSubscriptionDetector.calls == 2
+
+
+def test_invalidate_drops_only_that_users_entries(client):
+    """Invalidation removes a user's entries and leaves other users cached."""
+    client.get("/api/signals/user_001/subscriptions?reference_date=2025-11-01")
+    client.get("/api/signals/user_002/subscriptions?reference_date=2025-11-01")
+
+    assert main._invalidate_signals_cache("user_001") == 1
+    assert ("subscriptions", "user_002", 30, date(2025, 11, 1)) in main._signals_cache
+
+    client.get("/api/signals/user_001/subscriptions?reference_date=2025-11-01")
+    assert CountingSubscriptionDetector.calls == 3
+
+
+def test_omitted_reference_date_defaults_to_today(client):
+    """Omitted reference_date resolves to today and shares the dated cache entry."""
+    client.get("/api/signals/user_001/subscriptions")
+    response = client.get(
+        f"/api/signals/user_001/subscriptions?reference_date={date.today().isoformat()}"
+    )
+
+    assert response.json()["reference_date"] == date.today().isoformat()
+    assert CountingSubscriptionDetector.calls == 1
+
+
+def test_malformed_reference_date_rejected(client):
+    """Malformed dates fail query validation before the detector runs."""
+    response = client.get("/api/signals/user_001/subscriptions?reference_date=11/01/2025")
+
+    assert response.status_code == 422
+    assert CountingSubscriptionDetector.calls == 0
+
+
+def test_database_error_returns_503_and_clears_ready_flag(client, monkeypatch):
+    """A database failure mid-request maps to 503 and forces a fresh availability check."""
+
+    class MissingTableDetector(CountingSubscriptionDetector):
+        def detect_subscriptions(self, user_id, reference_date, window_days):
+            raise sqlite3.OperationalError("no such table: transactions")
+
+    monkeypatch.setattr(main, "SubscriptionDetector", MissingTableDetector)
+    main.app.state.db_ready = True
+
+    response = client.get("/api/signals/user_001/subscriptions?window_days=30&reference_date=2025-11-01")
+
+    assert response.status_code == 503
+    assert main.app.state.db_ready is False
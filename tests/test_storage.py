@@ -133,6 +133,16 @@ def test_save_creates_latest_file(storage, sample_recommendation_set):
     assert latest_file.exists()
 
 
+def test_latest_file_matches_timestamped_file(storage, sample_recommendation_set):
+    """Test 'latest' file is byte-identical to the timestamped file."""
+    file_path = storage.save_recommendation_set(sample_recommendation_set)
+
+    user_dir = storage.storage_path / sample_recommendation_set.user_id
+    latest_file = user_dir / "latest_30d.json"
+
+    assert latest_file.read_bytes() == Path(file_path).read_bytes()
+
+
 def test_saved_file_contains_correct_data(storage, sample_recommendation_set):
     """Test saved file contains correct JSON data."""
     file_path = storage.save_recommendation_set(sample_recommendation_set)
@@ -212,6 +222,31 @@ def test_get_latest_returns_correct_time_window(storage, sample_recommendation_s
     assert retrieved_180d["time_window"] == "180d"
 
 
+# Content Hash Tests
+
+
+def test_get_by_hash_returns_matching_set(storage, sample_recommendation_set):
+    """Test get_by_hash returns the latest set when its content hash matches."""
+    sample_recommendation_set.metadata["content_hash"] = "abc123"
+    storage.save_recommendation_set(sample_recommendation_set)
+
+    retrieved = storage.get_by_hash("test_user_123", "abc123", "30d")
+
+    assert retrieved is not None
+    assert retrieved["metadata"]["content_hash"] == "abc123"
+    assert storage.get_by_hash("test_user_123", "abc123") is not None
+
+
+def test_get_by_hash_returns_none_on_mismatch(storage, sample_recommendation_set):
+    """Test get_by_hash returns None for a different hash, window or user."""
+    sample_recommendation_set.metadata["content_hash"] = "abc123"
+    storage.save_recommendation_set(sample_recommendation_set)
+
+    assert storage.get_by_hash("test_user_123", "other_hash", "30d") is None
+    assert storage.get_by_hash("test_user_123", "abc123", "180d") is None
+    assert storage.get_by_hash("nonexistent_user", "abc123") is None
+
+
 def test_get_all_by_user(storage, sample_recommendation_set):
     """Test retrieving all recommendation sets for a user (PRD AC6)."""
     import time
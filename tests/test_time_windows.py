@@ -9,6 +9,7 @@ import pandas as pd
 
 from spendsense.features.time_windows import (
     TimeWindowCalculator,
+    PreloadedTimeWindowCalculator,
     TimeWindowResult,
     get_default_fallback_values
 )
@@ -283,6 +284,54 @@ class TestTimeWindowCalculator:
                 assert col in result.data.columns
 
 
+class TestPreloadedTimeWindowCalculator:
+    """Tests for PreloadedTimeWindowCalculator (shared single read per user)."""
+
+    @pytest.mark.parametrize("window_days", [30, 180])
+    def test_transactions_match_database_query(self, calculator, window_days):
+        """Preloaded window results match the database-backed calculator."""
+        reference_date = date(2025, 11, 4)
+        preloaded = PreloadedTimeWindowCalculator(calculator, "user_MASKED_000", reference_date)
+
+        expected = calculator.get_transactions_in_window("user_MASKED_000", reference_date, window_days)
+        result = preloaded.get_transactions_in_window("user_MASKED_000", reference_date, window_days)
+
+        pd.testing.assert_frame_equal(
+            result.data.sort_values('transaction_id').reset_index(drop=True),
+            expected.data.sort_values('transaction_id').reset_index(drop=True)
+        )
+        assert result.is_complete == expected.is_complete
+        assert result.window_start == expected.window_start
+
+    def test_snapshots_match_database_query(self, calculator):
+        """Preloaded account and liability snapshots match the database."""
+        reference_date = date(2025, 11, 4)
+        preloaded = PreloadedTimeWindowCalculator(calculator, "user_MASKED_000", reference_date)
+
+        assert preloaded.get_accounts_snapshot("user_MASKED_000", reference_date).data == \
+            calculator.get_accounts_snapshot("user_MASKED_000", reference_date).data
+        assert preloaded.get_liabilities_snapshot("user_MASKED_000", reference_date).data == \
+            calculator.get_liabilities_snapshot("user_MASKED_000", reference_date).data
+
+    def test_other_user_falls_through_to_database(self, calculator):
+        """Queries outside the preloaded user hit the database."""
+        reference_date = date(2025, 11, 4)
+        preloaded = PreloadedTimeWindowCalculator(calculator, "user_MASKED_000", reference_date)
+
+        expected = calculator.get_transactions_in_window("user_MASKED_001", reference_date, 30)
+        result = preloaded.get_transactions_in_window("user_MASKED_001", reference_date, 30)
+
+        assert result.record_count == expected.record_count
+
+    def test_validation_preserved(self, calculator):
+        """Invalid windows still raise ValueError."""
+        reference_date = date(2025, 11, 4)
+        preloaded = PreloadedTimeWindowCalculator(calculator, "user_MASKED_000", reference_date)
+
+        with pytest.raises(ValueError):
+            preloaded.get_transactions_in_window("user_MASKED_000", reference_date, 60)
+
+
 class TestDefaultFallbackValues:
     """Tests for default fallback values."""
 